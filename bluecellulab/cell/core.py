@@ -19,8 +19,10 @@ import json
 from pathlib import Path
 import queue
 from typing import Any, Optional
+import warnings
 
 import numpy as np
+import pandas as pd
 
 import bluecellulab
 from bluecellulab import lazy_printv, neuron, psection, tools
@@ -30,6 +32,7 @@ from bluecellulab.cell.section_distance import EuclideanSectionDistance
 from bluecellulab.cell.sonata_proxy import SonataProxy
 from bluecellulab.cell.serialized_sections import SerializedSections
 from bluecellulab.cell.template import NeuronTemplate
+from bluecellulab.cell.topology import CellTopology, SECTION_TYPES
 from bluecellulab.circuit.config.sections import Conditions
 from bluecellulab.circuit import EmodelProperties, SynapseProperty
 from bluecellulab.exceptions import BluecellulabError
@@ -89,12 +92,19 @@ class Cell(InjectableMixin, PlottableMixin):
         self.rng_settings = rng_settings
 
         self.recordings: dict[str, NeuronType] = {}
+        # output of the StreamingRecorder of each streamed recording
+        self.streamed_recordings: dict[str, Path] = {}
         self.synapses: dict[int, Synapse] = {}
         self.connections: dict[int, bluecellulab.Connection] = {}
 
         self.ips: dict[int, NeuronType] = {}
         self.syn_mini_netcons: dict[int, NeuronType] = {}
-        self.serialized = None
+        self.serialized: Optional[SerializedSections] = None
+        self._topology: Optional[CellTopology] = None
+        self._section_arc3d_cache: dict[int, tuple[int, bool, np.ndarray]] = {}
+        self._section_distance: Optional[EuclideanSectionDistance] = None
+        self._segment_areas: Optional[np.ndarray] = None
+        self._segment_table: Optional[pd.DataFrame] = None
 
         # Be careful when removing this,
         # time recording needs this push
@@ -145,22 +155,70 @@ class Cell(InjectableMixin, PlottableMixin):
         """Connect this cell to a circuit via sonata proxy."""
         self.sonata_proxy = sonata_proxy
 
-    def init_psections(self):
-        """Initialize the psections list.
+    @property
+    def topology(self) -> CellTopology:
+        """Array-backed topology of the sections of the cell, built once."""
+        if self._topology is None:
+            self._topology = CellTopology.from_sections(self.all)
+        return self._topology
 
-        This list contains the Python representation of the psections of
-        this morphology.
+    @property
+    def section_distance(self) -> EuclideanSectionDistance:
+        """Euclidean distance between locations on the sections of the cell.
+
+        The node coordinates of the sections are cached by this object,
+        e.g. cell.section_distance.pairwise_distances(locations_a,
+        locations_b) reads each section from NEURON once.
         """
-        for hsection in self.all:
-            secname = neuron.h.secname(sec=hsection)
-            self.secname_to_hsection[secname] = hsection
-            self.secname_to_psection[secname] = psection.PSection(hsection)
+        if self._section_distance is None:
+            self._section_distance = EuclideanSectionDistance()
+        return self._section_distance
 
+    @property
+    def serialized_sections(self) -> SerializedSections:
+        """Sections of the cell indexed by section id, built once."""
         # section are not serialized yet, do it now
         if self.serialized is None:
             self.serialized = SerializedSections(self.cell.getCell())
+        return self.serialized
 
-        for isec in self.serialized.isec2sec:
+    def clear_geometry_cache(self) -> None:
+        """Forget the cached geometry of the cell, e.g. after a morphology
+        change.
+
+        The topology, serialized sections, 3D points, node coordinates,
+        segment areas and segment table are read again from NEURON when
+        next used.
+        """
+        self._topology = None
+        self.serialized = None
+        self._section_arc3d_cache.clear()
+        if self._section_distance is not None:
+            self._section_distance.clear_cache()
+        self._segment_areas = None
+        self._segment_table = None
+
+    def init_psections(self):
+        """Initialize the psections list.
+
+        This list contains the Python representation of the psections of
+        this morphology. The psections are only needed for drawing, they
+        are created once from the topology of the cell.
+        """
+        if self.secname_to_psection:
+            return
+
+        topology = self.topology
+        psections = []
+        for index, (secname, hsection) in enumerate(
+                zip(topology.names, topology.sections)):
+            self.secname_to_hsection[secname] = hsection
+            psec = psection.PSection(
+                hsection, section_type=topology.section_type(index))
+            self.secname_to_psection[secname] = psec
+            psections.append(psec)
+
+        for isec in self.serialized_sections.isec2sec:
             hsection = self.get_hsection(isec)
             if hsection:
                 secname = neuron.h.secname(sec=hsection)
@@ -169,18 +227,12 @@ class Cell(InjectableMixin, PlottableMixin):
                 self.secname_to_isec[secname] = isec
 
         # Set the parents and children of all the psections
-        for psec in self.psections.values():
-            hparent = psec.hparent
-            if hparent:
-                parentname = neuron.h.secname(sec=hparent)
-                psec.pparent = self.get_psection(secname=parentname)
-            else:
-                psec.pparent = None
-
-            for hchild in psec.hchildren:
-                childname = neuron.h.secname(sec=hchild)
-                pchild = self.get_psection(secname=childname)
-                psec.add_pchild(pchild)
+        for index, psec in enumerate(psections):
+            parent = topology.parents[index]
+            psec.pparent = psections[parent] if parent >= 0 else None
+            for child in topology.children(index):
+                psec.add_pchild(psections[child])
+            psec.pchildren_populated = True
 
     def get_section_id(self, secname=None):
         """Get section based on section id.
@@ -253,20 +305,12 @@ class Cell(InjectableMixin, PlottableMixin):
                    The requested hoc section
         """
 
-        # section are not serialized yet, do it now
-        if self.serialized is None:
-            self.serialized = SerializedSections(self.cell.getCell())
-
         try:
-            sec_ref = self.serialized.isec2sec[int(section_id)]
+            return self.serialized_sections.get(int(section_id))
         except IndexError as e:
             raise IndexError(
                 "bluecellulab get_hsection: section-id %s not found in %s" %
                 (section_id, self.morphology_path)) from e
-        if sec_ref is not None:
-            return self.serialized.isec2sec[int(section_id)].sec
-        else:
-            return None
 
     def make_passive(self):
         """Make the cell passive by deactivating all the active channels."""
@@ -314,6 +358,55 @@ class Cell(InjectableMixin, PlottableMixin):
                 section.insert('TTXDynamicsSwitch')
             section.ttxo_level_TTXDynamicsSwitch = 1e-14
 
+    @property
+    def segment_table(self) -> pd.DataFrame:
+        """Geometry of all the segments of the cell, built once.
+
+        One row per segment, in the order of the sections of the
+        topology, with the columns section_index (position of the
+        section in the topology, i.e. in cell.all), isec (section id of
+        the serialized sections, -1 for the sections without id), x,
+        area (um2), diam (um), distance_to_soma (um, path distance from
+        the middle of the soma) and ri (MOhm, axial resistance to the
+        parent node).
+
+        The table is not updated if the geometry of the cell changes,
+        see clear_geometry_cache.
+        """
+        if self._segment_table is None:
+            topology = self.topology
+            n_segments = topology.n_segments
+            section_index = np.repeat(np.arange(len(topology)), topology.nseg)
+            name_to_isec = {
+                neuron.h.secname(sec=section): isec
+                for isec, section in enumerate(self.serialized_sections.sections)
+                if section is not None}
+            isecs = np.array([name_to_isec.get(name, -1) for name in topology.names],
+                             dtype=np.int64)
+            xs = np.empty(n_segments)
+            diams = np.empty(n_segments)
+            distances = np.empty(n_segments)
+            ris = np.empty(n_segments)
+            soma_center = self.soma(0.5)
+            index = 0
+            for section in topology.sections:
+                for segment in section:
+                    xs[index] = segment.x
+                    diams[index] = segment.diam
+                    distances[index] = neuron.h.distance(soma_center, segment)
+                    ris[index] = segment.ri()
+                    index += 1
+            self._segment_table = pd.DataFrame({
+                "section_index": section_index,
+                "isec": np.repeat(isecs, topology.nseg),
+                "x": xs,
+                "area": self.segment_areas(),
+                "diam": diams,
+                "distance_to_soma": distances,
+                "ri": ris,
+            })
+        return self._segment_table
+
     def area(self):
         """Calculate the total area of the cell.
 
@@ -326,16 +419,30 @@ class Cell(InjectableMixin, PlottableMixin):
         area : float
                Total surface area of the cell
         """
-        # pylint: disable=C0103
-        area = 0
-        for section in self.all:
-            x_s = np.arange(1.0 / (2 * section.nseg), 1.0,
-                            1.0 / (section.nseg))
-            for x in x_s:
-                area += bluecellulab.neuron.h.area(x, sec=section)
-            # for segment in section:
-            #    area += bluecellulab.neuron.h.area(segment.x, sec=section)
-        return area
+        return float(self.segment_areas().sum())
+
+    def segment_areas(self) -> np.ndarray:
+        """Area of each segment in the order of the segment table, read from
+        NEURON once without building the whole table."""
+        if self._segment_areas is None:
+            self._segment_areas = np.array(
+                [segment.area() for section in self.topology.sections
+                 for segment in section], dtype=np.float64)
+        return self._segment_areas
+
+    def section_areas(self) -> np.ndarray:
+        """Area of each section of the topology of the cell."""
+        topology = self.topology
+        section_index = np.repeat(np.arange(len(topology)), topology.nseg)
+        return np.bincount(section_index, weights=self.segment_areas(),
+                           minlength=len(topology))
+
+    def area_by_type(self) -> dict[str, float]:
+        """Total area of each section type, e.g. 'apical'."""
+        section_areas = self.section_areas()
+        types = self.topology.section_types
+        return {section_type: float(section_areas[types == code].sum())
+                for code, section_type in enumerate(SECTION_TYPES)}
 
     def synlocation_to_segx(self, isec, ipt, syn_offset) -> float:
         """Translate a synaptic (secid, ipt, offset) to a x coordinate.
@@ -355,40 +462,77 @@ class Cell(InjectableMixin, PlottableMixin):
             The x coordinate on section with secid, where the synapse
             can be placed
         """
-        if syn_offset < 0.0:
-            syn_offset = 0.0
+        return float(self.synlocations_to_segx([isec], [ipt], [syn_offset])[0])
 
-        curr_sec = self.get_hsection(isec)
-        if curr_sec is None:
-            raise Exception(
-                "No section found at isec=%d in gid %d" %
-                (isec, self.gid))
-        length = curr_sec.L
-
-        # access section to compute the distance
-        if neuron.h.section_orientation(sec=self.get_hsection(isec)) == 1:
-            ipt = neuron.h.n3d(sec=self.get_hsection(isec)) - 1 - ipt
-            syn_offset = -syn_offset
-
-        distance = 0.5
-        if ipt < neuron.h.n3d(sec=self.get_hsection(isec)):
-            distance = (neuron.h.arc3d(ipt, sec=self.get_hsection(isec)) +
-                        syn_offset) / length
-            if distance == 0.0:
-                distance = 0.0000001
-            if distance >= 1.0:
-                distance = 0.9999999
-
-        if neuron.h.section_orientation(sec=self.get_hsection(isec)) == 1:
-            distance = 1 - distance
-
-        if distance < 0:
+    def _section_arc3d(self, isec: int) -> tuple[int, bool, np.ndarray]:
+        """Topology index, orientation and 3D point arc lengths of a section.
+
+        They are read from NEURON once per section and cached.
+        """
+        if isec not in self._section_arc3d_cache:
+            curr_sec = self.get_hsection(isec)
+            if curr_sec is None:
+                raise Exception(
+                    "No section found at isec=%d in gid %d" %
+                    (isec, self.gid))
+            n3d = int(neuron.h.n3d(sec=curr_sec))
+            arc3d = np.array([neuron.h.arc3d(ipt, sec=curr_sec) for ipt in range(n3d)],
+                             dtype=np.float64)
+            reversed_section = neuron.h.section_orientation(sec=curr_sec) == 1
+            index = self.topology.index(neuron.h.secname(sec=curr_sec))
+            self._section_arc3d_cache[isec] = (index, reversed_section, arc3d)
+        return self._section_arc3d_cache[isec]
+
+    def synlocations_to_segx(self, isecs, ipts, syn_offsets) -> np.ndarray:
+        """Translate synaptic (secid, ipt, offset) arrays to x coordinates.
+
+        Vectorized version of synlocation_to_segx, the 3D points of each
+        section are read from NEURON once.
+
+        Args:
+            isecs: section ids.
+            ipts: 3D point indices of the synapses on their section.
+            syn_offsets: offsets of the synapses from their 3D point.
+
+        Returns:
+            The x coordinates on the sections where the synapses can be placed.
+        """
+        isecs = np.asarray(isecs, dtype=np.int64)
+        ipts = np.asarray(ipts, dtype=np.float64)
+        syn_offsets = np.maximum(np.asarray(syn_offsets, dtype=np.float64), 0.0)
+        if len(isecs) == 0:
+            return np.empty(0, dtype=np.float64)
+
+        unique_isecs, inverse = np.unique(isecs, return_inverse=True)
+        geometries = [self._section_arc3d(int(isec)) for isec in unique_isecs]
+        indices = np.array([index for index, _, _ in geometries])
+        lengths = self.topology.lengths[indices][inverse]
+        reversed_sections = np.array([rev for _, rev, _ in geometries])[inverse]
+        n3ds = np.array([len(arc3d) for _, _, arc3d in geometries])
+        starts = np.concatenate(([0], np.cumsum(n3ds)[:-1]))[inverse]
+        n3ds = n3ds[inverse]
+        arcs = np.concatenate([arc3d for _, _, arc3d in geometries])
+
+        ipts = np.where(reversed_sections, n3ds - 1 - ipts, ipts)
+        syn_offsets = np.where(reversed_sections, -syn_offsets, syn_offsets)
+
+        distances = np.full(len(isecs), 0.5)
+        on_points = (ipts >= 0) & (ipts < n3ds)
+        point_index = starts[on_points] + ipts[on_points].astype(np.int64)
+        on_distances = (arcs[point_index] + syn_offsets[on_points]) / lengths[on_points]
+        on_distances[on_distances == 0.0] = 0.0000001
+        on_distances[on_distances >= 1.0] = 0.9999999
+        distances[on_points] = on_distances
+
+        distances = np.where(reversed_sections, 1 - distances, distances)
+
+        for idx in np.flatnonzero(distances < 0):
             lazy_printv("WARNING: synlocation_to_segx found negative distance \
                         at curr_sec({cs}) syn_offset: {so}", 1,
-                        cs=neuron.h.secname(sec=curr_sec), so=syn_offset)
-            return 0
-        else:
-            return distance
+                        cs=neuron.h.secname(sec=self.get_hsection(isecs[idx])),
+                        so=syn_offsets[idx])
+        distances[distances < 0] = 0.0
+        return distances
 
     # pylint: disable=C0103
     def add_recording(self, var_name, dt=None):
@@ -451,7 +595,7 @@ class Cell(InjectableMixin, PlottableMixin):
         var_name = f"neuron.h.{section.name()}({segx})._ref_v"
         self.add_recording(var_name, dt)
 
-    def get_voltage_recording(self, section, segx: float) -> np.ndarray:
+    def get_voltage_recording(self, section, segx: float, copy: bool = True) -> np.ndarray:
         """Get a voltage recording for a certain section(segx)
 
         Parameters
@@ -460,11 +604,13 @@ class Cell(InjectableMixin, PlottableMixin):
                   Section to record from (Neuron section pointer)
         segx :
                Segment x coordinate
+        copy :
+               If False, return a view on the recording (see get_recording)
         """
 
         recording_name = f"neuron.h.{section.name()}({segx})._ref_v"
         if recording_name in self.recordings:
-            return self.get_recording(recording_name)
+            return self.get_recording(recording_name, copy=copy)
         else:
             raise BluecellulabError('get_voltage_recording: Voltage recording %s'
                                     ' was not added previously using '
@@ -476,24 +622,44 @@ class Cell(InjectableMixin, PlottableMixin):
         for section in all_sections:
             self.add_voltage_recording(section, segx=0.5, dt=self.record_dt)
 
-    def get_allsections_voltagerecordings(self) -> dict[str, np.ndarray]:
-        """Get all the voltage recordings from all the sections."""
+    def get_allsections_voltagerecordings(self, copy: bool = True) -> dict[str, np.ndarray]:
+        """Get all the voltage recordings from all the sections.
+
+        If copy is False, the recordings are views (see get_recording).
+        """
         all_section_voltages = {}
         all_sections = self.cell.getCell().all
         for section in all_sections:
-            recording = self.get_voltage_recording(section, segx=0.5)
+            recording = self.get_voltage_recording(section, segx=0.5, copy=copy)
             all_section_voltages[section.name()] = recording
         return all_section_voltages
 
-    def get_recording(self, var_name: str) -> np.ndarray:
-        """Get recorded values."""
-        return np.array(self.recordings[var_name].to_python())
+    def get_recording(self, var_name: str, copy: bool = True) -> np.ndarray:
+        """Get recorded values.
+
+        Args:
+            var_name: name of the recording.
+            copy: if False, return a read-only view on the memory of the
+                NEURON Vector instead of a copy. The view is only valid until
+                the Vector is resized, e.g. by running the simulation again,
+                or deleted.
+        """
+        self._warn_if_streamed(var_name)
+        recording = self.recordings[var_name].as_numpy()
+        if copy:
+            return recording.copy()
+        recording = recording.view()
+        recording.flags.writeable = False
+        return recording
 
     def add_replay_synapse(self, synapse_id, syn_description, connection_modifiers,
                            condition_parameters=None, base_seed=None,
-                           popids=(0, 0), extracellular_calcium=None):
+                           popids=(0, 0), extracellular_calcium=None, location=None):
         """Add synapse based on the syn_description to the cell.
 
+        The location on the section can be passed when it is already
+        computed, e.g. by synapse_locations.
+
         This operation can fail.  Returns True on success, otherwise
         False.
         """
@@ -501,15 +667,16 @@ class Cell(InjectableMixin, PlottableMixin):
             condition_parameters = Conditions.init_empty()
         isec = syn_description[SynapseProperty.POST_SECTION_ID]
 
-        # old circuits don't have it, it needs to be computed via synlocation_to_segx
-        if ("afferent_section_pos" in syn_description and
-                not np.isnan(syn_description["afferent_section_pos"])):
-            # position is pre computed in SONATA
-            location = syn_description["afferent_section_pos"]
-        else:
-            ipt = syn_description[SynapseProperty.POST_SEGMENT_ID]
-            syn_offset = syn_description[SynapseProperty.POST_SEGMENT_OFFSET]
-            location = self.synlocation_to_segx(isec, ipt, syn_offset)
+        if location is None:
+            # old circuits don't have it, it needs to be computed via synlocation_to_segx
+            if ("afferent_section_pos" in syn_description and
+                    not np.isnan(syn_description["afferent_section_pos"])):
+                # position is pre computed in SONATA
+                location = syn_description["afferent_section_pos"]
+            else:
+                ipt = syn_description[SynapseProperty.POST_SEGMENT_ID]
+                syn_offset = syn_description[SynapseProperty.POST_SEGMENT_OFFSET]
+                location = self.synlocation_to_segx(isec, ipt, syn_offset)
 
         if location is None:
             lazy_printv('WARNING: add_single_synapse: skipping a synapse at \
@@ -535,6 +702,25 @@ class Cell(InjectableMixin, PlottableMixin):
 
         return True
 
+    def synapse_locations(self, syn_descriptions: pd.DataFrame) -> np.ndarray:
+        """Locations on their sections of the synapses in syn_descriptions.
+
+        The precomputed SONATA afferent_section_pos is used where
+        available, the other locations are computed at once via
+        synlocations_to_segx.
+        """
+        if "afferent_section_pos" in syn_descriptions:
+            locations = syn_descriptions["afferent_section_pos"].to_numpy(dtype=float, copy=True)
+        else:
+            locations = np.full(len(syn_descriptions), np.nan)
+        missing = np.flatnonzero(np.isnan(locations))
+        if len(missing) != 0:
+            isecs = syn_descriptions[SynapseProperty.POST_SECTION_ID].to_numpy()[missing]
+            ipts = syn_descriptions[SynapseProperty.POST_SEGMENT_ID].to_numpy()[missing]
+            offsets = syn_descriptions[SynapseProperty.POST_SEGMENT_OFFSET].to_numpy()[missing]
+            locations[missing] = self.synlocations_to_segx(isecs, ipts, offsets)
+        return locations
+
     def add_replay_delayed_weight(self, sid, delay, weight):
         """Add a synaptic weight for sid that will be set with a time delay.
 
@@ -633,8 +819,18 @@ class Cell(InjectableMixin, PlottableMixin):
 
         Returns: recorded spikes
         """
-        result = self.recordings[f"spike_detector_{location}_{threshold}"]
-        return result.to_python()
+        recording_name = f"spike_detector_{location}_{threshold}"
+        self._warn_if_streamed(recording_name)
+        return self.recordings[recording_name].to_python()
+
+    def _warn_if_streamed(self, var_name: str) -> None:
+        """Warn that a streamed recording only holds the last values."""
+        if var_name in self.streamed_recordings:
+            warnings.warn(
+                f"The recording {var_name} is streamed to "
+                f"{self.streamed_recordings[var_name]}, the cell only holds "
+                "the values recorded since the last flush. Use "
+                "StreamingRecorder.load to read the complete recording.")
 
     def add_replay_minis(self, syn_id, syn_description, connection_parameters,
                          base_seed=None, popids=(0, 0), mini_frequencies=None):
@@ -910,13 +1106,14 @@ class Cell(InjectableMixin, PlottableMixin):
                         maxdiam = child.diam
             return apicaltrunk
 
-    def get_time(self) -> np.ndarray:
-        """Get the time vector."""
-        return self.get_recording('neuron.h._ref_t')
+    def get_time(self, copy: bool = True) -> np.ndarray:
+        """Get the time vector, a view if copy is False (see get_recording)."""
+        return self.get_recording('neuron.h._ref_t', copy=copy)
 
-    def get_soma_voltage(self) -> np.ndarray:
-        """Get a vector of the soma voltage."""
-        return self.get_recording('self.soma(0.5)._ref_v')
+    def get_soma_voltage(self, copy: bool = True) -> np.ndarray:
+        """Get a vector of the soma voltage, a view if copy is False (see
+        get_recording)."""
+        return self.get_recording('self.soma(0.5)._ref_v', copy=copy)
 
     def get_ais_voltage(self) -> np.ndarray:
         """Get a vector of AIS voltage."""
@@ -24,6 +24,7 @@ from bluecellulab.cell.stimuli_generator import (
     gen_ornstein_uhlenbeck,
     gen_shotnoise_signal,
     get_relative_shotnoise_params,
+    waveform_cache,
 )
 from bluecellulab.exceptions import BluecellulabError
 from bluecellulab.stimuli import (
@@ -221,38 +222,73 @@ class InjectableMixin:
 
         return tstim
 
+    def _get_ornstein_uhlenbeck_seeds(self, stim_count, seed):
+        """Return the Random123 seeds of an ornstein_uhlenbeck simulation."""
+        if self.rng_settings.mode != "Random123":
+            raise BluecellulabError("Shot noise stimulus requires Random123")
+        seed1 = stim_count + 2997  # stimulus block
+        seed2 = self.rng_settings.stimulus_seed + 291204  # stimulus type
+        seed3 = self.gid + 123 if seed is None else seed  # GID
+        return seed1, seed2, seed3
+
     def _get_ornstein_uhlenbeck_rand(self, stim_count, seed):
         """Return rng for ornstein_uhlenbeck simulation."""
-        if self.rng_settings.mode == "Random123":
-            seed1 = stim_count + 2997  # stimulus block
-            seed2 = self.rng_settings.stimulus_seed + 291204  # stimulus type
-            seed3 = self.gid + 123 if seed is None else seed  # GID
-            lazy_printv("Using ornstein_uhlenbeck process seeds %d %d %d" %
-                        (seed1, seed2, seed3), 50)
-            rng = bluecellulab.neuron.h.Random()
-            rng.Random123(seed1, seed2, seed3)
-        else:
-            raise BluecellulabError("Shot noise stimulus requires Random123")
+        seed1, seed2, seed3 = self._get_ornstein_uhlenbeck_seeds(stim_count, seed)
+        lazy_printv("Using ornstein_uhlenbeck process seeds %d %d %d" %
+                    (seed1, seed2, seed3), 50)
+        rng = bluecellulab.neuron.h.Random()
+        rng.Random123(seed1, seed2, seed3)
 
         self.persistent.append(rng)
         return rng
 
+    def _get_shotnoise_step_seeds(self, shotnoise_stim_count, seed=None):
+        """Return the Random123 seeds of a shot noise step stimulus."""
+        if self.rng_settings.mode != "Random123":
+            raise BluecellulabError("Shot noise stimulus requires Random123")
+        seed1 = shotnoise_stim_count + 2997
+        seed2 = self.rng_settings.stimulus_seed + 19216
+        seed3 = self.gid + 123 if seed is None else seed
+        return seed1, seed2, seed3
+
     def _get_shotnoise_step_rand(self, shotnoise_stim_count, seed=None):
         """Return rng for shot noise step stimulus."""
-        if self.rng_settings.mode == "Random123":
-            seed1 = shotnoise_stim_count + 2997
-            seed2 = self.rng_settings.stimulus_seed + 19216
-            seed3 = self.gid + 123 if seed is None else seed
-            lazy_printv("Using shot noise seeds %d %d %d" %
-                        (seed1, seed2, seed3), 50)
-            rng = bluecellulab.neuron.h.Random()
-            rng.Random123(seed1, seed2, seed3)
-        else:
-            raise BluecellulabError("Shot noise stimulus requires Random123")
+        seed1, seed2, seed3 = self._get_shotnoise_step_seeds(shotnoise_stim_count, seed)
+        lazy_printv("Using shot noise seeds %d %d %d" %
+                    (seed1, seed2, seed3), 50)
+        rng = bluecellulab.neuron.h.Random()
+        rng.Random123(seed1, seed2, seed3)
 
         self.persistent.append(rng)
         return rng
 
+    def _gen_shotnoise_signal(self, tau_D, tau_R, rate, amp_mean, amp_var,
+                              duration, dt, shotnoise_stim_count, seed):
+        """Generate a shot noise signal, reusing the cached waveform of
+        identical parameters and seeds."""
+        seeds = self._get_shotnoise_step_seeds(shotnoise_stim_count, seed)
+        key = ("shotnoise", (tau_D, tau_R, rate, amp_mean, amp_var), seeds, dt, duration)
+
+        def generate():
+            rng = self._get_shotnoise_step_rand(shotnoise_stim_count, seed)
+            return gen_shotnoise_signal(tau_D, tau_R, rate, amp_mean, amp_var,
+                                        duration, dt, rng=rng)
+
+        return waveform_cache.get_or_generate(key, generate)
+
+    def _gen_ornstein_uhlenbeck(self, tau, sigma, mean, duration, dt,
+                                stim_count, seed):
+        """Generate an Ornstein-Uhlenbeck signal, reusing the cached waveform
+        of identical parameters and seeds."""
+        seeds = self._get_ornstein_uhlenbeck_seeds(stim_count, seed)
+        key = ("ornstein_uhlenbeck", (tau, sigma, mean), seeds, dt, duration)
+
+        def generate():
+            rng = self._get_ornstein_uhlenbeck_rand(stim_count, seed)
+            return gen_ornstein_uhlenbeck(tau, sigma, mean, duration, dt, rng)
+
+        return waveform_cache.get_or_generate(key, generate)
+
     def inject_current_clamp_signal(self, section, segx, tvec, svec):
         """Inject any signal via current clamp."""
         cs = bluecellulab.neuron.h.IClamp(segx, sec=section)
@@ -294,9 +330,10 @@ class InjectableMixin:
             stimulus: ShotNoise,
             shotnoise_stim_count=0):
         """Add a replay shot noise stimulus."""
-        rng = self._get_shotnoise_step_rand(shotnoise_stim_count, stimulus.seed)
-        tvec, svec = gen_shotnoise_signal(stimulus.decay_time, stimulus.rise_time, stimulus.rate, stimulus.amp_mean,
-                                          stimulus.amp_var, stimulus.duration, stimulus.dt, rng=rng)
+        tvec, svec = self._gen_shotnoise_signal(
+            stimulus.decay_time, stimulus.rise_time, stimulus.rate, stimulus.amp_mean,
+            stimulus.amp_var, stimulus.duration, stimulus.dt, shotnoise_stim_count,
+            stimulus.seed)
         tvec.add(stimulus.delay)  # add delay
 
         if stimulus.mode == ClampMode.CONDUCTANCE:
@@ -323,9 +360,9 @@ class InjectableMixin:
         rate, amp_mean, amp_var = get_relative_shotnoise_params(
             mean, var, stimulus.decay_time, stimulus.rise_time, cv_square)
 
-        rng = self._get_shotnoise_step_rand(shotnoise_stim_count, stimulus.seed)
-        tvec, svec = gen_shotnoise_signal(stimulus.decay_time, stimulus.rise_time, rate, amp_mean,
-                                          amp_var, stimulus.duration, stimulus.dt, rng=rng)
+        tvec, svec = self._gen_shotnoise_signal(
+            stimulus.decay_time, stimulus.rise_time, rate, amp_mean, amp_var,
+            stimulus.duration, stimulus.dt, shotnoise_stim_count, stimulus.seed)
         tvec.add(stimulus.delay)  # add delay
 
         if stim_mode == ClampMode.CONDUCTANCE:
@@ -338,14 +375,14 @@ class InjectableMixin:
     ):
         """Add an Ornstein-Uhlenbeck process, injected as current or
         conductance."""
-        rng = self._get_ornstein_uhlenbeck_rand(stim_count, stimulus.seed)
-        tvec, svec = gen_ornstein_uhlenbeck(
+        tvec, svec = self._gen_ornstein_uhlenbeck(
             stimulus.tau,
             stimulus.sigma,
             stimulus.mean,
             stimulus.duration,
             stimulus.dt,
-            rng,
+            stim_count,
+            stimulus.seed,
         )
 
         tvec.add(stimulus.delay)  # add delay
@@ -374,9 +411,9 @@ class InjectableMixin:
         if mean < 0 and abs(mean) > 2 * sigma:
             warnings.warn("relative ornstein uhlenbeck signal is mostly zero.")
 
-        rng = self._get_ornstein_uhlenbeck_rand(stim_count, stimulus.seed)
-        tvec, svec = gen_ornstein_uhlenbeck(
-            stimulus.tau, sigma, mean, stimulus.duration, stimulus.dt, rng
+        tvec, svec = self._gen_ornstein_uhlenbeck(
+            stimulus.tau, sigma, mean, stimulus.duration, stimulus.dt,
+            stim_count, stimulus.seed
         )
 
         tvec.add(stimulus.delay)  # add delay
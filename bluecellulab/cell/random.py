@@ -16,17 +16,27 @@
 from math import log, sqrt
 from typing import Any
 
+import numpy as np
+
 from bluecellulab import neuron
 
 NEURON_RNG = Any
 
+# decisions closer than this to a boundary are computed with the C log
+_BOUNDARY_TOLERANCE = 1e-9
+
 
 # Gamma-distributed sample generator (not available in NEURON)
 def gamma(rng: NEURON_RNG, a: float, b: float, N: int = 1) -> neuron.h.Vector:
     """Sample N variates from a gamma distribution with parameters shape = a,
     scale = b using the NEURON random number generator rng.
 
-    Uses the algorithm by Marsaglia and Tsang 2001.
+    Uses the algorithm by Marsaglia and Tsang 2001. The random numbers
+    are drawn in blocks and the rejection is vectorized, while the
+    numbers are taken from rng in the same order, and the same attempts
+    are accepted, as by the sequential algorithm calling rng.normal and
+    rng.uniform for each attempt. The samples are identical to the
+    sequential ones.
     """
     if a < 1:
         rng.uniform(0, 1)
@@ -38,19 +48,166 @@ def gamma(rng: NEURON_RNG, a: float, b: float, N: int = 1) -> neuron.h.Vector:
     d = a - 1 / 3
     c = 1 / 3 / sqrt(d)
 
-    vec = neuron.h.Vector(N)
-    for i in range(0, N):
-        while True:
-            x = rng.normal(0, 1)
-            v = 1 + c * x
-            if v > 0:
-                v = v * v * v
-                u = rng.uniform(0, 1)
-                if u < 1 - 0.0331 * x * x * x * x:
-                    vec.x[i] = b * d * v
-                    break
-                if log(u) < 0.5 * x * x + d * (1 - v + log(v)):
-                    vec.x[i] = b * d * v
-                    break
-
-    return vec
+    samples: list[np.ndarray] = []
+    n_samples = 0
+    uniforms = np.empty(0)
+    while n_samples < N:
+        # A sample consumes at least 3 uniforms, drawing 3 per missing
+        # sample never takes more numbers from the stream than the
+        # sequential algorithm would. The incomplete attempt at the end
+        # of a block is completed with the next block.
+        n_draw = 3 * (N - n_samples) - len(uniforms)
+        uniforms = np.concatenate([uniforms, _draw_uniforms(rng, n_draw)])
+        block_samples, n_used = _marsaglia_tsang(uniforms, c, d, N - n_samples)
+        samples.append(block_samples)
+        n_samples += len(block_samples)
+        uniforms = uniforms[n_used:]
+
+    if N == 0:
+        return neuron.h.Vector()
+    return neuron.h.Vector(b * d * np.concatenate(samples))
+
+
+def _draw_uniforms(rng: NEURON_RNG, n: int) -> np.ndarray:
+    """Draw n uniform(0, 1) numbers from rng, in the order of rng.uniform
+    calls."""
+    uniforms = np.empty(n)
+    uniforms[0] = rng.uniform(0, 1)
+    if n > 1:
+        block = neuron.h.Vector(n - 1)
+        block.setrand(rng)
+        uniforms[1:] = block.as_numpy()
+    return uniforms
+
+
+def _marsaglia_tsang(uniforms: np.ndarray, c: float, d: float,
+                     n_max: int) -> tuple[np.ndarray, int]:
+    """Run the Marsaglia and Tsang rejection on a block of uniforms.
+
+    The normal variates are computed as rng.normal(0, 1) does, i.e. with
+    the polar method of a new NEURON Normal distribution for each call.
+    Only the attempts with v > 0 draw a uniform u after the normal,
+    which is decided for every position of the block to follow the
+    attempts of the sequential algorithm, before the attempts are
+    evaluated.
+
+    Returns the accepted v ** 3 values, at most n_max, and the number of
+    uniforms used by the completed attempts.
+    """
+    n_uniforms = len(uniforms)
+    # 1 + c * x of the attempts starting at every position. np.log can
+    # differ from the C library log used by NEURON in the last bit, the
+    # few decisions close to a boundary are computed with the latter.
+    x = _polar_normals(uniforms[:-1], uniforms[1:], np.log)
+    v = 1 + c * x
+    uncertain = np.flatnonzero(np.abs(v) < _BOUNDARY_TOLERANCE)
+    v[uncertain] = 1 + c * _polar_normals(
+        uniforms[uncertain], uniforms[uncertain + 1], _log)
+    with_u = np.flatnonzero(v[:-1] > 0)  # complete in the block
+
+    attempts, n_used = _follow_attempts(with_u, n_uniforms)
+
+    # the normals of the followed attempts are the returned samples, they
+    # are computed with the C log to be identical to rng.normal
+    x = _polar_normals(uniforms[attempts], uniforms[attempts + 1], _log)
+    u = uniforms[attempts + 2]
+    accepted, uncertain = _accept(x, u, c, d, np.log)
+    uncertain = np.flatnonzero(uncertain)
+    accepted[uncertain], _ = _accept(x[uncertain], u[uncertain], c, d, _log)
+    v = 1 + c * x
+    v = v * v * v
+
+    accepted_attempts = np.flatnonzero(accepted)
+    if len(accepted_attempts) >= n_max:
+        accepted_attempts = accepted_attempts[:n_max]
+        n_used = int(attempts[accepted_attempts[-1]]) + 3
+    return v[accepted_attempts], n_used
+
+
+def _accept(x: np.ndarray, u: np.ndarray, c: float, d: float,
+            log_func) -> tuple[np.ndarray, np.ndarray]:
+    """Acceptance of the attempts with normal x and uniform u.
+
+    Also returns whether the acceptance is close enough to a boundary to
+    depend on the last bit of log_func.
+    """
+    v = 1 + c * x
+    v = v * v * v
+    squeeze = 1 - 0.0331 * x * x * x * x
+    accepted = u < squeeze
+    uncertain = np.abs(u - squeeze) < _BOUNDARY_TOLERANCE
+    rest = np.flatnonzero(~accepted)
+    x_rest = x[rest]
+    v_rest = v[rest]
+    with np.errstate(divide="ignore"):
+        lhs = log_func(u[rest])
+        rhs = 0.5 * x_rest * x_rest + d * (1 - v_rest + log_func(v_rest))
+    accepted[rest] = lhs < rhs
+    uncertain[rest] |= np.abs(lhs - rhs) < _BOUNDARY_TOLERANCE * (1 + d)
+    return accepted, uncertain
+
+
+def _polar_normals(u1: np.ndarray, u2: np.ndarray, log_func) -> np.ndarray:
+    """Normal variates of NEURON's polar method, NaN for rejected pairs."""
+    v1 = 2 * u1 - 1
+    v2 = 2 * u2 - 1
+    w = (v1 * v1) + (v2 * v2)
+    polar = w <= 1
+    x = np.full(len(w), np.nan)
+    w = w[polar]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x[polar] = v1[polar] * np.sqrt((-2 * log_func(w)) / w)
+    return x
+
+
+def _follow_attempts(with_u: np.ndarray, n_uniforms: int) -> tuple[np.ndarray, int]:
+    """Follow the attempts of the sequential algorithm through a block.
+
+    An attempt takes 2 uniforms, or 3 if it starts at a position of
+    with_u. Returns the positions of the followed attempts with u and
+    the end of the last complete attempt.
+    """
+    # the attempts without u are skipped by jumping to the next attempt
+    # with u, or the end of the block, of the same parity
+    positions = np.arange(n_uniforms + 1)
+    stops = np.zeros(n_uniforms + 1, dtype=bool)
+    stops[with_u] = True
+    stops[-3:] = True
+    next_stop = np.where(stops, positions, n_uniforms + 1)
+    for parity in (0, 1):
+        next_stop[parity::2] = np.minimum.accumulate(
+            next_stop[parity::2][::-1])[::-1]
+
+    # from an attempt with u, the next one starts at next_stop[pos + 3],
+    # the last node stands for the end of the block
+    n_nodes = len(with_u) + 1
+    node_index = np.full(n_uniforms + 1, n_nodes - 1, dtype=np.int32)
+    node_index[with_u] = np.arange(n_nodes - 1, dtype=np.int32)
+    jump = np.append(node_index[next_stop[with_u + 3]], n_nodes - 1)
+    # the nodes reached in less than 2 ** k steps, by pointer doubling
+    jumps = [jump]
+    while 2 ** len(jumps) <= n_nodes:
+        jumps.append(jumps[-1][jumps[-1]])
+    path = np.array([node_index[next_stop[0]]])
+    for jump in reversed(jumps):
+        path = np.concatenate([path, jump[path]])
+    # the positions increase along the path, which ends with the last node
+    attempts = with_u[np.unique(path)[:-1]]
+
+    if len(attempts) > 0:
+        return attempts, int(next_stop[attempts[-1] + 3])
+    return attempts, int(next_stop[0])
+
+
+def _log(values: np.ndarray) -> np.ndarray:
+    """Natural logarithm computed by the C library, as in NEURON.
+
+    np.log may differ in the last bit on some platforms. This loops in
+    Python, it is used for the normals of the followed attempts and the
+    few decisions close to a boundary.
+    """
+    result = np.full(len(values), -np.inf)
+    positive = values > 0
+    result[positive] = np.fromiter(
+        map(log, values[positive].tolist()), dtype=float, count=int(positive.sum()))
+    return result
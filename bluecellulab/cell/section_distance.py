@@ -13,6 +13,8 @@
 # limitations under the License.
 """Distance computing functionality between Neuron sections."""
 
+from __future__ import annotations
+
 import numpy as np
 
 import bluecellulab
@@ -21,6 +23,10 @@ import bluecellulab
 class EuclideanSectionDistance:
     """Calculate euclidian distance between positions on two sections.
 
+    The interpolated node coordinates of the sections are computed once
+    per section and cached, an instance is meant to be used with the
+    sections of one cell, e.g. through Cell.section_distance.
+
     Parameters
     ----------
 
@@ -37,6 +43,9 @@ class EuclideanSectionDistance:
     """
     # pylint: disable=invalid-name
 
+    def __init__(self):
+        self._node_coordinates: dict[str, np.ndarray] = {}
+
     def __call__(
             self,
             hsection1=None,
@@ -46,16 +55,8 @@ class EuclideanSectionDistance:
             projection=None,
     ):
         """Computes and returns the distance."""
-        xs_interp1, ys_interp1, zs_interp1 = self.grindaway(hsection1)
-        xs_interp2, ys_interp2, zs_interp2 = self.grindaway(hsection2)
-
-        x1 = xs_interp1[int(np.floor((len(xs_interp1) - 1) * location1))]
-        y1 = ys_interp1[int(np.floor((len(ys_interp1) - 1) * location1))]
-        z1 = zs_interp1[int(np.floor((len(zs_interp1) - 1) * location1))]
-
-        x2 = xs_interp2[int(np.floor((len(xs_interp2) - 1) * location2))]
-        y2 = ys_interp2[int(np.floor((len(ys_interp2) - 1) * location2))]
-        z2 = zs_interp2[int(np.floor((len(zs_interp2) - 1) * location2))]
+        (x1, y1, z1), (x2, y2, z2) = self.locations_coordinates(
+            [(hsection1, location1), (hsection2, location2)])
 
         distance = 0
         if "x" in projection:
@@ -69,6 +70,57 @@ class EuclideanSectionDistance:
 
         return distance
 
+    def node_coordinates(self, hsection) -> np.ndarray:
+        """Interpolated x, y, z coordinates of the nodes of a section.
+
+        Returns
+        -------
+        coordinates : (nseg + 2, 3) array, cached per section
+        """
+        secname = hsection.name()
+        if secname not in self._node_coordinates:
+            self._node_coordinates[secname] = np.column_stack(
+                self.grindaway(hsection))
+        return self._node_coordinates[secname]
+
+    def clear_cache(self):
+        """Forget the node coordinates, e.g. after a morphology change."""
+        self._node_coordinates.clear()
+
+    def locations_coordinates(self, locations) -> np.ndarray:
+        """Coordinates of the nodes at (hsection, x) locations.
+
+        Returns
+        -------
+        coordinates : (len(locations), 3) array
+        """
+        coordinates = np.empty((len(locations), 3))
+        for index, (hsection, location) in enumerate(locations):
+            node_coordinates = self.node_coordinates(hsection)
+            node = int(np.floor((len(node_coordinates) - 1) * location))
+            coordinates[index] = node_coordinates[node]
+        return coordinates
+
+    def pairwise_distances(self, locations_a, locations_b, projection="xyz") -> np.ndarray:
+        """Distances between all pairs of (hsection, x) locations.
+
+        Parameters
+        ----------
+        locations_a : list of (hsection, x) tuples
+        locations_b : list of (hsection, x) tuples
+        projection : string
+                     planes to project on, e.g. 'xy'
+
+        Returns
+        -------
+        distances : (len(locations_a), len(locations_b)) array
+        """
+        axes = [axis for axis, name in enumerate("xyz") if name in projection]
+        coordinates_a = self.locations_coordinates(locations_a)[:, axes]
+        coordinates_b = self.locations_coordinates(locations_b)[:, axes]
+        differences = coordinates_a[:, np.newaxis, :] - coordinates_b[np.newaxis, :, :]
+        return np.sqrt(np.sum(differences ** 2, axis=-1))
+
     @staticmethod
     def grindaway(hsection):
         """Grindaway."""
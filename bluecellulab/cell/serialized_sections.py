@@ -21,10 +21,17 @@ warnings.filterwarnings("once", category=UserWarning, module=__name__)
 
 
 class SerializedSections:
+    """Sections of a cell indexed by their section id.
+
+    isec2sec maps the section ids to SectionRefs, sections is a list
+    indexed by section id containing the hoc sections (None for the ids
+    without section) for constant time lookups.
+    """
 
     def __init__(self, cell):
         self.isec2sec = {}
         n = cell.nSecAll
+        self.sections = [None] * int(n)
 
         for index, sec in enumerate(cell.all, start=1):
             v_value = sec(0.0001).v
@@ -37,3 +44,14 @@ class SerializedSections:
                     f"[Warning] SerializedSections: v(0.0001) < 0. index={index} v()={v_value}")
             else:
                 self.isec2sec[int(v_value)] = neuron.h.SectionRef(sec=sec)
+                self.sections[int(v_value)] = sec
+
+    def get(self, section_id):
+        """Return the hoc section of a section id, None if there is none.
+
+        Raises:
+            IndexError: if the section id is out of range.
+        """
+        if section_id < 0:
+            raise IndexError(f"section id {section_id} is negative")
+        return self.sections[section_id]
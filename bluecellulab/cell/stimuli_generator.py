@@ -13,13 +13,105 @@
 # limitations under the License.
 """Generates stimuli to be injected into cells."""
 
+from __future__ import annotations
+from collections import OrderedDict
 import math
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+from scipy.signal import lfilter
 
 import bluecellulab
 from bluecellulab import lazy_printv
 from bluecellulab.cell.random import gamma
 
 
+class WaveformCache:
+    """Memoizes the time and signal arrays of the generated stimuli.
+
+    The key of a waveform is made of the generator, its parameters, the
+    seeds of its random number generator, dt and the duration, so that
+    the stimuli of repeated instantiations of a cell are generated once.
+    When the total size of the stored arrays exceeds max_size bytes, the
+    least recently used waveforms are removed. A max_size of 0, the
+    default, disables the cache.
+
+    A waveform takes 16 bytes per time step, e.g. 6.4 MB for a stimulus
+    of 10 s at dt=0.025 ms. To reuse the waveforms of n distinct stimuli
+    the cache needs at least n times that size.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: maximum total size of the stored arrays in bytes.
+        """
+        self.max_size = max_size
+        self.size = 0
+        self._waveforms: OrderedDict[Hashable, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._waveforms)
+
+    def get(self, key: Hashable) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """Time and signal arrays of key, None if they are not stored."""
+        waveform = self._waveforms.get(key)
+        if waveform is not None:
+            self._waveforms.move_to_end(key)
+        return waveform
+
+    def put(self, key: Hashable, tvec: np.ndarray, svec: np.ndarray) -> None:
+        """Store read-only copies of the arrays under key and evict the old
+        waveforms."""
+        nbytes = tvec.nbytes + svec.nbytes
+        if nbytes > self.max_size:
+            return
+        waveform = (np.array(tvec), np.array(svec))
+        for array in waveform:
+            array.flags.writeable = False
+        if key in self._waveforms:
+            self.size -= sum(array.nbytes for array in self._waveforms.pop(key))
+        self._waveforms[key] = waveform
+        self.size += nbytes
+        self._evict()
+
+    def get_or_generate(
+        self, key: Hashable, generate: Callable[[], tuple]
+    ) -> tuple:
+        """Return new NEURON time and signal vectors of key, calling generate
+        to create them if they are not stored."""
+        waveform = self.get(key)
+        if waveform is None:
+            tvec, svec = generate()
+            self.put(key, tvec.as_numpy(), svec.as_numpy())
+            return tvec, svec
+        # the vectors are modified by the injections, e.g. to add the delay
+        return bluecellulab.neuron.h.Vector(waveform[0]), bluecellulab.neuron.h.Vector(waveform[1])
+
+    def clear(self) -> None:
+        """Remove all the waveforms."""
+        self._waveforms.clear()
+        self.size = 0
+
+    def resize(self, max_size: int) -> None:
+        """Set the maximum size in bytes and evict the waveforms over it, 0
+        disables the cache."""
+        self.max_size = max_size
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used waveforms until the size fits."""
+        while self.size > self.max_size:
+            _, evicted = self._waveforms.popitem(last=False)
+            self.size -= sum(array.nbytes for array in evicted)
+
+
+# waveforms shared by all the cells of the process, disabled by default,
+# enable it with e.g. waveform_cache.resize(2**27) for 128 MB
+waveform_cache = WaveformCache()
+
+
 def gen_shotnoise_signal(tau_D, tau_R, rate, amp_mean, amp_var,
                          duration, dt=0.25, rng=None):
     """Adds a Poisson shot noise signal with gamma-distributed amplitudes and
@@ -63,8 +155,9 @@ def gen_shotnoise_signal(tau_D, tau_R, rate, amp_mean, amp_var,
     ev.where("<", duration)  # remove events exceeding duration
     ev.div(dt)  # divide events by timestep
 
-    nev = bluecellulab.neuron.h.Vector([round(x) for x in ev])  # round to integer timestep index
-    nev.where("<", ntstep)  # remove events exceeding number of timesteps
+    # round to integer timestep index (half to even, as round)
+    nev = np.rint(ev.as_numpy())
+    nev = nev[nev < ntstep].astype(np.int64)  # remove events exceeding number of timesteps
 
     sign = 1
     # if amplitude mean is negative, invert sign of current
@@ -77,9 +170,9 @@ def gen_shotnoise_signal(tau_D, tau_R, rate, amp_mean, amp_var,
     # sample gamma-distributed amplitudes
     amp = gamma(rng, gamma_shape, gamma_scale, len(nev))
 
-    E = bluecellulab.neuron.h.Vector(ntstep, 0)  # full signal
-    for n, A in zip(nev, amp):
-        E.x[int(n)] += sign * A  # add impulses, may overlap due to rounding to timestep
+    E = np.zeros(ntstep)  # full signal
+    # add impulses, may overlap due to rounding to timestep
+    np.add.at(E, nev, sign * amp.as_numpy())
 
     # perform equivalent of convolution with bi-exponential impulse response
     # through a composite autoregressive process with impulse train as innovations
@@ -92,21 +185,19 @@ def gen_shotnoise_signal(tau_D, tau_R, rate, amp_mean, amp_var,
     t_peak = math.log(R / D) / (R - D)
     A = (a / b - 1) / (a ** t_peak - b ** t_peak)
 
-    P = bluecellulab.neuron.h.Vector(ntstep, 0)
-    B = bluecellulab.neuron.h.Vector(ntstep, 0)
-
     # composite autoregressive process with exact solution
     # P[n] = b * (a ^ n - b ^ n) / (a - b)
     # for unit response B[0] = P[0] = 0, E[0] = 1
-    for n in range(1, ntstep):
-        P.x[n] = a * P[n - 1] + b * B[n - 1]
-        B.x[n] = b * B[n - 1] + E[n - 1]
+    # P[n] = a * P[n - 1] + b * B[n - 1]
+    # B[n] = b * B[n - 1] + E[n - 1]
+    B = lfilter([0.0, 1.0], [1.0, -b], E)
+    P = lfilter([0.0, b], [1.0, -a], B)
 
-    P.mul(A)  # normalize to peak amplitude
+    P *= A  # normalize to peak amplitude
 
     # append zero at end
     tvec.append(duration)
-    P.append(.0)
+    P = bluecellulab.neuron.h.Vector(np.append(P, 0.0))
 
     return tvec, P
 
@@ -146,8 +237,6 @@ def gen_ornstein_uhlenbeck(tau, sigma, mean, duration, dt=0.25, rng=None):
     tvec.indgen(0, duration, dt)  # time vector
     ntstep = len(tvec)  # total number of timesteps
 
-    svec = bluecellulab.neuron.h.Vector(ntstep, 0)  # stim vector
-
     noise = bluecellulab.neuron.h.Vector(ntstep)  # Gaussian noise
     rng.normal(0.0, 1.0)
     noise.setrand(rng)  # generate Gaussian noise
@@ -160,8 +249,11 @@ def gen_ornstein_uhlenbeck(tau, sigma, mean, duration, dt=0.25, rng=None):
         noise.mul(A)  # scale noise by amplitude [uS]
 
         # Exact update formula (independent of dt) from Gillespie 1996
-        for n in range(1, ntstep):
-            svec.x[n] = svec[n - 1] * mu + noise[n]  # signal [uS]
+        # svec[n] = svec[n - 1] * mu + noise[n], starting from svec[0] = 0
+        innovations = noise.as_numpy().copy()
+        innovations[0] = 0.0
+        svec = bluecellulab.neuron.h.Vector(
+            lfilter([1.0], [1.0, -mu], innovations))  # signal [uS]
 
     svec.add(mean)  # shift signal by mean value [uS]
 
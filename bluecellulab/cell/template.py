@@ -30,9 +30,20 @@ from bluecellulab.exceptions import BluecellulabError
 
 
 class NeuronTemplate:
-    """NeuronTemplate representation."""
+    """NeuronTemplate representation.
+
+    A template file is loaded once per process and its hoc template is
+    shared by all the cells using it. Set reuse_loaded_templates to
+    False to load a fresh copy of the template for every cell, e.g. when
+    the hoc template is modified after loading. The loaded templates are
+    not reference counted, NEURON keeps a hoc template defined until the
+    end of the process even when no cell uses it anymore.
+    """
 
     used_template_names: set[str] = set()
+    # (template file path, content hash) -> hoc template name
+    loaded_templates: dict[tuple[str, str], str] = {}
+    reuse_loaded_templates: bool = True
 
     def __init__(
         self, template_filepath: str | Path, morph_filepath: str | Path
@@ -92,9 +103,12 @@ class NeuronTemplate:
         return cell
 
     @classmethod
-    def load(cls, template_filename: str) -> str:
+    def load(cls, template_filename: str | Path) -> str:
         """Read a cell template. If template name already exists, rename it.
 
+        A template file whose content has already been loaded is not
+        loaded again unless reuse_loaded_templates is False.
+
         Args:
             template_filename: path string containing template file.
 
@@ -104,6 +118,13 @@ class NeuronTemplate:
         with open(template_filename) as template_file:
             template_content = template_file.read()
 
+        registry_key = (
+            str(Path(template_filename).resolve()),
+            hashlib.sha256(template_content.encode("utf-8")).hexdigest(),
+        )
+        if cls.reuse_loaded_templates and registry_key in cls.loaded_templates:
+            return cls.loaded_templates[registry_key]
+
         match = re.search(r"begintemplate\s*(\S*)", template_content)
         template_name = match.group(1)  # type:ignore
 
@@ -152,6 +173,8 @@ class NeuronTemplate:
             )
             bluecellulab.neuron.h.load_file(template_filename)
 
+        if cls.reuse_loaded_templates:
+            cls.loaded_templates[registry_key] = template_name
         return template_name
 
 
@@ -0,0 +1,134 @@
+# Copyright 2012-2023 Blue Brain Project / EPFL
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Array-backed topology of the sections of a morphology."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from bluecellulab import neuron
+
+# Section type names, the code of a section type is its position
+SECTION_TYPES = ("somatic", "axonal", "basal", "apical", "myelin")
+
+_SECTION_NAME_TYPES = (
+    ("apic", "apical"),
+    ("dend", "basal"),
+    ("soma", "somatic"),
+    ("axon", "axonal"),
+    ("myelin", "myelin"),
+)
+
+
+def section_type_from_name(secname: str) -> str:
+    """Type of a section derived from its name, e.g. 'apical' for
+    'Cell[0].apic[3]'."""
+    for name_part, section_type in _SECTION_NAME_TYPES:
+        if name_part in secname:
+            return section_type
+    raise ValueError(f"Section of unknown type: {secname}")
+
+
+class CellTopology:
+    """Topology and geometry of the sections of a cell stored in arrays.
+
+    The sections are indexed by their position in the list they were
+    built from. The parent of the root section is -1.
+    """
+
+    def __init__(self, sections: list, names: list[str], parents: np.ndarray,
+                 section_types: np.ndarray, lengths: np.ndarray,
+                 diameters: np.ndarray, nseg: np.ndarray) -> None:
+        """Initialize the topology.
+
+        Args:
+            sections: hoc sections.
+            names: names of the sections.
+            parents: index of the parent of each section, -1 for a root.
+            section_types: code of the type of each section in SECTION_TYPES.
+            lengths: length of each section.
+            diameters: diameter of each section.
+            nseg: number of segments of each section.
+        """
+        self.sections = sections
+        self.names = names
+        self.parents = parents
+        self.section_types = section_types
+        self.lengths = lengths
+        self.diameters = diameters
+        self.nseg = nseg
+        self.name_to_index = {name: index for index, name in enumerate(names)}
+
+        # children in CSR format, sorted by section index
+        order = np.argsort(parents, kind="stable")
+        starts = np.searchsorted(parents[order], np.arange(-1, len(parents) + 1))
+        self._children = order
+        self._children_offsets = starts
+
+    @classmethod
+    def from_sections(cls, sections) -> CellTopology:
+        """Build the topology of hoc sections, e.g. those of cell.all.
+
+        Each section is read once, parents that are not in the sections
+        are considered as roots.
+        """
+        sections = list(sections)
+        names = [neuron.h.secname(sec=section) for section in sections]
+        name_to_index = {name: index for index, name in enumerate(names)}
+
+        parents = np.full(len(sections), -1, dtype=np.int64)
+        for index, section in enumerate(sections):
+            sec_ref = neuron.h.SectionRef(sec=section)
+            if sec_ref.has_parent():
+                parent_name = neuron.h.secname(sec=sec_ref.parent)
+                parents[index] = name_to_index.get(parent_name, -1)
+
+        section_types = np.array(
+            [SECTION_TYPES.index(section_type_from_name(name)) for name in names],
+            dtype=np.int8)
+        lengths = np.array([section.L for section in sections], dtype=np.float64)
+        diameters = np.array([section.diam for section in sections], dtype=np.float64)
+        nseg = np.array([section.nseg for section in sections], dtype=np.int64)
+        return cls(sections, names, parents, section_types, lengths, diameters, nseg)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    @property
+    def roots(self) -> np.ndarray:
+        """Indices of the sections without parent."""
+        return np.flatnonzero(self.parents == -1)
+
+    @property
+    def n_segments(self) -> int:
+        """Total number of segments."""
+        return int(self.nseg.sum())
+
+    def index(self, secname: str) -> int:
+        """Index of the section named secname."""
+        return self.name_to_index[secname]
+
+    def children(self, index: int) -> np.ndarray:
+        """Indices of the children of a section."""
+        # parents are shifted by one in the offsets, -1 being the roots
+        return self._children[
+            self._children_offsets[index + 1]:self._children_offsets[index + 2]]
+
+    def section_type(self, index: int) -> str:
+        """Type name of a section."""
+        return SECTION_TYPES[self.section_types[index]]
+
+    def sections_of_type(self, section_type: str) -> np.ndarray:
+        """Indices of the sections of a type, e.g. 'apical'."""
+        return np.flatnonzero(self.section_types == SECTION_TYPES.index(section_type))
@@ -3,5 +3,7 @@
 from .synapse_properties import SynapseProperty
 from .node_id import CellId
 from .circuit_access import BluepyCircuitAccess, CircuitAccess, SonataCircuitAccess, EmodelProperties
+from .synapse_cache import SynapseCache
+from .spike_index import SpikeIndex
 from .simulation_access import BluepySimulationAccess, SimulationAccess, SonataSimulationAccess
 from .validate import SimulationValidator
@@ -32,9 +32,9 @@ if BLUEPY_AVAILABLE:
     from bluepy.impl.connectome_sonata import SonataConnectome
 
 from bluepysnap.bbp import Cell as SnapCell
-from bluepysnap.circuit_ids import CircuitNodeId, CircuitEdgeIds
 from bluepysnap.exceptions import BluepySnapError
 from bluepysnap import Circuit as SnapCircuit
+import numpy as np
 import pandas as pd
 from pydantic import Extra
 from pydantic.dataclasses import dataclass
@@ -42,6 +42,8 @@ from pydantic.dataclasses import dataclass
 from bluecellulab import lazy_printv, circuit, neuron
 from bluecellulab.circuit import CellId, SynapseProperty
 from bluecellulab.circuit.config import BluepySimulationConfig, SimulationConfig, SonataSimulationConfig
+from bluecellulab.circuit.config.sections import ConnectionOverrides
+from bluecellulab.circuit.synapse_cache import SynapseCache
 from bluecellulab.circuit.synapse_properties import (
     properties_from_bluepy,
     properties_from_snap,
@@ -62,35 +64,85 @@ def get_synapse_connection_parameters(
         circuit_access: CircuitAccess, pre_cell: CellId, post_cell: CellId) -> dict:
     """Apply connection blocks in order for pre_gid, post_gid to determine a
     final connection override for this pair (pre_gid, post_gid)."""
+    matching_entries = [
+        entry for entry in circuit_access.config.connection_entries()
+        if circuit_access.target_contains_cell(entry.source, pre_cell)
+        and circuit_access.target_contains_cell(entry.target, post_cell)
+    ]
+    return _merge_connection_entries(matching_entries)
+
+
+def _merge_connection_entries(entries: list[ConnectionOverrides]) -> dict:
+    """Merge the matching connection blocks, in order, into one override."""
     parameters: defaultdict[str, Any] = defaultdict(list)
     parameters['add_synapse'] = True
 
-    for entry in circuit_access.config.connection_entries():
-        src_matches = circuit_access.target_contains_cell(entry.source, pre_cell)
-        dest_matches = circuit_access.target_contains_cell(entry.target, post_cell)
-
-        if src_matches and dest_matches:
-            # whatever specified in this block, is applied to gid
-            apply_parameters = True
-
-            if entry.delay is not None:
-                parameters['DelayWeights'].append((entry.delay, entry.weight))
-                apply_parameters = False
-
-            if apply_parameters:
-                if entry.weight is not None:
-                    parameters['Weight'] = entry.weight
-                if entry.spont_minis is not None:
-                    parameters['SpontMinis'] = entry.spont_minis
-                if entry.synapse_configure is not None:
-                    # collect list of applicable configure blocks to be
-                    # applied with a "hoc exec" statement
-                    parameters['SynapseConfigure'].append(entry.synapse_configure)
-                if entry.mod_override is not None:
-                    parameters['ModOverride'] = entry.mod_override
+    for entry in entries:
+        # whatever specified in this block, is applied to gid
+        apply_parameters = True
+
+        if entry.delay is not None:
+            parameters['DelayWeights'].append((entry.delay, entry.weight))
+            apply_parameters = False
+
+        if apply_parameters:
+            if entry.weight is not None:
+                parameters['Weight'] = entry.weight
+            if entry.spont_minis is not None:
+                parameters['SpontMinis'] = entry.spont_minis
+            if entry.synapse_configure is not None:
+                # collect list of applicable configure blocks to be
+                # applied with a "hoc exec" statement
+                parameters['SynapseConfigure'].append(entry.synapse_configure)
+            if entry.mod_override is not None:
+                parameters['ModOverride'] = entry.mod_override
     return parameters
 
 
+class ConnectionParametersResolver:
+    """Resolves the connection overrides of many (pre_cell, post_cell) pairs.
+
+    Equivalent to calling get_synapse_connection_parameters for every
+    synapse, but the connection blocks are read once, the target of each
+    block is checked once per post cell, the source once per pre cell,
+    and pairs matching the same blocks share one merged override. The
+    returned dictionaries are shared and must not be modified.
+    """
+
+    def __init__(self, circuit_access: CircuitAccess) -> None:
+        self.circuit_access = circuit_access
+        self.entries = circuit_access.config.connection_entries()
+        self._source_matches: dict[CellId, frozenset[int]] = {}
+        self._target_matches: dict[CellId, frozenset[int]] = {}
+        self._merged: dict[tuple[int, ...], dict] = {}
+
+    def _matching_entries(self, target_attr: str, cell_id: CellId, cache: dict) -> frozenset[int]:
+        """Indices of the connection blocks whose source/target has the
+        cell."""
+        if cell_id not in cache:
+            cache[cell_id] = frozenset(
+                idx for idx, entry in enumerate(self.entries)
+                if self.circuit_access.target_contains_cell(getattr(entry, target_attr), cell_id)
+            )
+        return cache[cell_id]
+
+    def resolve(self, pre_cell: CellId, post_cell: CellId) -> dict:
+        """Return the final connection override for the pair."""
+        if len(self.entries) == 0:
+            matched: tuple[int, ...] = ()
+        else:
+            post_matches = self._matching_entries("target", post_cell, self._target_matches)
+            if len(post_matches) == 0:
+                matched = ()
+            else:
+                pre_matches = self._matching_entries("source", pre_cell, self._source_matches)
+                matched = tuple(sorted(pre_matches & post_matches))
+        if matched not in self._merged:
+            self._merged[matched] = _merge_connection_entries(
+                [self.entries[idx] for idx in matched])
+        return self._merged[matched]
+
+
 class CircuitAccess(Protocol):
     """Protocol that defines the circuit access layer."""
 
@@ -117,7 +169,14 @@ class CircuitAccess(Protocol):
         raise NotImplementedError
 
     def extract_synapses(
-        self, cell_id: CellId, properties: list, projections: Optional[list[str] | str]
+        self, cell_id: CellId, properties: list, projections: Optional[list[str] | str],
+        pre_cell_ids: Optional[list[CellId]] = None
+    ) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def extract_synapses_for_cells(
+        self, cell_ids: list[CellId], properties: list, projections: Optional[list[str] | str],
+        pre_cell_ids: Optional[list[CellId]] = None
     ) -> pd.DataFrame:
         raise NotImplementedError
 
@@ -264,10 +323,14 @@ class BluepyCircuitAccess:
         return connectomes
 
     def extract_synapses(
-        self, cell_id: CellId, properties: list, projections: Optional[list[str] | str]
+        self, cell_id: CellId, properties: list, projections: Optional[list[str] | str],
+        pre_cell_ids: Optional[list[CellId]] = None
     ) -> pd.DataFrame:
         """Extract the synapses of a cell.
 
+        If pre_cell_ids is given, only the synapses of those presynaptic
+        cells are returned. Bluepy connectomes are read fully and filtered.
+
         Returns:
             synapses dataframes indexed by projection, edge and synapse ids
         """
@@ -345,8 +408,35 @@ class BluepyCircuitAccess:
             lazy_printv('Found a total of {n_syn_sets} synapse sets',
                         5, n_syn_sets=len(result))
 
+        if pre_cell_ids is not None:
+            pre_gids = {pre_cell_id.id for pre_cell_id in pre_cell_ids}
+            result = result[result[SynapseProperty.PRE_GID].isin(pre_gids)]
+
         return result
 
+    def extract_synapses_for_cells(
+        self, cell_ids: list[CellId], properties: list, projections: Optional[list[str] | str],
+        pre_cell_ids: Optional[list[CellId]] = None
+    ) -> pd.DataFrame:
+        """Extract the synapses of multiple cells.
+
+        Bluepy connectomes are queried cell by cell.
+
+        Returns:
+            synapses dataframe indexed by post population name, post gid,
+            projection and synapse ids
+        """
+        cell_synapses = {}
+        for cell_id in cell_ids:
+            synapses = self.extract_synapses(cell_id, properties, projections, pre_cell_ids)
+            if not synapses.empty:
+                cell_synapses[(cell_id.population_name, cell_id.id)] = synapses
+
+        if len(cell_synapses) == 0:
+            return pd.DataFrame()
+        return pd.concat(
+            cell_synapses, names=["post_population_name", "post_gid"])
+
     @property
     def use_mecombo_tsv(self) -> bool:
         """Property that decides whether to use mecombo_tsv."""
@@ -470,10 +560,20 @@ class BluepyCircuitAccess:
 class SonataCircuitAccess:
     """Sonata implementation of CircuitAccess protocol."""
 
-    def __init__(self, simulation_config: str | Path | SimulationConfig) -> None:
-        """Initialize SonataCircuitAccess object."""
+    def __init__(
+        self,
+        simulation_config: str | Path | SimulationConfig,
+        synapse_cache: Optional[SynapseCache] = None,
+    ) -> None:
+        """Initialize SonataCircuitAccess object.
+
+        Args:
+            simulation_config: the SONATA simulation config.
+            synapse_cache: optional on-disk cache of the extracted synapses.
+        """
         if isinstance(simulation_config, (str, Path)) and not Path(simulation_config).exists():
             raise FileNotFoundError(f"Circuit config file {simulation_config} not found.")
+        self.synapse_cache = synapse_cache
 
         if isinstance(simulation_config, SonataSimulationConfig):
             self.config: SimulationConfig = simulation_config
@@ -531,72 +631,227 @@ class SonataCircuitAccess:
         source_popid, target_popid = self._compute_pop_ids(source, target)
         return source_popid, target_popid
 
-    def extract_synapses(
-        self, cell_id: CellId, properties: list, projections: Optional[list[str] | str]
-    ) -> pd.DataFrame:
-        """Extract the synapses.
-
-        If projections is None, all the synapses are extracted.
-        """
-        snap_node_id = CircuitNodeId(cell_id.population_name, cell_id.id)
+    def _select_edge_names(self, projections: Optional[list[str] | str]) -> list[str]:
+        """Select edges that are in the projections, if there are
+        projections."""
         edges = self._circuit.edges
-        # select edges that are in the projections, if there are projections
         if projections is None or len(projections) == 0:
-            edge_names = [x for x in edges]
+            return [x for x in edges]
         elif isinstance(projections, str):
-            edge_names = [x for x in edges if edges[x].source.name == projections]
+            return [x for x in edges if edges[x].source.name == projections]
         else:
-            edge_names = [x for x in edges if edges[x].source.name in projections]
+            return [x for x in edges if edges[x].source.name in projections]
+
+    @staticmethod
+    def _edge_properties(edge, properties: list) -> list:
+        """Remove the optional properties that are not present in edge."""
+        edge_properties = list(properties)  # copy, it'll be modified
+        for optional_property in [SynapseProperty.U_HILL_COEFFICIENT,
+                                  SynapseProperty.CONDUCTANCE_RATIO]:
+            if optional_property.to_snap() not in edge.property_names:
+                edge_properties.remove(optional_property)
+        return edge_properties
+
+    def _finalize_edge_synapses(self, synapses: pd.DataFrame, edge_name: str) -> pd.DataFrame:
+        """Add the population columns and apply the neurodamus corrections."""
+        # add source_population_name as a column
+        source_population_name = self._circuit.edges[edge_name].source.name
+        synapses["source_population_name"] = source_population_name
+
+        # py-neurodamus
+        dt = neuron.h.dt
+        synapses[SynapseProperty.AXONAL_DELAY] = (
+            synapses[SynapseProperty.AXONAL_DELAY] / dt + 1e-5
+        ).astype('i4') * dt
 
+        if SynapseProperty.NRRP in synapses:
+            circuit.validate.check_nrrp_value(synapses)
+
+        source_popid, target_popid = self.get_population_ids(edge_name)
+        return synapses.assign(
+            source_popid=source_popid, target_popid=target_popid
+        )
+
+    def _synapse_cache_edge_key(self, edge_name: str, properties: list) -> str:
+        edge_file = self._circuit.edges[edge_name].h5_filepath
+        return SynapseCache.edge_key(edge_file, edge_name, properties, neuron.h.dt)
+
+    def extract_synapses(
+        self, cell_id: CellId, properties: list, projections: Optional[list[str] | str],
+        pre_cell_ids: Optional[list[CellId]] = None
+    ) -> pd.DataFrame:
+        """Extract the synapses.
+
+        If projections is None, all the synapses are extracted. If
+        pre_cell_ids is given, only the synapses of those presynaptic
+        cells are read.
+        """
         all_synapses_dfs: list[pd.DataFrame] = []
-        for edge_name in edge_names:
-            edge = edges[edge_name]
-            afferent_edges: CircuitEdgeIds = edge.afferent_edges(snap_node_id)
-            if len(afferent_edges) != 0:
-                edge_properties = list(properties)  # copy, it'll be modified
-
-                # remove optional properties if they are not present
-                for optional_property in [SynapseProperty.U_HILL_COEFFICIENT,
-                                          SynapseProperty.CONDUCTANCE_RATIO]:
-                    if optional_property.to_snap() not in edge.property_names:
-                        edge_properties.remove(optional_property)
-
-                snap_properties = properties_to_snap(edge_properties)
-                synapses: pd.DataFrame = edge.get(afferent_edges, snap_properties)
-                column_names = list(synapses.columns)
-                synapses.columns = pd.Index(properties_from_snap(column_names))
-
-                # make multiindex
-                synapses = synapses.reset_index(drop=True)
-                synapses.index = pd.MultiIndex.from_tuples(
-                    zip([edge_name] * len(synapses), synapses.index),
-                    names=["edge_name", "synapse_id"],
-                )
+        for edge_name in self._select_edge_names(projections):
+            synapses = self._extract_edge_synapses(
+                edge_name, [cell_id], properties, pre_cell_ids)
+            if not synapses.empty:
+                all_synapses_dfs.append(synapses.droplevel([0, 1]))
 
-                # add source_population_name as a column
-                source_population_name = edges[edge_name].source.name
-                synapses["source_population_name"] = source_population_name
+        if len(all_synapses_dfs) == 0:
+            return pd.DataFrame()
+        else:
+            return pd.concat(all_synapses_dfs)  # outer join that creates NaNs
 
-                # py-neurodamus
-                dt = neuron.h.dt
-                synapses[SynapseProperty.AXONAL_DELAY] = (
-                    synapses[SynapseProperty.AXONAL_DELAY] / dt + 1e-5
-                ).astype('i4') * dt
+    def extract_synapses_for_cells(
+        self, cell_ids: list[CellId], properties: list, projections: Optional[list[str] | str],
+        pre_cell_ids: Optional[list[CellId]] = None
+    ) -> pd.DataFrame:
+        """Extract the synapses of multiple cells at once.
 
-                if SynapseProperty.NRRP in synapses:
-                    circuit.validate.check_nrrp_value(synapses)
+        A single afferent query is issued per edge population for all the
+        cells. The synapse ids are numbered per post cell in the same way as
+        extract_synapses does it, so that the synapses of a cell are identical
+        in both methods.
 
-                source_popid, target_popid = self.get_population_ids(edge_name)
-                synapses = synapses.assign(
-                    source_popid=source_popid, target_popid=target_popid
-                )
+        If projections is None, all the synapses are extracted. If
+        pre_cell_ids is given, only the synapses of those presynaptic cells
+        are read.
 
+        Returns:
+            synapses dataframe indexed by post population name, post cell id,
+            edge name and synapse id. Rows of the same post cell are contiguous.
+        """
+        all_synapses_dfs: list[pd.DataFrame] = []
+        for edge_name in self._select_edge_names(projections):
+            synapses = self._extract_edge_synapses(
+                edge_name, cell_ids, properties, pre_cell_ids)
+            if not synapses.empty:
                 all_synapses_dfs.append(synapses)
 
         if len(all_synapses_dfs) == 0:
             return pd.DataFrame()
+
+        result = pd.concat(all_synapses_dfs)  # outer join that creates NaNs
+        # group the rows by post cell, keeping the edge order within a cell
+        post_cell_order = np.lexsort((
+            result.index.get_level_values("post_gid"),
+            result.index.get_level_values("post_population_name"),
+        ))
+        return result.iloc[post_cell_order]
+
+    def _extract_edge_synapses(
+        self, edge_name: str, cell_ids: list[CellId], properties: list,
+        pre_cell_ids: Optional[list[CellId]]
+    ) -> pd.DataFrame:
+        """Synapses of the cells from one edge population, through the synapse
+        cache if there is one.
+
+        The cache holds all the synapses of a cell, the presynaptic
+        cells are selected after loading them.
+        """
+        if self.synapse_cache is None:
+            return self._read_edge_synapses(edge_name, cell_ids, properties, pre_cell_ids)
+
+        synapses_dfs: list[pd.DataFrame] = []
+        uncached_cell_ids = []
+        edge_key = self._synapse_cache_edge_key(edge_name, properties)
+        for cell_id in cell_ids:
+            cached_synapses = self.synapse_cache.load(
+                SynapseCache.cell_key(edge_key, cell_id))
+            if cached_synapses is None:
+                uncached_cell_ids.append(cell_id)
+            elif not cached_synapses.empty:
+                synapses_dfs.append(pd.concat(
+                    {(cell_id.population_name, cell_id.id): cached_synapses},
+                    names=["post_population_name", "post_gid"]))
+        if len(uncached_cell_ids) != 0:
+            synapses = self._read_edge_synapses(edge_name, uncached_cell_ids, properties)
+            self._save_cached_cell_synapses(edge_key, uncached_cell_ids, synapses)
+            if not synapses.empty:
+                synapses_dfs.append(synapses)
+
+        if len(synapses_dfs) == 0:
+            return pd.DataFrame()
+        synapses = pd.concat(synapses_dfs)
+        if pre_cell_ids is not None:
+            pre_gids = self._pre_gids_of_edge(edge_name, pre_cell_ids)
+            synapses = synapses[synapses[SynapseProperty.PRE_GID].isin(pre_gids)]
+        return synapses
+
+    def _save_cached_cell_synapses(
+        self, edge_key: str, cell_ids: list[CellId], synapses: pd.DataFrame
+    ) -> None:
+        """Split the synapses of the edge population per post cell and store
+        them, the cells without synapses included.
+
+        The old entries of the cache are evicted once, after all the
+        cells are stored.
+        """
+        assert self.synapse_cache is not None
+        cell_synapses: dict[tuple, pd.DataFrame] = {}
+        if not synapses.empty:
+            cell_synapses = {
+                post_cell: post_cell_synapses.droplevel([0, 1])
+                for post_cell, post_cell_synapses in synapses.groupby(level=[0, 1], sort=False)
+            }
+        for cell_id in cell_ids:
+            self.synapse_cache.save(
+                SynapseCache.cell_key(edge_key, cell_id),
+                cell_synapses.get((cell_id.population_name, cell_id.id), pd.DataFrame()))
+        self.synapse_cache.evict()
+
+    def _pre_gids_of_edge(self, edge_name: str, pre_cell_ids: list[CellId]) -> np.ndarray:
+        """Ids of the presynaptic cells in the source population of the
+        edges."""
+        source_population_name = self._circuit.edges[edge_name].source.name
+        return np.array(
+            [x.id for x in pre_cell_ids if x.population_name == source_population_name],
+            dtype=np.int64)
+
+    def _read_edge_synapses(
+        self, edge_name: str, cell_ids: list[CellId], properties: list,
+        pre_cell_ids: Optional[list[CellId]] = None
+    ) -> pd.DataFrame:
+        """Read the synapses of the cells from one edge population, indexed by
+        post cell, edge name and synapse id.
+
+        When pre_cell_ids is given, only the source and target nodes of
+        all the afferent edges are read to number the synapses, the
+        other properties are read for the edges of the presynaptic cells
+        only.
+        """
+        edge = self._circuit.edges[edge_name]
+        node_ids = [cell_id.id for cell_id in cell_ids
+                    if cell_id.population_name == edge.target.name]
+        if len(node_ids) == 0:
+            return pd.DataFrame()
+        afferent_edges = np.unique(edge.afferent_edges(node_ids))
+        if len(afferent_edges) == 0:
+            return pd.DataFrame()
+
+        edge_properties = self._edge_properties(edge, properties)
+        snap_properties = properties_to_snap(edge_properties)
+        if pre_cell_ids is None:
+            synapses = edge.get(afferent_edges, snap_properties + ["@target_node"])
+            post_gids = synapses.pop("@target_node").to_numpy()
+            # edges are sorted by id, number them per post cell
+            synapse_ids = synapses.groupby(post_gids).cumcount().to_numpy()
         else:
-            return pd.concat(all_synapses_dfs)  # outer join that creates NaNs
+            edge_nodes = edge.get(afferent_edges, ["@source_node", "@target_node"])
+            post_gids = edge_nodes["@target_node"].to_numpy()
+            synapse_ids = edge_nodes.groupby(post_gids).cumcount().to_numpy()
+            selected = np.isin(
+                edge_nodes["@source_node"].to_numpy(),
+                self._pre_gids_of_edge(edge_name, pre_cell_ids))
+            if not selected.any():
+                return pd.DataFrame()
+            post_gids, synapse_ids = post_gids[selected], synapse_ids[selected]
+            synapses = edge.get(afferent_edges[selected], snap_properties)
+        column_names = list(synapses.columns)
+        synapses.columns = pd.Index(properties_from_snap(column_names))
+
+        synapses = synapses.reset_index(drop=True)
+        synapses.index = pd.MultiIndex.from_arrays(
+            [[edge.target.name] * len(synapses), post_gids,
+             [edge_name] * len(synapses), synapse_ids],
+            names=["post_population_name", "post_gid", "edge_name", "synapse_id"])
+        return self._finalize_edge_synapses(synapses, edge_name)
 
     def target_contains_cell(self, target: str, cell_id: CellId) -> bool:
         return cell_id in self.get_target_cell_ids(target)
@@ -14,7 +14,12 @@
 """Input/output operations from circuits and simulations."""
 
 from __future__ import annotations
+import hashlib
+import os
 from pathlib import Path
+import stat
+import tempfile
+from typing import Optional
 
 import bluepy
 import numpy as np
@@ -23,18 +28,88 @@ from bluecellulab import lazy_printv
 from bluecellulab.circuit.node_id import CellId
 
 
-def parse_outdat(path: str | Path) -> dict[CellId, np.ndarray]:
-    """Parse the replay spiketrains in a out.dat formatted file pointed to by
-    path."""
-    spikes = bluepy.impl.spike_report.SpikeReport.load(path).get()
-    # convert Series to DataFrame with 2 columns for `groupby` operation
-    spike_df = spikes.to_frame().reset_index()
-    if (spike_df["t"] < 0).any():
+def outdat_index_path(path: str | Path, index_dir: str | Path) -> Path:
+    """Path of the spike index of the out.dat file at path in index_dir.
+
+    The name contains a hash of the absolute path of the out.dat file,
+    the indices of several simulations can share a directory.
+    """
+    path = Path(path)
+    digest = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:16]
+    return Path(index_dir) / f"{path.name}.{digest}.spikes.npy"
+
+
+def read_outdat(
+    path: str | Path, index_dir: Optional[str | Path] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Read the gids and times of the spikes in a out.dat formatted file
+    pointed to by path, the negative times are clipped to 0.
+
+    The spikes are sorted by gid, then by time. When an index_dir is
+    given, they are read from a memory-mapped spike index in that
+    directory, which is written on the first read and reused as long as
+    its modification time matches the one of the out.dat file. The
+    spikes are parsed from the file when the index cannot be written.
+    """
+    outdat_stat = os.stat(path)
+    if index_dir is not None:
+        index_path = outdat_index_path(path, index_dir)
+        try:
+            if os.stat(index_path).st_mtime_ns == outdat_stat.st_mtime_ns:
+                spikes = np.load(index_path, mmap_mode="r")
+                return spikes["gid"], spikes["t"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as error:
+            lazy_printv("Ignoring unreadable spike index {path}: {error}",
+                        2, path=index_path, error=error)
+
+    report = bluepy.impl.spike_report.SpikeReport.load(path).get()
+    spikes = np.empty(len(report), dtype=[("gid", np.int64), ("t", np.float64)])
+    spikes["gid"] = report.to_numpy(dtype=np.int64)
+    spikes["t"] = report.index.to_numpy(dtype=np.float64)
+    if (spikes["t"] < 0).any():
         lazy_printv('WARNING: SSim: Found negative spike times in out.dat ! '
                     'Clipping them to 0', 2)
-        spike_df["t"].clip(lower=0., inplace=True)
+        spikes["t"] = spikes["t"].clip(min=0.)
+    spikes = spikes[np.lexsort((spikes["t"], spikes["gid"]))]
 
-    outdat = spike_df.groupby("gid")["t"].apply(np.array)
-    # convert outdat's index from int to CellId
-    outdat.index = [CellId("", gid) for gid in outdat.index]
-    return outdat.to_dict()
+    if index_dir is not None:
+        _write_outdat_index(index_path, spikes, outdat_stat)
+    return spikes["gid"], spikes["t"]
+
+
+def _write_outdat_index(index_path: Path, spikes: np.ndarray,
+                        outdat_stat: os.stat_result) -> None:
+    """Write the spike index, with the modification time and the permissions of
+    the out.dat file."""
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so that readers never see partial indices
+        fd, tmp_name = tempfile.mkstemp(suffix=".npy", dir=index_path.parent)
+    except OSError:  # e.g. a read-only directory, the index is optional
+        return
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            np.save(tmp_file, spikes)
+        # mkstemp creates the file readable by the owner only
+        os.chmod(tmp_name, stat.S_IMODE(outdat_stat.st_mode))
+        mtime_ns = outdat_stat.st_mtime_ns
+        os.utime(tmp_name, ns=(mtime_ns, mtime_ns))
+        os.replace(tmp_name, index_path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def parse_outdat(
+    path: str | Path, index_dir: Optional[str | Path] = None
+) -> dict[CellId, np.ndarray]:
+    """Parse the replay spiketrains in a out.dat formatted file pointed to by
+    path, using the spike index in index_dir if given."""
+    gids, times = read_outdat(path, index_dir)
+    unique_gids, starts = np.unique(gids, return_index=True)
+    trains = np.split(np.array(times), starts[1:])
+    return {CellId("", int(gid)): train for gid, train in zip(unique_gids, trains)}
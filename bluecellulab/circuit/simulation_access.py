@@ -22,20 +22,21 @@ from bluecellulab.circuit.config import SimulationConfig, SonataSimulationConfig
 from bluecellulab.exceptions import ExtraDependencyMissingError
 
 if python_version_tuple() < ('3', '9'):
-    from typing import Sequence
+    from typing import Iterable, Sequence
 else:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
 from bluecellulab import BLUEPY_AVAILABLE
 if BLUEPY_AVAILABLE:
     import bluepy
-    from bluecellulab.circuit.iotools import parse_outdat
+    from bluecellulab.circuit.iotools import parse_outdat, read_outdat
 
 from bluepysnap import Simulation as SnapSimulation
 import numpy as np
 
 from bluecellulab.circuit import CellId
 from bluecellulab.circuit.config import BluepySimulationConfig
+from bluecellulab.circuit.spike_index import SpikeIndex
 
 
 def _sample_array(arr: Sequence, t_step: float, sim_t_step: float) -> Sequence:
@@ -68,6 +69,12 @@ class SimulationAccess(Protocol):
     ) -> np.ndarray:
         raise NotImplementedError
 
+    def get_soma_voltages(
+        self, cell_ids: Sequence[CellId], t_start: Optional[float] = None,
+        t_end: Optional[float] = None, t_step: Optional[float] = None
+    ) -> np.ndarray:
+        raise NotImplementedError
+
     def get_soma_time_trace(self, t_step: Optional[float] = None) -> np.ndarray:
         raise NotImplementedError
 
@@ -75,12 +82,24 @@ class SimulationAccess(Protocol):
         """Get spikes from the main simulation."""
         raise NotImplementedError
 
+    def get_spike_index(self, cell_ids: Optional[Iterable[CellId]] = None) -> SpikeIndex:
+        """Get the index of the spikes from the main simulation, it may be
+        restricted to the spikes of cell_ids."""
+        raise NotImplementedError
+
 
 class BluepySimulationAccess:
     """Bluepy implementation of SimulationAccess protocol."""
 
-    def __init__(self, sim_config: str | Path | SimulationConfig) -> None:
-        """Initialize the simulation access object."""
+    def __init__(
+        self, sim_config: str | Path | SimulationConfig,
+        spike_index_dir: Optional[str | Path] = None
+    ) -> None:
+        """Initialize the simulation access object.
+
+        The out.dat spikes are indexed in spike_index_dir if given, to
+        be reused by the next simulation accesses.
+        """
         if not BLUEPY_AVAILABLE:
             raise ExtraDependencyMissingError("bluepy")
         if isinstance(sim_config, BluepySimulationConfig):
@@ -93,6 +112,8 @@ class BluepySimulationAccess:
 
         self.impl = bluepy.Simulation(sim_config)
         self._config = BluepySimulationConfig(sim_config)
+        self._spike_index_dir = spike_index_dir
+        self._spike_index: Optional[SpikeIndex] = None
 
     def get_soma_voltage(
         self, cell_id: CellId, t_start: float, t_end: float, t_step: Optional[float] = None
@@ -108,6 +129,23 @@ class BluepySimulationAccess:
             arr = _sample_array(arr, t_step, self._config._soma_report_dt)
         return arr
 
+    def get_soma_voltages(
+        self, cell_ids: Sequence[CellId], t_start: Optional[float] = None,
+        t_end: Optional[float] = None, t_step: Optional[float] = None
+    ) -> np.ndarray:
+        """Retrieve the soma voltages of cells of main simulation in a single
+        read of the report.
+
+        Returns:
+            A 2D array with a row per cell, in the order of cell_ids.
+        """
+        gids = [cell_id.id for cell_id in cell_ids]
+        frame = self.impl.report("soma").get(gids=gids, t_start=t_start, t_end=t_end)
+        arr = frame[gids].to_numpy()
+        if t_step is not None:
+            arr = _sample_array(arr, t_step, self._config._soma_report_dt)
+        return arr.T
+
     def get_soma_time_trace(self, t_step: Optional[float] = None) -> np.ndarray:
         """Retrieve the time trace from the main simulation."""
         report = self.impl.report('soma')
@@ -118,7 +156,19 @@ class BluepySimulationAccess:
 
     def get_spikes(self) -> dict[CellId, np.ndarray]:
         outdat_path = Path(self._config.output_root_path) / "out.dat"
-        return parse_outdat(outdat_path)
+        return parse_outdat(outdat_path, self._spike_index_dir)
+
+    def get_spike_index(self, cell_ids: Optional[Iterable[CellId]] = None) -> SpikeIndex:
+        """Index of the out.dat spikes, read once, from the memory-mapped spike
+        index if a spike_index_dir is set.
+
+        The index holds all the spikes, cell_ids is ignored.
+        """
+        if self._spike_index is None:
+            outdat_path = Path(self._config.output_root_path) / "out.dat"
+            gids, times = read_outdat(outdat_path, self._spike_index_dir)
+            self._spike_index = SpikeIndex.from_sorted_arrays("", gids, times)
+        return self._spike_index
 
 
 class SonataSimulationAccess:
@@ -133,6 +183,7 @@ class SonataSimulationAccess:
             self.impl = sim_config.impl
         else:
             self.impl = SnapSimulation(sim_config)
+        self._spike_index: Optional[SpikeIndex] = None
 
     def get_soma_voltage(
         self, cell_id: CellId, t_start: float, t_end: float, t_step: Optional[float] = None
@@ -143,6 +194,32 @@ class SonataSimulationAccess:
             arr = _sample_array(arr, t_step, self.impl.dt)
         return arr
 
+    def get_soma_voltages(
+        self, cell_ids: Sequence[CellId], t_start: Optional[float] = None,
+        t_end: Optional[float] = None, t_step: Optional[float] = None
+    ) -> np.ndarray:
+        """Retrieve the soma voltages of cells of main simulation with a single
+        read of the report per population.
+
+        Returns:
+            A 2D array with a row per cell, in the order of cell_ids.
+        """
+        report = self.impl.reports["soma"]
+        population_ids: dict[str, list[int]] = {}
+        for cell_id in cell_ids:
+            population_ids.setdefault(cell_id.population_name, []).append(cell_id.id)
+        frames = {
+            population: report[population].get(ids, t_start, t_end)
+            for population, ids in population_ids.items()
+        }
+        voltages = [
+            frames[cell_id.population_name][cell_id.id].to_numpy()
+            for cell_id in cell_ids
+        ]
+        if t_step is not None:
+            voltages = [_sample_array(arr, t_step, self.impl.dt) for arr in voltages]
+        return np.vstack(voltages) if voltages else np.empty((0, 0))
+
     def get_soma_time_trace(self, t_step: Optional[float] = None) -> np.ndarray:
         report = self.impl.reports["soma"]
         arr = report.filter().report.index.values
@@ -165,3 +242,38 @@ class SonataSimulationAccess:
         outdat = outdat.apply(lambda x: x.index.values)
         outdat.index = [CellId(pop_name, idx) for (pop_name, idx) in outdat.index]
         return outdat.to_dict()
+
+    def get_spike_index(self, cell_ids: Optional[Iterable[CellId]] = None) -> SpikeIndex:
+        """Index of the spike report.
+
+        When cell_ids are given, only the spikes of these cells are read
+        from the report. Otherwise the whole report is read once.
+        """
+        if cell_ids is not None and self._spike_index is None:
+            return self._read_spike_index(cell_ids)
+        if self._spike_index is None:
+            report = self.impl.spikes.filter().report
+            self._spike_index = SpikeIndex.from_arrays(
+                report["population"].astype(str).to_numpy(),
+                report["ids"].to_numpy(),
+                report.index.to_numpy())
+        return self._spike_index
+
+    def _read_spike_index(self, cell_ids: Iterable[CellId]) -> SpikeIndex:
+        """Index of the spikes of cell_ids, read per population."""
+        population_ids: dict[str, set[int]] = {}
+        for cell_id in cell_ids:
+            population_ids.setdefault(cell_id.population_name, set()).add(cell_id.id)
+        spikes = self.impl.spikes
+        populations, ids, times = [], [], []
+        for population, node_ids in population_ids.items():
+            if population not in spikes.population_names:
+                continue
+            report = spikes[population].get(sorted(node_ids))
+            populations.append(np.full(len(report), population))
+            ids.append(report.to_numpy())
+            times.append(report.index.to_numpy())
+        if not populations:
+            return SpikeIndex({})
+        return SpikeIndex.from_arrays(
+            np.concatenate(populations), np.concatenate(ids), np.concatenate(times))
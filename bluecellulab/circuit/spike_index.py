@@ -0,0 +1,146 @@
+# Copyright 2012-2023 Blue Brain Project / EPFL
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Index of the spike trains of a simulation."""
+
+from __future__ import annotations
+from collections.abc import Iterable
+from typing import Optional
+
+import numpy as np
+
+from bluecellulab.circuit.node_id import CellId
+
+
+class SpikeIndex:
+    """Spike trains of the cells of a simulation, stored in CSR format.
+
+    For each population, the spiking ids are sorted and the spike times
+    are sorted by id, then by time. The train of the id at position i is
+    times[offsets[i]:offsets[i + 1]], so a train is looked up with a
+    binary search and returned as a view, without creating an array per
+    cell of the simulation.
+    """
+
+    def __init__(self, populations: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]]) -> None:
+        """Initialize the index.
+
+        Args:
+            populations: (ids, offsets, times) arrays of each population.
+        """
+        self.populations = populations
+
+    @classmethod
+    def from_arrays(cls, populations: Iterable[str] | np.ndarray, ids: np.ndarray,
+                    times: np.ndarray) -> SpikeIndex:
+        """Build the index of spikes given as population, id and time
+        arrays."""
+        populations = np.asarray(populations)
+        ids = np.asarray(ids, dtype=np.int64)
+        times = np.asarray(times, dtype=np.float64)
+        index = {}
+        for population in np.unique(populations):
+            in_population = populations == population
+            index[str(population)] = cls._population_arrays(
+                ids[in_population], times[in_population])
+        return cls(index)
+
+    @classmethod
+    def from_sorted_arrays(cls, population: str, ids: np.ndarray,
+                           times: np.ndarray) -> SpikeIndex:
+        """Build the index of the spikes of a population, sorted by id then by
+        time.
+
+        The times are not copied, e.g. they can be memory-mapped.
+        """
+        unique_ids, starts = np.unique(ids, return_index=True)
+        offsets = np.append(starts, len(ids))
+        return cls({population: (unique_ids, offsets, times)})
+
+    @classmethod
+    def from_dict(cls, trains: dict[CellId, Iterable]) -> SpikeIndex:
+        """Build the index of a CellId to spike train dictionary."""
+        populations, ids, times = [], [], []
+        for cell_id, train in trains.items():
+            train = np.asarray(train, dtype=np.float64)
+            populations.append(np.full(len(train), cell_id.population_name, dtype=object))
+            ids.append(np.full(len(train), cell_id.id, dtype=np.int64))
+            times.append(train)
+        if not trains:
+            return cls({})
+        return cls.from_arrays(np.concatenate(populations).astype(str),
+                               np.concatenate(ids), np.concatenate(times))
+
+    @staticmethod
+    def _population_arrays(ids: np.ndarray, times: np.ndarray
+                           ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        order = np.lexsort((times, ids))
+        ids = ids[order]
+        times = times[order]
+        unique_ids, starts = np.unique(ids, return_index=True)
+        offsets = np.append(starts, len(ids))
+        return unique_ids, offsets, times
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids, _, _ in self.populations.values())
+
+    def __contains__(self, cell_id: CellId) -> bool:
+        return self._position(cell_id) is not None
+
+    def _position(self, cell_id: CellId) -> Optional[int]:
+        if cell_id.population_name not in self.populations:
+            return None
+        ids = self.populations[cell_id.population_name][0]
+        pos = int(np.searchsorted(ids, cell_id.id))
+        if pos < len(ids) and ids[pos] == cell_id.id:
+            return pos
+        return None
+
+    def cell_ids(self) -> list[CellId]:
+        """The ids of the spiking cells."""
+        return [CellId(population, int(gid))
+                for population, (ids, _, _) in self.populations.items()
+                for gid in ids]
+
+    def get(self, cell_id: CellId, t_start: Optional[float] = None,
+            t_stop: Optional[float] = None) -> Optional[np.ndarray]:
+        """Spike train of cell_id, None if the cell doesn't spike.
+
+        When t_start or t_stop are given, only the spikes within
+        [t_start, t_stop] are returned.
+        """
+        pos = self._position(cell_id)
+        if pos is None:
+            return None
+        _, offsets, times = self.populations[cell_id.population_name]
+        train = times[offsets[pos]:offsets[pos + 1]]
+        if t_start is not None:
+            train = train[np.searchsorted(train, t_start, side="left"):]
+        if t_stop is not None:
+            train = train[:np.searchsorted(train, t_stop, side="right")]
+        return train
+
+    def get_trains(self, cell_ids: Iterable[CellId], t_start: Optional[float] = None,
+                   t_stop: Optional[float] = None) -> dict[CellId, np.ndarray]:
+        """Spike trains of the spiking cells among cell_ids, within [t_start,
+        t_stop] when they are given."""
+        trains = {}
+        for cell_id in cell_ids:
+            train = self.get(cell_id, t_start, t_stop)
+            if train is not None:
+                trains[cell_id] = train
+        return trains
+
+    def to_dict(self) -> dict[CellId, np.ndarray]:
+        """Spike trains of all the spiking cells."""
+        return self.get_trains(self.cell_ids())
@@ -0,0 +1,194 @@
+# Copyright 2012-2023 Blue Brain Project / EPFL
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent on-disk cache of the extracted synapses."""
+
+from __future__ import annotations
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from bluecellulab import lazy_printv
+from bluecellulab.circuit.node_id import CellId
+from bluecellulab.circuit.synapse_properties import SynapseProperty
+
+
+class SynapseCache:
+    """Stores the synapses of a cell from one edge population as npz files.
+
+    An entry holds the final synapses dataframe, i.e. after the renaming
+    of the properties, the delay rounding and the population columns are
+    added. The key of an entry is made of the edge file path and its
+    modification time, the edge population, the cell, the requested
+    properties and dt, so that modifying the edge file invalidates the
+    entries. When the total size of the cache exceeds max_size bytes,
+    evict removes the least recently used entries.
+    """
+
+    suffix = ".npz"
+
+    def __init__(self, cache_dir: str | Path, max_size: int = 2**30) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: directory of the cache, created if it doesn't exist.
+            max_size: maximum total size of the cache files in bytes.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+    @staticmethod
+    def edge_key(edge_file: str | Path, edge_name: str, properties: list,
+                 dt: float) -> str:
+        """Part of the keys shared by the cells of an edge population.
+
+        The edge file is stat-ed for its modification time, so the key
+        is computed once per edge population and then combined with each
+        cell by cell_key.
+        """
+        edge_file = Path(edge_file).resolve()
+        key_parts = (
+            str(edge_file),
+            os.stat(edge_file).st_mtime_ns,
+            edge_name,
+            tuple(str(prop) for prop in properties),
+            repr(float(dt)),
+        )
+        return repr(key_parts)
+
+    @staticmethod
+    def cell_key(edge_key: str, cell_id: CellId) -> str:
+        """Key of the synapses of a cell given the key of its edge
+        population."""
+        key_parts = (edge_key, cell_id.population_name, int(cell_id.id))
+        return hashlib.sha256(repr(key_parts).encode()).hexdigest()
+
+    @classmethod
+    def key(cls, edge_file: str | Path, edge_name: str, cell_id: CellId,
+            properties: list, dt: float) -> str:
+        """Key of the synapses of a cell from an edge population."""
+        return cls.cell_key(cls.edge_key(edge_file, edge_name, properties, dt), cell_id)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """Load the synapses of key, None if they are not in the cache."""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                synapses = _frame_from_arrays(dict(npz))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as error:
+            # unreadable entry, e.g. an interrupted write from an older version
+            lazy_printv("Ignoring corrupt synapse cache entry {path}: {error}",
+                        2, path=path, error=error)
+            path.unlink(missing_ok=True)
+            return None
+        # the modification time is the recency used by the eviction
+        os.utime(path)
+        return synapses
+
+    def save(self, key: str, synapses: pd.DataFrame) -> None:
+        """Store the synapses under key.
+
+        The old entries are not evicted, call evict once after saving a
+        batch of entries.
+        """
+        arrays = _frame_to_arrays(synapses)
+        # write to a temporary file first so that readers never see partial entries
+        fd, tmp_name = tempfile.mkstemp(suffix=self.suffix, dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                np.savez(tmp_file, **arrays)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def evict(self) -> None:
+        """Remove the least recently used entries above max_size."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by a concurrent process
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
+
+
+def _frame_to_arrays(synapses: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Convert a synapses dataframe to arrays that can be stored in npz.
+
+    The column names are either SynapseProperty members or strings.
+    """
+    arrays: dict[str, np.ndarray] = {
+        "column_names": np.array([_column_to_str(x) for x in synapses.columns], dtype=str),
+        "n_rows": np.array(len(synapses)),
+    }
+    if len(synapses.index.names) == 2:
+        arrays["index_edge_name"] = synapses.index.get_level_values(0).to_numpy(dtype=str)
+        arrays["index_synapse_id"] = synapses.index.get_level_values(1).to_numpy()
+    for idx, column in enumerate(synapses.columns):
+        values = synapses[column].to_numpy()
+        if values.dtype == object:
+            values = values.astype(str)
+        arrays[f"column_{idx}"] = values
+    return arrays
+
+
+def _frame_from_arrays(arrays: dict[str, np.ndarray]) -> pd.DataFrame:
+    """Inverse of _frame_to_arrays."""
+    if int(arrays["n_rows"]) == 0:
+        return pd.DataFrame()
+    columns = [_column_from_str(x) for x in arrays["column_names"]]
+    data = {}
+    for idx, column in enumerate(columns):
+        values = arrays[f"column_{idx}"]
+        if values.dtype.kind == "U":
+            values = values.astype(object)
+        data[column] = values
+    index = pd.MultiIndex.from_arrays(
+        [arrays["index_edge_name"].astype(object), arrays["index_synapse_id"]],
+        names=["edge_name", "synapse_id"])
+    return pd.DataFrame(data, index=index)
+
+
+def _column_to_str(column: SynapseProperty | str) -> str:
+    if isinstance(column, SynapseProperty):
+        return f"SynapseProperty.{column.name}"
+    return column
+
+
+def _column_from_str(column: str) -> SynapseProperty | str:
+    if column.startswith("SynapseProperty."):
+        return SynapseProperty[column.split(".", 1)[1]]
+    return column
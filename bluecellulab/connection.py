@@ -17,6 +17,20 @@ import bluecellulab
 from bluecellulab.circuit import SynapseProperty
 
 
+def create_replay_vecstim(pre_spiketrain, stim_dt=None):
+    """Create the time vector and the VecStim playing a spike train."""
+    if any(pre_spiketrain < 0):
+        raise ValueError("bluecellulab Connection: a spiketrain contains "
+                         "a negative time, this is not supported by "
+                         "NEURON's Vecstim: %s" %
+                         str(pre_spiketrain))
+    t_vec = bluecellulab.neuron.h.Vector(pre_spiketrain)
+    vecstim = bluecellulab.neuron.h.VecStim()
+    vecstim.play(t_vec, stim_dt)
+    # the VecStim doesn't keep a reference to its vector
+    return t_vec, vecstim
+
+
 class Connection:
     """Class that represents a connection between two cells in bluecellulab."""
 
@@ -28,7 +42,15 @@ class Connection:
             stim_dt=None,
             parallel_context=None,
             spike_threshold=-30,
-            spike_location="soma"):
+            spike_location="soma",
+            replay_stim=None):
+        """Connect the synapse to a replayed spike train or to a cell.
+
+        A replayed spike train is played by a VecStim. Pass the
+        replay_stim returned by create_replay_vecstim to share its
+        VecStim between the connections of the same presynaptic cell,
+        instead of creating one VecStim per connection.
+        """
         self.persistent = []
         self.delay = post_synapse.syn_description[SynapseProperty.AXONAL_DELAY]
         self.weight = post_synapse.syn_description[SynapseProperty.G_SYNX]
@@ -46,15 +68,10 @@ class Connection:
         self.post_netcon_delay = self.delay
         self.post_netcon_weight = self.weight * self.weight_scalar
 
-        if self.pre_spiketrain is not None:
-            if any(self.pre_spiketrain < 0):
-                raise ValueError("bluecellulab Connection: a spiketrain contains "
-                                 "a negative time, this is not supported by "
-                                 "NEURON's Vecstim: %s" %
-                                 str(self.pre_spiketrain))
-            t_vec = bluecellulab.neuron.h.Vector(self.pre_spiketrain)
-            vecstim = bluecellulab.neuron.h.VecStim()
-            vecstim.play(t_vec, stim_dt)
+        if self.pre_spiketrain is not None or replay_stim is not None:
+            if replay_stim is None:
+                replay_stim = create_replay_vecstim(self.pre_spiketrain, stim_dt)
+            t_vec, vecstim = replay_stim
             self.post_netcon = bluecellulab.neuron.h.NetCon(
                 vecstim, self.post_synapse.hsynapse,
                 spike_threshold,
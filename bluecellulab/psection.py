@@ -15,50 +15,63 @@
 
 import bluecellulab
 from bluecellulab import neuron
+from bluecellulab.cell.topology import section_type_from_name
 
 
 class PSection:
     """Class that represents a cell section."""
 
-    def __init__(self, hsection, isec=None):
+    def __init__(self, hsection, isec=None, section_type=None):
         self.L = hsection.L
         self.diam = hsection.diam
         self.hsection = hsection
         self.name = neuron.h.secname(sec=hsection)
-        self.href = neuron.h.SectionRef(sec=self.hsection)
+        self._href = None
         self.pparent = None
         self.pchildren = []
+        # whether pchildren holds all the children, see Cell.init_psections
+        self.pchildren_populated = False
         self.isec = isec
 
-        if 'apic' in self.name:
-            self.section_type = 'apical'
-        elif 'dend' in self.name:
-            self.section_type = 'basal'
-        elif 'soma' in self.name:
-            self.section_type = 'somatic'
-        elif 'axon' in self.name:
-            self.section_type = 'axonal'
-        elif 'myelin' in self.name:
-            self.section_type = 'myelin'
-        else:
-            raise Exception(
-                "PSection: Section of unknown type: %s" %
-                self.name)
-
-        self.psegments = []
-        self.maxsegdiam = 0
-        for hsegment in hsection:
-            # psegment = bluecellulab.PSegment(hsection(hsegment.x), self)
-            psegment = bluecellulab.PSegment(hsegment, self)
-            self.psegments.append(psegment)
-            self.maxsegdiam = max(self.maxsegdiam, psegment.diam)
+        if section_type is None:
+            try:
+                section_type = section_type_from_name(self.name)
+            except ValueError as e:
+                raise Exception(
+                    "PSection: Section of unknown type: %s" %
+                    self.name) from e
+        self.section_type = section_type
+
+        self._psegments = None
 
         self.xSpacing = 1
         self.ySpacing = 5
 
+    @property
+    def href(self):
+        """Return the SectionRef of the section, created on first use."""
+        if self._href is None:
+            self._href = neuron.h.SectionRef(sec=self.hsection)
+        return self._href
+
+    @property
+    def psegments(self):
+        """Return the python segments, created on first use (for drawing)."""
+        if self._psegments is None:
+            self._psegments = [bluecellulab.PSegment(hsegment, self)
+                               for hsegment in self.hsection]
+        return self._psegments
+
+    @property
+    def maxsegdiam(self):
+        """Return the largest diameter of the segments."""
+        return max((hsegment.diam for hsegment in self.hsection), default=0)
+
     @property
     def isLeaf(self):
         """Return true if section is a leaf in the morphological structure."""
+        if self.pchildren_populated:
+            return not self.pchildren
         return not self.hchildren
 
     @property
@@ -23,9 +23,6 @@ class PSegment:
     """A python representation of a segment."""
 
     def __init__(self, hsegment, parentsection):
-        # import matplotlib as plt
-        from matplotlib import cm
-
         self.hsegment = hsegment
         self.parentsection = parentsection
         self.L = self.parentsection.L / self.parentsection.hsection.nseg
@@ -34,7 +31,7 @@ class PSegment:
         self.figure = None
         self.figX = None
         self.figY = None
-        self.color_map = cm.get_cmap("hot")
+        self.color_map = None
         self.ax = None
         self.patch = None
         self.plotvariable = None
@@ -44,8 +41,10 @@ class PSegment:
     def setupDraw(self, figure, x, y, variable=None, varbounds=None):
         """Set up the drawing of a segment."""
         import matplotlib as plt
+        from matplotlib import cm
 
         self.figure = figure
+        self.color_map = cm.get_cmap("hot")
         self.plotvariable = variable
         self.varbounds = varbounds
         self.ax = self.figure.gca()
@@ -1,6 +1,7 @@
 """Simulation module responsible of NEURON simulation."""
 
 from .simulation import Simulation
+from .recorder import StreamingRecorder
 from .neuron_globals import set_global_condition_parameters
 from .neuron_globals import set_minis_single_vesicle_values
 from .neuron_globals import set_tstop_value
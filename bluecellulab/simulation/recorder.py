@@ -0,0 +1,237 @@
+# Copyright 2012-2023 Blue Brain Project / EPFL
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming of the recordings to disk during a simulation."""
+
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+import struct
+from typing import Any, Optional
+
+import numpy as np
+
+from bluecellulab import lazy_printv
+from bluecellulab.exceptions import BluecellulabError, ExtraDependencyMissingError
+from bluecellulab.importer import neuron
+
+NeuronType = Any
+
+HDF5_SUFFIXES = (".h5", ".hdf5")
+
+
+class StreamingRecorder:
+    """Flushes the recording Vectors to disk periodically during a run.
+
+    Every flush_interval ms of simulated time, the content of the
+    recorded Vectors is appended to the output and the Vectors are
+    emptied, so that the memory used by the recordings stays bounded
+    whatever the duration of the simulation. The flushes are CVode
+    events, as the ones of the progress bar. With the fixed time step
+    the recorded values are identical to the ones of a run without
+    recorder, with CVode the events also bound the integration steps.
+
+    The output is an HDF5 file (requires h5py) if output_path has a .h5
+    or .hdf5 suffix, otherwise a directory with one .npy file per
+    recording. Use StreamingRecorder.load to read it back. The output is
+    created by the first run of the recorder, the values of the next
+    runs are appended to it.
+    """
+
+    def __init__(self, output_path: str | Path, flush_interval: float = 100.0) -> None:
+        """Initialize the recorder.
+
+        Args:
+            output_path: HDF5 file or directory the recordings are written to.
+            flush_interval: simulated time in ms between two flushes.
+        """
+        if flush_interval <= 0:
+            raise BluecellulabError("StreamingRecorder: flush_interval must be positive")
+        self.output_path = Path(output_path)
+        self.flush_interval = flush_interval
+        self.recordings: dict[str, NeuronType] = {}
+        self.fih_flush = None
+        self._writer: Optional[_HDF5Writer | _NpyWriter] = None
+        self._output_created = False
+
+    def add_recordings(self, recordings: dict[str, NeuronType], prefix: str = "") -> None:
+        """Stream the recording Vectors, stored as prefix/name."""
+        for name, vector in recordings.items():
+            key = f"{prefix}/{name}" if prefix else name
+            self.recordings[key] = vector
+
+    def add_cell(self, cell, prefix: Optional[str] = None) -> None:
+        """Stream all the recordings added to the cell so far.
+
+        The recordings are stored under the hoc name of the cell unless
+        a prefix is given. After the run, the recordings of the cell
+        only hold the values recorded since the last flush, the complete
+        recordings are in the output.
+        """
+        if prefix is None:
+            prefix = cell.hocname
+        self.add_recordings(cell.recordings, prefix)
+        for name in cell.recordings:
+            cell.streamed_recordings[name] = self.output_path
+
+    def start(self) -> None:
+        """Open the output at the next finitialize and schedule the flushes."""
+        if self.fih_flush is None:
+            self.fih_flush = neuron.h.FInitializeHandler(1, self.init_flush_callback)
+
+    def init_flush_callback(self) -> None:
+        """Create or reopen the output and schedule the first flush."""
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = _open_writer(
+            self.output_path, list(self.recordings), append=self._output_created)
+        self._output_created = True
+        neuron.h.cvode.event(neuron.h.t + self.flush_interval, self.flush_callback)
+
+    def flush_callback(self) -> None:
+        """Callback function of the periodic flushes."""
+        self.flush()
+        neuron.h.cvode.event(neuron.h.t + self.flush_interval, self.flush_callback)
+
+    def flush(self) -> None:
+        """Append the recorded values to the output and empty the Vectors."""
+        if self._writer is None:
+            return
+        lazy_printv("Flushing {n} recordings at t={t} ms", 50,
+                    n=len(self.recordings), t=neuron.h.t)
+        for key, vector in self.recordings.items():
+            self._writer.append(key, vector.as_numpy())
+            vector.resize(0)
+
+    def close(self) -> None:
+        """Flush the remaining values and finalize the output."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        # the handler is removed so that later finitialize calls,
+        # e.g. when creating a cell, don't truncate the output
+        self.fih_flush = None
+
+    @staticmethod
+    def load(output_path: str | Path) -> dict[str, np.ndarray]:
+        """Load the recordings written by a StreamingRecorder.
+
+        The .npy recordings are memory-mapped.
+        """
+        output_path = Path(output_path)
+        if output_path.suffix in HDF5_SUFFIXES:
+            h5py = _import_h5py()
+            recordings: dict[str, np.ndarray] = {}
+            with h5py.File(output_path, "r") as h5_file:
+                h5_file.visititems(
+                    lambda name, obj: recordings.__setitem__(name, obj[()])
+                    if isinstance(obj, h5py.Dataset) else None)
+            return recordings
+        with open(output_path / _NpyWriter.index_name) as index_file:
+            file_names = json.load(index_file)
+        return {key: np.load(output_path / file_name, mmap_mode="r")
+                for key, file_name in file_names.items()}
+
+
+def _import_h5py():
+    try:
+        import h5py
+    except ImportError as error:
+        raise ExtraDependencyMissingError("h5py") from error
+    return h5py
+
+
+def _open_writer(output_path: Path, keys: list[str],
+                 append: bool) -> _HDF5Writer | _NpyWriter:
+    if output_path.suffix in HDF5_SUFFIXES:
+        return _HDF5Writer(output_path, keys, append)
+    return _NpyWriter(output_path, keys, append)
+
+
+class _HDF5Writer:
+    """Appends the recordings to resizable HDF5 datasets."""
+
+    def __init__(self, output_path: Path, keys: list[str], append: bool) -> None:
+        h5py = _import_h5py()
+        self.h5_file = h5py.File(output_path, "a" if append else "w")
+        for key in keys:
+            if key not in self.h5_file:
+                self.h5_file.create_dataset(
+                    key, shape=(0,), maxshape=(None,), dtype=np.float64, chunks=True)
+
+    def append(self, key: str, values: np.ndarray) -> None:
+        dataset = self.h5_file[key]
+        n_values = dataset.shape[0]
+        dataset.resize((n_values + len(values),))
+        dataset[n_values:] = values
+
+    def close(self) -> None:
+        self.h5_file.close()
+
+
+class _NpyWriter:
+    """Appends the recordings to .npy files in a directory.
+
+    The data is appended after a fixed size header, whose shape is
+    rewritten when the writer is closed.
+    """
+
+    index_name = "recordings.json"
+    header_size = 128
+
+    def __init__(self, output_path: Path, keys: list[str], append: bool) -> None:
+        output_path.mkdir(parents=True, exist_ok=True)
+        file_names: dict[str, str] = {}
+        if append:
+            with open(output_path / self.index_name) as index_file:
+                file_names = json.load(index_file)
+        appended = set(file_names)
+        for key in keys:
+            file_names.setdefault(key, f"recording_{len(file_names)}.npy")
+        with open(output_path / self.index_name, "w") as index_file:
+            json.dump(file_names, index_file, indent=1)
+        self.files = {}
+        self.sizes = {}
+        for key in keys:
+            file_path = output_path / file_names[key]
+            if key in appended:
+                npy_file = open(file_path, "r+b")
+                np.lib.format.read_magic(npy_file)
+                shape, _, _ = np.lib.format.read_array_header_1_0(npy_file)
+                self.sizes[key] = shape[0]
+                npy_file.seek(0, os.SEEK_END)
+            else:
+                npy_file = open(file_path, "w+b")
+                self.sizes[key] = 0
+                self._write_header(npy_file, 0)
+            self.files[key] = npy_file
+
+    def _write_header(self, npy_file, n_values: int) -> None:
+        header = repr({"descr": "<f8", "fortran_order": False, "shape": (n_values,)})
+        # magic string (6 bytes), version (2 bytes), header length (2 bytes)
+        header = header.ljust(self.header_size - 10 - 1) + "\n"
+        npy_file.write(np.lib.format.magic(1, 0))
+        npy_file.write(struct.pack("<H", len(header)))
+        npy_file.write(header.encode("latin1"))
+
+    def append(self, key: str, values: np.ndarray) -> None:
+        self.files[key].write(np.ascontiguousarray(values, dtype="<f8").tobytes())
+        self.sizes[key] += len(values)
+
+    def close(self) -> None:
+        for key, npy_file in self.files.items():
+            npy_file.seek(0)
+            self._write_header(npy_file, self.sizes[key])
+            npy_file.close()
@@ -22,6 +22,7 @@ import bluecellulab
 import contextlib
 from bluecellulab import lazy_printv, printv_err
 from bluecellulab.importer import neuron
+from bluecellulab.simulation.recorder import StreamingRecorder
 
 
 class Simulation:
@@ -34,11 +35,16 @@ class Simulation:
         self.progress_closed = None
         self.progress_dt: Optional[float] = None
         self.pc = parallel_context
+        self.recorders: list[StreamingRecorder] = []
 
     def add_cell(self, new_cell: bluecellulab.Cell) -> None:
         """Add a cell to a simulation."""
         self.cells.append(new_cell)
 
+    def add_recorder(self, recorder: StreamingRecorder) -> None:
+        """Add a recorder streaming recordings to disk during the runs."""
+        self.recorders.append(recorder)
+
     def init_progress_callback(self):
         """Initiziale the progress bar callback."""
         self.progress = 0
@@ -144,6 +150,9 @@ class Simulation:
 
         self.init_callbacks()
 
+        for recorder in self.recorders:
+            recorder.start()
+
         neuron.h.stdinit()
 
         if forward_skip:
@@ -168,6 +177,8 @@ class Simulation:
                        "Reason: % s: % s" % (
                            exception.__class__.__name__, exception), 1)
         finally:
+            for recorder in self.recorders:
+                recorder.close()
             if cvode_old_status:
                 lazy_printv(
                     "WARNING: cvode was activated outside of Simulation, "
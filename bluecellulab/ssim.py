@@ -19,7 +19,9 @@ simulations."""
 from __future__ import annotations
 from collections.abc import Iterable
 from collections import defaultdict
+import multiprocessing
 from pathlib import Path
+import pickle
 from typing import Optional
 
 import numpy as np
@@ -28,11 +30,13 @@ import bluecellulab
 from bluecellulab import lazy_printv
 from bluecellulab.cell import CellDict
 from bluecellulab.cell.sonata_proxy import SonataProxy
-from bluecellulab.circuit import CellId, SimulationValidator, SynapseProperty
+from bluecellulab.connection import create_replay_vecstim
+from bluecellulab.circuit import CellId, SimulationValidator, SynapseCache, SynapseProperty
 from bluecellulab.circuit.circuit_access import (
     CircuitAccess,
     BluepyCircuitAccess,
     SonataCircuitAccess,
+    ConnectionParametersResolver,
     get_synapse_connection_parameters
 )
 from bluecellulab.circuit.config import SimulationConfig
@@ -44,7 +48,8 @@ import bluecellulab.stimuli as stimuli
 from bluecellulab.exceptions import BluecellulabError
 from bluecellulab.simulation import (
     set_global_condition_parameters,
-    set_tstop_value
+    set_tstop_value,
+    StreamingRecorder
 )
 
 
@@ -60,6 +65,8 @@ class SSim:
         base_noise_seed: Optional[int] = None,
         rng_mode: Optional[str] = None,
         print_cellstate: bool = False,
+        synapse_cache: Optional[SynapseCache] = None,
+        spike_index_dir: Optional[str | Path] = None,
     ):
         """
 
@@ -83,17 +90,38 @@ class SSim:
                     and UpdatedMCell.
         print_cellstate:
                     Flag to use NEURON prcellstate for simulation GIDs
+        synapse_cache:
+                    Optional on-disk cache of the extracted synapses, reused
+                    across runs. Only used for SONATA circuits.
+        spike_index_dir:
+                    Optional directory of the memory-mapped indices of the
+                    out.dat spikes, reused across runs. Only used for
+                    BluePy simulations.
         """
         self.dt = dt
         self.record_dt = record_dt
+        # used to create identical SSims in worker processes
+        self._init_kwargs = {
+            "simulation_config": simulation_config,
+            "dt": dt,
+            "record_dt": record_dt,
+            "base_seed": base_seed,
+            "base_noise_seed": base_noise_seed,
+            "rng_mode": rng_mode,
+            "print_cellstate": print_cellstate,
+            "synapse_cache": synapse_cache,
+            "spike_index_dir": spike_index_dir,
+        }
 
         self.circuit_format = determine_circuit_format(simulation_config)
         if self.circuit_format == CircuitFormat.SONATA:
-            self.circuit_access: CircuitAccess = SonataCircuitAccess(simulation_config)
+            self.circuit_access: CircuitAccess = SonataCircuitAccess(
+                simulation_config, synapse_cache=synapse_cache)
             self.simulation_access: SimulationAccess = SonataSimulationAccess(simulation_config)
         else:
             self.circuit_access = BluepyCircuitAccess(simulation_config)
-            self.simulation_access = BluepySimulationAccess(simulation_config)
+            self.simulation_access = BluepySimulationAccess(
+                simulation_config, spike_index_dir=spike_index_dir)
             SimulationValidator(self.circuit_access).validate()
 
         self.pc = bluecellulab.neuron.h.ParallelContext() if print_cellstate else None
@@ -140,6 +168,8 @@ class SSim:
         pre_spike_trains: None | dict[tuple[str, int], Iterable] | dict[int, Iterable] = None,
         add_shotnoise_stimuli: bool = False,
         add_ornstein_uhlenbeck_stimuli: bool = False,
+        share_replay_vecstims: bool = False,
+        replay_window: Optional[tuple[Optional[float], Optional[float]]] = None,
     ):
         """Instantiate a list of cells.
 
@@ -210,6 +240,17 @@ class SSim:
                             of the simulation config,
                             Setting add_stimuli=True,
                             will automatically set this option to True.
+        share_replay_vecstims :
+                            Play the replayed spike train of a presynaptic
+                            cell with a single VecStim, connected to all
+                            its synapses by NetCons with their own delays
+                            and weights, instead of one VecStim per synapse.
+        replay_window : (t_start, t_stop) window of the replayed spikes,
+                        e.g. (None, t_stop) with the t_stop of run, since the
+                        spikes after t_stop can't reach the synapses before
+                        the end of the simulation. The spikes outside of the
+                        window are neither read nor played. A None bound
+                        doesn't clip the spike trains.
         """
         if not isinstance(cells, Iterable) or isinstance(cells, tuple):
             cells = [cells]
@@ -282,7 +323,9 @@ class SSim:
                                 "add_synapses is False")
             self._add_connections(add_replay=add_replay,
                                   interconnect_cells=interconnect_cells,
-                                  user_pre_spike_trains=pre_spike_trains)  # type: ignore
+                                  user_pre_spike_trains=pre_spike_trains,  # type: ignore
+                                  share_replay_vecstims=share_replay_vecstims,
+                                  replay_window=replay_window)
 
     def _add_stimuli(self, add_noise_stimuli=False,
                      add_hyperpolarizing_stimuli=False,
@@ -358,18 +401,21 @@ class SSim:
     def _add_synapses(
             self, pre_gids=None, add_minis=False, projections=None):
         """Instantiate all the synapses."""
+        syn_descriptions = self.get_syn_descriptions_for_cells(
+            list(self.cells), projections=projections, pre_cell_ids=pre_gids)
+        connection_resolver = ConnectionParametersResolver(self.circuit_access)
         for cell_id in self.cells:
             self._add_cell_synapses(
-                cell_id, pre_gids=pre_gids,
-                add_minis=add_minis,
-                projections=projections)
+                cell_id, syn_descriptions[cell_id],
+                pre_gids=pre_gids, add_minis=add_minis,
+                connection_resolver=connection_resolver)
 
     def _add_cell_synapses(
-        self, cell_id: CellId, pre_gids=None, add_minis=False, projections=None
+        self, cell_id: CellId, syn_descriptions: pd.DataFrame, pre_gids=None, add_minis=False,
+        connection_resolver: Optional[ConnectionParametersResolver] = None
     ) -> None:
-        syn_descriptions = self.get_syn_descriptions(
-            cell_id, projections=projections)
-
+        if connection_resolver is None:
+            connection_resolver = ConnectionParametersResolver(self.circuit_access)
         if pre_gids is not None:
             if self.circuit_format == CircuitFormat.SONATA:
                 syn_descriptions = self._intersect_pre_gids_cell_ids_multipopulation(
@@ -385,10 +431,24 @@ class SSim:
                 "Warning: No presynaptic cells found for gid {gid}, "
                 "no synapses added", 2, gid=cell_id)
         else:
-            for idx, syn_description in syn_descriptions.iterrows():
-                popids = syn_description["source_popid"], syn_description["target_popid"]
-                self._instantiate_synapse(cell_id, idx, syn_description,
-                                          add_minis=add_minis, popids=popids)
+            # everything that doesn't need NEURON is computed column-wise
+            syn_records = bluecellulab.synapse.Synapse.prepare_syn_descriptions(
+                syn_descriptions, self.circuit_access.config.extracellular_calcium)
+            locations = self.cells[cell_id].synapse_locations(syn_descriptions)
+            pre_gid_column = syn_descriptions[SynapseProperty.PRE_GID].to_numpy().astype(int)
+            connection_parameters = {
+                pre_gid: connection_resolver.resolve(
+                    CellId(cell_id.population_name, pre_gid), cell_id)
+                for pre_gid in map(int, np.unique(pre_gid_column))
+            }
+            popids = zip(syn_descriptions["source_popid"].to_numpy(),
+                         syn_descriptions["target_popid"].to_numpy())
+            for syn_id, syn_record, location, pre_gid, syn_popids in zip(
+                    syn_descriptions.index, syn_records, locations, pre_gid_column, popids):
+                self._instantiate_synapse(
+                    cell_id, syn_id, syn_record, add_minis=add_minis, popids=syn_popids,
+                    syn_connection_parameters=connection_parameters[pre_gid],
+                    location=location)
             lazy_printv("Added {s_desc_len} synapses for gid {gid}",
                         2, s_desc_len=len(syn_descriptions), gid=cell_id)
             if add_minis:
@@ -406,14 +466,14 @@ class SSim:
 
         Supports multipopulations.
         """
-        filtered_rows = syn_descriptions.apply(
-            lambda row: any(
-                cell.population_name == row["source_population_name"] and row[SynapseProperty.PRE_GID] == cell.id
-                for cell in pre_cell_ids
-            ),
-            axis=1,
-        )
-        return syn_descriptions[filtered_rows]
+        if syn_descriptions.empty or len(pre_cell_ids) == 0:
+            return syn_descriptions.iloc[0:0]
+        pre_cells = pd.MultiIndex.from_tuples(
+            [(cell.population_name, cell.id) for cell in pre_cell_ids])
+        synapse_pre_cells = pd.MultiIndex.from_arrays([
+            syn_descriptions["source_population_name"],
+            syn_descriptions[SynapseProperty.PRE_GID].astype(np.int64)])
+        return syn_descriptions[synapse_pre_cells.isin(pre_cells)]
 
     def get_syn_descriptions(
         self, cell_id: int | tuple[str, int], projections=None
@@ -434,6 +494,45 @@ class SSim:
                 projections,
             )
 
+    def get_syn_descriptions_for_cells(
+        self, cell_ids: list[int] | list[tuple[str, int] | CellId], projections=None,
+        pre_cell_ids: Optional[list[CellId]] = None
+    ) -> dict[CellId, pd.DataFrame]:
+        """Get the synapse descriptions dataframes of multiple cells.
+
+        The synapses of all the cells are extracted at once from the
+        circuit and then split per cell. Cells without synapses are
+        mapped to an empty dataframe. If pre_cell_ids is given, only the
+        synapses of those presynaptic cells are extracted.
+        """
+        post_cell_ids = create_cell_ids(cell_ids)
+        syn_description_builder = bluecellulab.synapse.SynDescription()
+        if self.circuit_access.config.is_glusynapse_used:
+            all_syn_descriptions = syn_description_builder.glusynapse_syn_descriptions(
+                self.circuit_access,
+                post_cell_ids,
+                projections,
+                pre_cell_ids,
+            )
+        else:
+            all_syn_descriptions = syn_description_builder.gabaab_ampanmda_syn_descriptions(
+                self.circuit_access,
+                post_cell_ids,
+                projections,
+                pre_cell_ids,
+            )
+
+        syn_descriptions = {cell_id: pd.DataFrame() for cell_id in post_cell_ids}
+        if all_syn_descriptions.empty:
+            return syn_descriptions
+        for (population_name, gid), cell_syn_descriptions in all_syn_descriptions.groupby(
+                level=[0, 1], sort=False):
+            # drop the properties that are absent from all the edges of the cell
+            cell_syn_descriptions = cell_syn_descriptions.droplevel([0, 1]).dropna(
+                axis=1, how="all")
+            syn_descriptions[CellId(population_name, int(gid))] = cell_syn_descriptions
+        return syn_descriptions
+
     @staticmethod
     def merge_pre_spike_trains(*train_dicts) -> dict[CellId, np.ndarray]:
         """Merge presynaptic spike train dicts."""
@@ -445,6 +544,16 @@ class SSim:
             for k in all_keys
         }
 
+    @staticmethod
+    def _clip_spike_train(train: np.ndarray, t_start: Optional[float],
+                          t_stop: Optional[float]) -> np.ndarray:
+        """Spikes of train within [t_start, t_stop]."""
+        if t_start is not None:
+            train = train[train >= t_start]
+        if t_stop is not None:
+            train = train[train <= t_stop]
+        return train
+
     # pylint: disable=R0913
     def _add_connections(
             self,
@@ -452,16 +561,32 @@ class SSim:
             interconnect_cells=None,
             source=None,
             dest=None,
-            user_pre_spike_trains: None | dict[CellId, Iterable] = None):
+            user_pre_spike_trains: None | dict[CellId, Iterable] = None,
+            share_replay_vecstims: bool = False,
+            replay_window: Optional[tuple[Optional[float], Optional[float]]] = None):
         """Instantiate the (replay and real) connections in the network."""
+        t_start, t_stop = replay_window if replay_window is not None else (None, None)
         if add_replay:
-            pre_spike_trains = self.simulation_access.get_spikes()
+            # only the spikes of the presynaptic cells are read from the report
+            pre_gids = {
+                CellId(post_gid.population_name, int(pre_gid))
+                for post_gid in self.cells
+                for pre_gid in self.cells[post_gid].pre_gids()
+            }
+            pre_spike_trains = self.simulation_access.get_spike_index(
+                pre_gids).get_trains(pre_gids, t_start, t_stop)
         else:
             pre_spike_trains = {}
 
+        if user_pre_spike_trains and replay_window is not None:
+            user_pre_spike_trains = {
+                pre_gid: self._clip_spike_train(np.asarray(train), t_start, t_stop)
+                for pre_gid, train in user_pre_spike_trains.items()}
         pre_spike_trains = self.merge_pre_spike_trains(
             pre_spike_trains,
             user_pre_spike_trains)
+        # (time vector, VecStim) of each presynaptic cell when they are shared
+        replay_stims: dict[CellId, tuple] = {}
 
         for post_gid in self.cells:
             if dest and post_gid not in dest:
@@ -498,14 +623,21 @@ class SSim:
                     lazy_printv(f"Added real connection between {pre_gid} and \
                             {post_gid}, {syn_id}", 5)
                 else:
-                    pre_spiketrain = pre_spike_trains.setdefault(pre_gid, None)  # type: ignore
+                    pre_spiketrain = pre_spike_trains.get(pre_gid)
+                    replay_stim = None
+                    if share_replay_vecstims and pre_spiketrain is not None:
+                        if pre_gid not in replay_stims:
+                            replay_stims[pre_gid] = create_replay_vecstim(
+                                pre_spiketrain, self.dt)
+                        replay_stim = replay_stims[pre_gid]
                     connection = bluecellulab.Connection(
                         self.cells[post_gid].synapses[syn_id],
                         pre_spiketrain=pre_spiketrain,
                         pre_cell=None,
                         stim_dt=self.dt,
                         spike_threshold=self.spike_threshold,
-                        spike_location=self.spike_location)
+                        spike_location=self.spike_location,
+                        replay_stim=replay_stim)
                     lazy_printv(
                         f"Added replay connection from {pre_gid} to "
                         f"{post_gid}, {syn_id}", 5)
@@ -535,20 +667,26 @@ class SSim:
                 self.pc.cell(cell_id.id, nc)  # register cell spike detector
 
     def _instantiate_synapse(self, cell_id: CellId, syn_id, syn_description,
-                             add_minis=False, popids=(0, 0)) -> None:
-        """Instantiate one synapse for a given gid, syn_id and
-        syn_description."""
-        pre_cell_id = CellId(cell_id.population_name, int(syn_description[SynapseProperty.PRE_GID]))
-        syn_connection_parameters = get_synapse_connection_parameters(
-            circuit_access=self.circuit_access,
-            pre_cell=pre_cell_id,
-            post_cell=cell_id)
+                             add_minis=False, popids=(0, 0),
+                             syn_connection_parameters=None, location=None) -> None:
+        """Instantiate one synapse for a given gid, syn_id and syn_description.
+
+        The connection parameters and the location of the synapse are
+        computed here unless they are given.
+        """
+        if syn_connection_parameters is None:
+            pre_cell_id = CellId(cell_id.population_name, int(syn_description[SynapseProperty.PRE_GID]))
+            syn_connection_parameters = get_synapse_connection_parameters(
+                circuit_access=self.circuit_access,
+                pre_cell=pre_cell_id,
+                post_cell=cell_id)
         if syn_connection_parameters["add_synapse"]:
             condition_parameters = self.circuit_access.config.condition_parameters()
 
             self.cells[cell_id].add_replay_synapse(
                 syn_id, syn_description, syn_connection_parameters, condition_parameters,
-                popids=popids, extracellular_calcium=self.circuit_access.config.extracellular_calcium)
+                popids=popids, extracellular_calcium=self.circuit_access.config.extracellular_calcium,
+                location=location)
             if add_minis:
                 mini_frequencies = self.circuit_access.fetch_mini_frequencies(cell_id)
                 lazy_printv('Adding minis for synapse {sid}: syn_description={s_desc}, '
@@ -578,6 +716,7 @@ class SSim:
         forward_skip_value: Optional[float] = None,
         cvode: bool = False,
         show_progress: bool = False,
+        recorder: Optional[StreamingRecorder] = None,
     ):
         """Simulate the SSim.
 
@@ -601,6 +740,8 @@ class SSim:
         show_progress: Show a progress bar during simulations. When
                        enabled results from a large network simulation
                        will not be exactly reproduced.
+        recorder: StreamingRecorder writing the recordings to disk during
+                  the run, e.g. to bound the memory of long simulations.
         """
         if t_stop is None:
             duration = self.circuit_access.config.duration
@@ -620,6 +761,8 @@ class SSim:
         sim = bluecellulab.Simulation(self.pc)
         for cell_id in self.cells:
             sim.add_cell(self.cells[cell_id])
+        if recorder is not None:
+            sim.add_recorder(recorder)
 
         if show_progress:
             lazy_printv("Warning: show_progress enabled, this will very likely"
@@ -636,6 +779,70 @@ class SSim:
             forward_skip_value=forward_skip_value,
             show_progress=show_progress)
 
+    def run_cells_parallel(
+        self,
+        cell_ids: list[int] | list[tuple[str, int]],
+        n_workers: Optional[int] = None,
+        instantiate_kwargs: Optional[dict] = None,
+        run_kwargs: Optional[dict] = None,
+    ) -> dict[CellId, dict[str, np.ndarray]]:
+        """Simulate disconnected cells in parallel worker processes.
+
+        The cell ids are split in n_workers shards. Each worker starts a fresh
+        NEURON instance, creates an SSim with the same arguments as this one
+        (they must be picklable, e.g. the simulation_config given as a path),
+        instantiates its shard with interconnect_cells=False and runs it.
+        Since the cells are not connected and all the random streams are
+        seeded per cell, every cell gives the same result as in a serial
+        simulation. This SSim itself is left untouched.
+
+        Parameters
+        ----------
+        cell_ids : The cells to simulate.
+        n_workers : Number of worker processes, defaults to the number of CPUs.
+        instantiate_kwargs : Keyword arguments of instantiate_gids,
+                             e.g. add_synapses, add_replay or add_stimuli.
+        run_kwargs : Keyword arguments of run, e.g. t_stop.
+
+        Returns:
+            A dictionary keyed by CellId whose values are dictionaries with
+            the "time" and "voltage" traces, negative times removed, and the
+            recorded "spikes".
+        """
+        instantiate_kwargs = dict(instantiate_kwargs or {})
+        if instantiate_kwargs.pop("interconnect_cells", False):
+            raise BluecellulabError(
+                "run_cells_parallel only supports interconnect_cells=False")
+        instantiate_kwargs["interconnect_cells"] = False
+        run_kwargs = dict(run_kwargs or {})
+
+        all_cell_ids = create_cell_ids(cell_ids)
+        if n_workers is None:
+            n_workers = multiprocessing.cpu_count()
+        n_workers = max(1, min(n_workers, len(all_cell_ids)))
+        shards = [all_cell_ids[idx::n_workers] for idx in range(n_workers)]
+
+        # the arguments are sent to the spawned workers
+        try:
+            pickle.dumps(self._init_kwargs)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            raise BluecellulabError(
+                "run_cells_parallel needs picklable SSim arguments, pass the "
+                f"simulation_config as a path: {error}") from error
+
+        # spawn, so that the workers don't inherit the NEURON state of this process
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(n_workers) as pool:
+            shard_results = pool.map(
+                _run_cells_subprocess,
+                [(self._init_kwargs, shard, instantiate_kwargs, run_kwargs)
+                 for shard in shards])
+
+        results: dict[CellId, dict[str, np.ndarray]] = {}
+        for shard_result in shard_results:
+            results.update(shard_result)
+        return {cell_id: results[cell_id] for cell_id in all_cell_ids}
+
     def get_mainsim_voltage_trace(
             self, cell_id: int | tuple[str, int], t_start=None, t_stop=None, t_step=None
     ) -> np.ndarray:
@@ -655,41 +862,69 @@ class SSim:
         cell_id = create_cell_id(cell_id)
         return self.simulation_access.get_soma_voltage(cell_id, t_start, t_stop, t_step)
 
+    def get_mainsim_voltage_traces(
+            self, cell_ids: list[int] | list[tuple[str, int]], t_start=None, t_stop=None,
+            t_step=None
+    ) -> np.ndarray:
+        """Get the voltage traces of cells from the main simulation, reading
+        the report once instead of once per cell.
+
+        Parameters
+        -----------
+        cell_ids: cell ids of interest.
+        t_start, t_stop: time range of interest,
+        report time range is used by default.
+        t_step: time step (should be a multiple of report time step T;
+        equals T by default)
+
+        Returns:
+            Two dimensional np.ndarray with the voltages of a cell per row,
+            in the order of cell_ids.
+        """
+        return self.simulation_access.get_soma_voltages(
+            create_cell_ids(cell_ids), t_start, t_stop, t_step)
+
     def get_mainsim_time_trace(self) -> np.ndarray:
         """Get the time trace from the main simulation."""
         return self.simulation_access.get_soma_time_trace()
 
-    def get_time(self) -> np.ndarray:
+    def get_time(self, copy: bool = True) -> np.ndarray:
         """Get the time vector for the recordings, contains negative times.
 
-        The negative times occur as a result of ForwardSkip.
+        The negative times occur as a result of ForwardSkip. If copy is
+        False, a view on the NEURON recording is returned (see
+        Cell.get_recording).
         """
         first_key = next(iter(self.cells))
-        return self.cells[first_key].get_time()
+        return self.cells[first_key].get_time(copy=copy)
 
     def get_time_trace(self) -> np.ndarray:
         """Get the time vector for the recordings, negative times removed."""
-        time = self.get_time()
-        return time[np.where(time >= 0.0)]
+        time = self.get_time(copy=False)
+        return time[time >= 0.0]
 
     def get_voltage_trace(self, cell_id: int | tuple[str, int]) -> np.ndarray:
         """Get the voltage vector for the cell_id, negative times removed."""
         cell_id = create_cell_id(cell_id)
-        time = self.get_time()
-        voltage = self.cells[cell_id].get_soma_voltage()
-        return voltage[np.where(time >= 0.0)]
+        time = self.get_time(copy=False)
+        voltage = self.cells[cell_id].get_soma_voltage(copy=False)
+        return voltage[time >= 0.0]
 
     def delete(self):
         """Delete ssim and all of its attributes.
 
-        NEURON objects are explicitly needed to be deleted.
+        NEURON objects are explicitly needed to be deleted. Other gids
+        can be instantiated afterwards, reusing the opened circuit.
         """
         if hasattr(self, 'cells'):
+            # deleting the cells also releases their gids registered in
+            # the ParallelContext, the gids of other SSims are kept
             for _, cell in self.cells.items():
                 cell.delete()
             cell_ids = list(self.cells.keys())
             for cell_id in cell_ids:
                 del self.cells[cell_id]
+        self.gids_instantiated = False
 
     def __del__(self):
         """Destructor.
@@ -723,3 +958,27 @@ class SSim:
                                  rng_settings=cell_kwargs['rng_settings'],
                                  template_format=cell_kwargs['template_format'],
                                  emodel_properties=cell_kwargs['emodel_properties'])
+
+
+def _run_cells_subprocess(
+    args: tuple[dict, list[CellId], dict, dict]
+) -> dict[CellId, dict[str, np.ndarray]]:
+    """Worker of SSim.run_cells_parallel, simulates a shard of cells."""
+    ssim_kwargs, cell_ids, instantiate_kwargs, run_kwargs = args
+    ssim = SSim(**ssim_kwargs)
+    ssim.instantiate_gids(cell_ids, **instantiate_kwargs)  # type: ignore
+    for cell in ssim.cells.values():
+        cell.start_recording_spikes(
+            None, location=ssim.spike_location, threshold=ssim.spike_threshold)
+    ssim.run(**run_kwargs)
+
+    time = ssim.get_time_trace()
+    return {
+        cell_id: {
+            "time": time,
+            "voltage": ssim.get_voltage_trace(cell_id),
+            "spikes": np.array(ssim.cells[cell_id].get_recorded_spikes(
+                location=ssim.spike_location, threshold=ssim.spike_threshold)),
+        }
+        for cell_id in cell_ids
+    }
@@ -38,6 +38,9 @@ class SynDescription:
             SynapseProperty.U_HILL_COEFFICIENT,
             SynapseProperty.CONDUCTANCE_RATIO,
         ]
+        self.glusynapse_only_properties = [
+            "volume_CR", "rho0_GB", "Use_d_TM", "Use_p_TM", "gmax_d_AMPA",
+            "gmax_p_AMPA", "theta_d", "theta_p"]
 
     def gabaab_ampanmda_syn_description(self, circuit: CircuitAccess,
                                         gid, projections=None):
@@ -47,8 +50,20 @@ class SynDescription:
     def glusynapse_syn_description(self, circuit: CircuitAccess,
                                    gid, projections=None):
         """Wraps circuit.extract_synapses with glusynapse properties."""
-        glusynapse_only_properties = [
-            "volume_CR", "rho0_GB", "Use_d_TM", "Use_p_TM", "gmax_d_AMPA",
-            "gmax_p_AMPA", "theta_d", "theta_p"]
-        all_properties = self.common_properties + glusynapse_only_properties
+        all_properties = self.common_properties + self.glusynapse_only_properties
         return circuit.extract_synapses(gid, all_properties, projections)
+
+    def gabaab_ampanmda_syn_descriptions(self, circuit: CircuitAccess,
+                                         cell_ids, projections=None, pre_cell_ids=None):
+        """Wraps circuit.extract_synapses_for_cells with ampanmda/gabaab
+        properties."""
+        return circuit.extract_synapses_for_cells(
+            cell_ids, self.common_properties, projections, pre_cell_ids)
+
+    def glusynapse_syn_descriptions(self, circuit: CircuitAccess,
+                                    cell_ids, projections=None, pre_cell_ids=None):
+        """Wraps circuit.extract_synapses_for_cells with glusynapse
+        properties."""
+        all_properties = self.common_properties + self.glusynapse_only_properties
+        return circuit.extract_synapses_for_cells(
+            cell_ids, all_properties, projections, pre_cell_ids)
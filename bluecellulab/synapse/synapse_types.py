@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 from typing import Any, Optional
+import numpy as np
 import pandas as pd
 
 import bluecellulab
@@ -25,6 +26,11 @@ from bluecellulab.tools import lazy_printv
 NeuronType = Any
 
 
+class PreparedSynDescription(dict):
+    """Synapse description record returned by Synapse.prepare_syn_descriptions,
+    with the computed columns."""
+
+
 class Synapse:
     """Class that represents a synapse in bluecellulab."""
 
@@ -99,8 +105,16 @@ class Synapse:
     def weight(self, value: float | None) -> None:
         self._weight = value
 
-    def update_syn_description(self, syn_description: pd.Series) -> pd.Series:
-        """Change data types, compute more columns needed by the simulator."""
+    def update_syn_description(self, syn_description: pd.Series | dict) -> dict:
+        """Change data types, compute more columns needed by the simulator.
+
+        PreparedSynDescription records produced by
+        prepare_syn_descriptions already contain the computed columns
+        and are returned unchanged.
+        """
+        if isinstance(syn_description, PreparedSynDescription):
+            return syn_description
+        syn_description = dict(syn_description)
         # if the optional properties are NaN (that happens due to pandas outer join), then remove them
         for prop in [SynapseProperty.U_HILL_COEFFICIENT, SynapseProperty.NRRP]:
             if prop in syn_description and pd.isna(syn_description[prop]):
@@ -121,6 +135,50 @@ class Synapse:
         syn_description[SynapseProperty.U_SYN] *= syn_description["u_scale_factor"]
         return syn_description
 
+    @classmethod
+    def prepare_syn_descriptions(
+        cls, syn_descriptions: pd.DataFrame, extracellular_calcium: Optional[float]
+    ) -> list[PreparedSynDescription]:
+        """Columnar counterpart of update_syn_description.
+
+        Computes the u_scale_factor and the scaled U_SYN of all the
+        synapses at once and returns one compact record per row.
+
+        Args:
+            syn_descriptions: synapse descriptions of a cell, one row per synapse.
+            extracellular_calcium: the extracellular calcium concentration.
+
+        Returns:
+            The synapse description records, in the order of the rows.
+        """
+        columns: dict[Any, np.ndarray] = {
+            column: syn_descriptions[column].to_numpy() for column in syn_descriptions.columns}
+        n_synapses = len(syn_descriptions)
+
+        # optional properties that are NaN (due to pandas outer join) are removed per record
+        optional_masks: dict[Any, np.ndarray] = {}
+        if SynapseProperty.NRRP in columns:
+            nrrp = pd.to_numeric(pd.Series(columns[SynapseProperty.NRRP]), errors="coerce")
+            optional_masks[SynapseProperty.NRRP] = nrrp.notna().to_numpy()
+        u_scale_factor = np.ones(n_synapses)
+        if SynapseProperty.U_HILL_COEFFICIENT in columns:
+            u_hill = columns[SynapseProperty.U_HILL_COEFFICIENT].astype(float)
+            has_u_hill = ~np.isnan(u_hill)
+            optional_masks[SynapseProperty.U_HILL_COEFFICIENT] = has_u_hill
+            if extracellular_calcium is not None and has_u_hill.any():
+                u_scale_factor[has_u_hill] = cls.calc_u_scale_factors(
+                    u_hill[has_u_hill], extracellular_calcium)
+        columns["u_scale_factor"] = u_scale_factor
+        columns[SynapseProperty.U_SYN] = columns[SynapseProperty.U_SYN] * u_scale_factor
+
+        keys = list(columns)
+        records = [PreparedSynDescription(zip(keys, row)) for row in zip(*columns.values())]
+        for prop, mask in optional_masks.items():
+            if not mask.all():
+                for idx in np.flatnonzero(~mask):
+                    del records[idx][prop]
+        return records
+
     def apply_hoc_configuration(self, hoc_configure_params: list[str]) -> None:
         """Apply the list of hoc configuration commands to the synapse."""
         self.synapseconfigure_cmds = []
@@ -180,13 +238,8 @@ class Synapse:
         if extracellular_calcium is None or u_hill_coefficient is None:
             return 1.0
 
-        def constrained_hill(K_half, y) -> float:
-            """Calculates the constrained hill coefficient."""
-            K_half_fourth = K_half**4
-            y_fourth = y**4
-            return (K_half_fourth + 16) / 16 * y_fourth / (K_half_fourth + y_fourth)
-
-        u_scale_factor = constrained_hill(u_hill_coefficient, extracellular_calcium)
+        u_scale_factor = float(Synapse.calc_u_scale_factors(
+            np.asarray(u_hill_coefficient, dtype=float), extracellular_calcium))
         lazy_printv(
             "Scaling synapse Use with u_hill_coeffient %f, "
             "extra_cellular_calcium %f with a factor of %f" %
@@ -195,6 +248,14 @@ class Synapse:
 
         return u_scale_factor
 
+    @staticmethod
+    def calc_u_scale_factors(u_hill_coefficients: np.ndarray, extracellular_calcium: float) -> np.ndarray:
+        """Vectorized calc_u_scale_factor over an array of hill coefficients,
+        computing the constrained hill coefficient."""
+        K_half_fourth = u_hill_coefficients**4
+        y_fourth = extracellular_calcium**4
+        return (K_half_fourth + 16) / 16 * y_fourth / (K_half_fourth + y_fourth)
+
     @property
     def info_dict(self):
         """Convert the synapse info to a dict from which it can be
@@ -204,7 +265,7 @@ class Synapse:
         synapse_dict['synapse_id'] = self.syn_id
         synapse_dict['pre_cell_id'] = self.pre_gid
         synapse_dict['post_cell_id'] = self.post_gid
-        synapse_dict['syn_description'] = self.syn_description.to_dict()
+        synapse_dict['syn_description'] = dict(self.syn_description)
         # if keys are enum make them str
         synapse_dict['syn_description'] = {
             str(k): v for k, v in synapse_dict['syn_description'].items()}
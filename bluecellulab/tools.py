@@ -17,6 +17,7 @@
 # pylint: disable=R0914, R0913
 
 from __future__ import annotations
+import atexit
 import io
 import json
 import math
@@ -28,9 +29,11 @@ from typing import Any, Optional
 import warnings
 
 import numpy as np
+import pandas as pd
 
 import bluecellulab
 from bluecellulab import neuron
+from bluecellulab.exceptions import BluecellulabError
 
 
 VERBOSE_LEVEL = 0
@@ -129,12 +132,51 @@ def load_nrnmechanisms(libnrnmech_path: str) -> None:
     neuron.h.nrn_load_dll(libnrnmech_path)
 
 
+_trial_pool: Optional[multiprocessing.pool.Pool] = None
+_trial_pool_pid: Optional[int] = None
+
+
+def _trial_worker() -> multiprocessing.pool.Pool:
+    """Pool of the single worker process running the trials of the functions
+    below.
+
+    The process is started at the first call and reused by the next
+    ones, instead of starting a process, and loading the template, for
+    every call. The cells are deleted at the end of every call.
+    """
+    global _trial_pool, _trial_pool_pid
+    # a forked process can't use the pool of its parent
+    if _trial_pool is None or _trial_pool_pid != os.getpid():
+        _trial_pool = multiprocessing.Pool(processes=1)
+        _trial_pool_pid = os.getpid()
+    return _trial_pool
+
+
+def _close_trial_worker() -> None:
+    """Stop the worker process of the trials."""
+    global _trial_pool
+    if _trial_pool is not None and _trial_pool_pid == os.getpid():
+        _trial_pool.terminate()
+    _trial_pool = None
+
+
+atexit.register(_close_trial_worker)
+
+
 def calculate_inputresistance(template_name, morphology_name,
                               current_delta=0.01):
     """Calculate the input resistance at rest of the cell."""
-    rest_voltage = calculate_SS_voltage(template_name, morphology_name, 0.0)
-    step_voltage = calculate_SS_voltage(
-        template_name, morphology_name, current_delta)
+    return _trial_worker().apply(
+        calculate_inputresistance_subprocess,
+        [template_name, morphology_name, current_delta])
+
+
+def calculate_inputresistance_subprocess(template_name, morphology_name,
+                                         current_delta=0.01):
+    """Subprocess wrapper of calculate_inputresistance."""
+    with CurrentStepSearch(template_name, morphology_name) as search:
+        rest_voltage = search.ss_voltage(0.0)
+        step_voltage = search.ss_voltage(current_delta)
 
     voltage_delta = step_voltage - rest_voltage
 
@@ -143,12 +185,9 @@ def calculate_inputresistance(template_name, morphology_name,
 
 def calculate_SS_voltage(template_name, morphology_name, step_level):
     """Calculate the steady state voltage at a certain current step."""
-    pool = multiprocessing.Pool(processes=1)
-    SS_voltage = pool.apply(
+    return _trial_worker().apply(
         calculate_SS_voltage_subprocess, [
             template_name, morphology_name, step_level])
-    pool.terminate()
-    return SS_voltage
 
 
 def calculate_SS_voltage_subprocess(template_name, morphology_name,
@@ -160,22 +199,177 @@ def calculate_SS_voltage_subprocess(template_name, morphology_name,
     cell spikes from from 100ms to the end of the simulation indicating
     no steady state was reached.
     """
-    cell = bluecellulab.Cell(template_name, morphology_name)
-    cell.add_ramp(500, 5000, step_level, step_level)
-    simulation = bluecellulab.Simulation()
-    simulation.run(1000, cvode=template_accepts_cvode(template_name))
-    time = cell.get_time()
-    voltage = cell.get_soma_voltage()
-    SS_voltage = np.mean(voltage[np.where((time < 1000) & (time > 800))])
-    cell.delete()
+    with CurrentStepSearch(template_name, morphology_name) as search:
+        return search.ss_voltage(step_level, check_for_spiking,
+                                 spike_threshold)
+
 
-    if check_for_spiking:
-        # check for voltage crossings
-        if len(np.nonzero(
-                voltage[np.where(time > 100.0)] > spike_threshold)[0]) > 0:
-            return None
+class CurrentStepSearch:
+    """Runs the current step trials of the holding and threshold current
+    searches on a single cell.
 
-    return SS_voltage
+    The cell is built once and its state is reset by the initialization
+    of every simulation, instead of building a new cell for each trial.
+    The cells with stochastic channels are still rebuilt for each trial,
+    so that a trial does not depend on the random numbers drawn by the
+    previous ones.
+    """
+
+    def __init__(self, template_name, morphology_name):
+        self.template_name = template_name
+        self.morphology_name = morphology_name
+        self.cell = bluecellulab.Cell(template_name, morphology_name)
+        self.cvode = template_accepts_cvode(template_name)
+        self.n_trials = 0
+        stochastic_names = stochastic_mechanism_names()
+        self.stochastic = any(
+            mechanism.name() in stochastic_names
+            for section in self.cell.all for segment in section
+            for mechanism in segment)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.delete()
+
+    def delete(self):
+        """Delete the cell."""
+        self.cell.delete()
+
+    def _reset_cell(self):
+        """Rebuild a stochastic cell that already ran a trial."""
+        if self.stochastic and self.n_trials > 0:
+            self.cell.delete()
+            self.cell = bluecellulab.Cell(self.template_name, self.morphology_name)
+
+    def _run(self, ramps, maxtime):
+        """Simulate the cell with the (start, stop, level) current ramps and
+        return its time and soma voltage traces."""
+        self._reset_cell()
+        tstims = [self.cell.add_ramp(start, stop, level, level)
+                  for start, stop, level in ramps]
+        try:
+            simulation = bluecellulab.Simulation()
+            simulation.run(maxtime, cvode=self.cvode)
+            self.n_trials += 1
+            return self.cell.get_time(), self.cell.get_soma_voltage()
+        finally:
+            for tstim in tstims:
+                self.cell.persistent.remove(tstim)
+
+    def ss_voltage(self, step_level, check_for_spiking=False,
+                   spike_threshold=-20.0):
+        """Calculate the steady state voltage at a certain current step.
+
+        if check_for_spiking is True, None is returned if the cell
+        spikes after 100 ms.
+        """
+        time, voltage = self._run([(500, 5000, step_level)], 1000)
+        SS_voltage = np.mean(voltage[np.where((time < 1000) & (time > 800))])
+
+        if check_for_spiking:
+            # check for voltage crossings
+            if len(np.nonzero(
+                    voltage[np.where(time > 100.0)] > spike_threshold)[0]) > 0:
+                return None
+
+        return SS_voltage
+
+    def spike_detected(self, hyp_level, inj_start, inj_stop, step_level):
+        """Detect if there is a spike at a certain step level."""
+        time, voltage = self._run(
+            [(0, 5000, hyp_level), (inj_start, inj_stop, step_level)],
+            int(inj_stop))
+        time_step = time[np.where((time > inj_start) & (time < inj_stop))]
+        voltage_step = voltage[np.where((
+            time_step > inj_start) & (time_step < inj_stop))]
+        return detect_spike(voltage_step)
+
+    def search_hyp_current(self, target_voltage, min_current, max_current,
+                           precision=.5, max_trials=50):
+        """Search the current bringing the steady state voltage within
+        precision of target_voltage.
+
+        The steady state voltage increases with the current, the current
+        is searched in [min_current, max_current] with the Illinois
+        variant of the false position method, which keeps the root
+        bracketed and converges superlinearly. Unlike the former
+        bisection, both bounds are simulated first, which costs 2
+        trials.
+
+        Raises:
+            BluecellulabError: if the steady state voltages at min_current
+                and max_current do not bracket target_voltage, or if no
+                current is found within max_trials iterations.
+        """
+        def voltage_error(current):
+            voltage = self.ss_voltage(current)
+            lazy_printv("Detected voltage: %f" % voltage, 1)
+            return voltage - target_voltage
+
+        return _find_bracketed_root(voltage_error, min_current, max_current,
+                                    precision, max_trials)
+
+    def search_threshold_current(self, hyp_level, inj_start, inj_stop,
+                                 min_current, max_current, precision=.01):
+        """Search current necessary to reach threshold.
+
+        Returns the upper bound of the bracket of the threshold current,
+        bisected until it is narrower than precision.
+        """
+        while abs(max_current - min_current) >= precision:
+            med_current = min_current + abs(min_current - max_current) / 2
+            spike_detected = self.spike_detected(
+                hyp_level, inj_start, inj_stop, med_current)
+            lazy_printv("Spike threshold detection at: %f nA" % med_current, 1)
+            if spike_detected:
+                max_current = med_current
+            else:
+                min_current = med_current
+        return max_current
+
+
+def _find_bracketed_root(func, lower, upper, ftol, max_iter):
+    """Find x in [lower, upper] where abs(func(x)) < ftol.
+
+    Uses the Illinois algorithm, func(lower) and func(upper) must have
+    opposite signs. The bounds are evaluated before the max_iter
+    iterations.
+
+    Raises:
+        BluecellulabError: if the root is not bracketed by the bounds or
+            is not found within max_iter iterations.
+    """
+    f_lower = func(lower)
+    if abs(f_lower) < ftol:
+        return lower
+    f_upper = func(upper)
+    if abs(f_upper) < ftol:
+        return upper
+    if np.sign(f_lower) == np.sign(f_upper):
+        raise BluecellulabError(
+            f"The root is not bracketed by [{lower}, {upper}], the errors "
+            f"at the bounds are {f_lower} and {f_upper}")
+
+    side = 0
+    for _ in range(max_iter):
+        guess = (lower * f_upper - upper * f_lower) / (f_upper - f_lower)
+        f_guess = func(guess)
+        if abs(f_guess) < ftol:
+            return guess
+        if np.sign(f_guess) == np.sign(f_lower):
+            lower, f_lower = guess, f_guess
+            if side == -1:
+                f_upper /= 2
+            side = -1
+        else:
+            upper, f_upper = guess, f_guess
+            if side == 1:
+                f_lower /= 2
+            side = 1
+    raise BluecellulabError(
+        f"No root found within {ftol} after {max_iter} iterations")
 
 
 def holding_current_subprocess(v_hold, enable_ttx, cell_kwargs):
@@ -213,44 +407,70 @@ def holding_current(
 
         cell_kwargs = ssim.fetch_cell_kwargs(cell_id)
 
-    pool = multiprocessing.Pool(processes=1)
-    i_hold, v_control = pool.apply(
+    i_hold, v_control = _trial_worker().apply(
         holding_current_subprocess, [v_hold, enable_ttx, cell_kwargs])
-    pool.terminate()
 
     return i_hold, v_control
 
 
+def stochastic_mechanism_names() -> set[str]:
+    """Names of the loaded density mechanisms drawing random numbers.
+
+    These are the mechanisms with a setRNG procedure setting their
+    Random123 streams, e.g. StochKv.
+    """
+    mechanism_type = neuron.h.MechanismType(0)
+    name = neuron.h.ref("")
+    names = set()
+    for index in range(int(mechanism_type.count())):
+        mechanism_type.select(index)
+        mechanism_type.selected(name)
+        if hasattr(neuron.h, f"setRNG_{name[0]}"):
+            names.add(name[0])
+    return names
+
+
 def template_accepts_cvode(template_name):
-    """Return True if template_name can be run with cvode."""
+    """Return True if template_name can be run with cvode, i.e. it does not use
+    stochastic mechanisms."""
     with open(template_name, "r") as template_file:
         template_content = template_file.read()
-    if "StochKv" in template_content:
-        accepts_cvode = False
-    else:
-        accepts_cvode = True
-    return accepts_cvode
+    return not any(name in template_content
+                   for name in stochastic_mechanism_names())
 
 
 def search_hyp_current(template_name, morphology_name, target_voltage,
                        min_current, max_current):
-    """Search current necessary to bring cell to -85 mV."""
-    med_current = min_current + abs(min_current - max_current) / 2
-    new_target_voltage = calculate_SS_voltage(
-        template_name, morphology_name, med_current)
-    lazy_printv("Detected voltage: %f" % new_target_voltage, 1)
-    if abs(new_target_voltage - target_voltage) < .5:
-        return med_current
-    elif new_target_voltage > target_voltage:
-        return search_hyp_current(template_name, morphology_name,
-                                  target_voltage, min_current, med_current)
-    elif new_target_voltage < target_voltage:
-        return search_hyp_current(template_name, morphology_name,
-                                  target_voltage, med_current, max_current)
+    """Search current necessary to bring cell to -85 mV.
+
+    See CurrentStepSearch.search_hyp_current, the steady state voltages
+    at min_current and max_current are simulated first.
+
+    Raises:
+        BluecellulabError: if target_voltage is not bracketed by the
+            steady state voltages at min_current and max_current.
+    """
+    return _trial_worker().apply(
+        search_hyp_current_subprocess,
+        [template_name, morphology_name, target_voltage, min_current,
+         max_current])
+
+
+def search_hyp_current_subprocess(template_name, morphology_name,
+                                  target_voltage, min_current, max_current):
+    """Subprocess wrapper of search_hyp_current."""
+    with CurrentStepSearch(template_name, morphology_name) as search:
+        return search.search_hyp_current(target_voltage, min_current,
+                                         max_current)
 
 
 def detect_hyp_current(template_name, morphology_name, target_voltage):
-    """Search current necessary to bring cell to -85 mV."""
+    """Search current necessary to bring cell to -85 mV.
+
+    Raises:
+        BluecellulabError: if target_voltage is not bracketed by the
+            steady state voltages at -1 nA and 0 nA.
+    """
     return search_hyp_current(template_name, morphology_name, target_voltage,
                               -1.0, 0.0)
 
@@ -258,34 +478,18 @@ def detect_hyp_current(template_name, morphology_name, target_voltage):
 def detect_spike_step(template_name, morphology_name, hyp_level, inj_start,
                       inj_stop, step_level):
     """Detect if there is a spike at a certain step level."""
-    pool = multiprocessing.Pool(processes=1)
-    spike_detected = pool.apply(
+    return _trial_worker().apply(
         detect_spike_step_subprocess,
         [template_name, morphology_name, hyp_level,
          inj_start, inj_stop, step_level])
-    pool.terminate()
-    return spike_detected
 
 
 def detect_spike_step_subprocess(template_name, morphology_name, hyp_level,
                                  inj_start, inj_stop, step_level):
     """Detect if there is a spike at a certain step level."""
-    cell = bluecellulab.Cell(template_name, morphology_name)
-    cell.add_ramp(0, 5000, hyp_level, hyp_level)
-    cell.add_ramp(inj_start, inj_stop, step_level, step_level)
-    simulation = bluecellulab.Simulation()
-    simulation.run(int(inj_stop), cvode=template_accepts_cvode(template_name))
-
-    time = cell.get_time()
-    voltage = cell.get_soma_voltage()
-    time_step = time[np.where((time > inj_start) & (time < inj_stop))]
-    voltage_step = voltage[np.where((
-        time_step > inj_start) & (time_step < inj_stop))]
-    spike_detected = detect_spike(voltage_step)
-
-    cell.delete()
-
-    return spike_detected
+    with CurrentStepSearch(template_name, morphology_name) as search:
+        return search.spike_detected(hyp_level, inj_start, inj_stop,
+                                     step_level)
 
 
 def detect_spike(voltage):
@@ -296,24 +500,19 @@ def detect_spike(voltage):
 def search_threshold_current(template_name, morphology_name, hyp_level,
                              inj_start, inj_stop, min_current, max_current):
     """Search current necessary to reach threshold."""
-    med_current = min_current + abs(min_current - max_current) / 2
-    lazy_printv("Med current %d" % med_current, 1)
+    return _trial_worker().apply(
+        search_threshold_current_subprocess,
+        [template_name, morphology_name, hyp_level, inj_start, inj_stop,
+         min_current, max_current])
 
-    spike_detected = detect_spike_step(
-        template_name, morphology_name, hyp_level, inj_start, inj_stop,
-        med_current)
-    lazy_printv("Spike threshold detection at: %f nA" % med_current, 1)
 
-    if abs(max_current - min_current) < .01:
-        return max_current
-    elif spike_detected:
-        return search_threshold_current(template_name, morphology_name,
-                                        hyp_level, inj_start, inj_stop,
-                                        min_current, med_current)
-    else:
-        return search_threshold_current(template_name, morphology_name,
+def search_threshold_current_subprocess(template_name, morphology_name,
                                         hyp_level, inj_start, inj_stop,
-                                        med_current, max_current)
+                                        min_current, max_current):
+    """Subprocess wrapper of search_threshold_current."""
+    with CurrentStepSearch(template_name, morphology_name) as search:
+        return search.search_threshold_current(
+            hyp_level, inj_start, inj_stop, min_current, max_current)
 
 
 def detect_threshold_current(template_name, morphology_name, hyp_level,
@@ -327,21 +526,21 @@ def calculate_SS_voltage_replay(blueconfig, gid, step_level, start_time=None,
                                 stop_time=None, ignore_timerange=False,
                                 timeout=600):
     """Calculate the steady state voltage at a certain current step."""
-    pool = multiprocessing.Pool(processes=1)
     # print "Calculate_SS_voltage_replay %f" % step_level
-    result = pool.apply_async(calculate_SS_voltage_replay_subprocess,
-                              [blueconfig, gid, step_level, start_time,
-                               stop_time, ignore_timerange])
+    result = _trial_worker().apply_async(
+        calculate_SS_voltage_replay_subprocess,
+        [blueconfig, gid, step_level, start_time, stop_time, ignore_timerange])
 
     try:
         output = result.get(timeout=timeout)
         # (SS_voltage, (time, voltage)) = result.get(timeout=timeout)
     except multiprocessing.TimeoutError:
         output = (float('nan'), (None, None))
+        # the worker is still running the trial
+        _close_trial_worker()
 
     # (SS_voltage, voltage) = calculate_SS_voltage_replay_subprocess(
     # blueconfig, gid, step_level)
-    pool.terminate()
     return output
 
 
@@ -583,6 +782,190 @@ def search_hyp_current_replay_imap(blueconfig, gid_list, timeout=600,
     pool.terminate()
 
 
+class CalibrationPool:
+    """Long-lived worker processes running current step trials on the cells of
+    a simulation.
+
+    Every worker opens the simulation once with an SSim, and reuses it
+    for all the trials it receives. The trials of a cell are dispatched
+    to a single worker, which instantiates the cell once, with its
+    synapses, replay and stimuli, and only swaps the injected current
+    between the trials. The trials are reproducible with the Random123
+    rng mode, whose streams are reset at the initialization of every
+    simulation.
+
+    Use it as a context manager, or call close, to stop the workers.
+    """
+
+    def __init__(self, simulation_config, n_workers=None,
+                 instantiate_kwargs=None, **ssim_kwargs):
+        """Start the workers.
+
+        Args:
+            simulation_config: path of the simulation config.
+            n_workers: number of worker processes, defaults to the number
+                of CPUs.
+            instantiate_kwargs: keyword arguments of SSim.instantiate_gids,
+                defaults to adding the synapses, minis, stimuli and replay.
+            ssim_kwargs: other keyword arguments of SSim, e.g. base_seed.
+        """
+        if instantiate_kwargs is None:
+            instantiate_kwargs = {"add_synapses": True, "add_minis": True,
+                                  "add_stimuli": True, "add_replay": True}
+        if n_workers is None:
+            n_workers = multiprocessing.cpu_count()
+        self.n_workers = n_workers
+        ssim_kwargs["simulation_config"] = simulation_config
+        # spawn, so that the workers don't inherit the NEURON state of this process
+        context = multiprocessing.get_context("spawn")
+        self._pool = context.Pool(
+            n_workers, initializer=_init_calibration_worker,
+            initargs=(ssim_kwargs, instantiate_kwargs))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stop the workers."""
+        self._pool.terminate()
+        self._pool.join()
+
+    def ss_voltages(self, trials, start_time=500, stop_time=2000):
+        """Calculate the steady state voltages of (cell id, current) trials.
+
+        The voltage is averaged between start_time and stop_time.
+
+        Returns:
+            A DataFrame with the population, gid, current and ss_voltage
+            columns, with a row per trial in the order of trials.
+        """
+        trials = [(bluecellulab.circuit.node_id.create_cell_id(cell_id), current)
+                  for cell_id, current in trials]
+        groups: dict = {}
+        for idx, (cell_id, current) in enumerate(trials):
+            groups.setdefault(cell_id, []).append((idx, current))
+
+        voltages = np.empty(len(trials))
+        tasks = [(cell_id, [current for _, current in group], start_time, stop_time)
+                 for cell_id, group in groups.items()]
+        for group, group_voltages in zip(
+                groups.values(),
+                self._pool.imap(_calibration_ss_voltages, tasks)):
+            voltages[[idx for idx, _ in group]] = group_voltages
+
+        return pd.DataFrame({
+            "population": [cell_id.population_name for cell_id, _ in trials],
+            "gid": np.array([cell_id.id for cell_id, _ in trials], dtype=int),
+            "current": np.array([current for _, current in trials], dtype=float),
+            "ss_voltage": voltages,
+        })
+
+    def search_hyp_currents(self, cell_ids, target_voltage=-80,
+                            min_current=-1.0, max_current=0.0, precision=.5,
+                            max_trials=10, start_time=500, stop_time=2000):
+        """Search the currents bringing the cells to target_voltage.
+
+        The search of each cell runs on one worker, with the root finder
+        of CurrentStepSearch.search_hyp_current on the steady state
+        voltage averaged between start_time and stop_time.
+
+        Returns:
+            A DataFrame with the population, gid, current, ss_voltage and
+            n_trials columns, with a row per cell in the order of cell_ids.
+            The current and ss_voltage are nan when the search does not
+            converge within max_trials trials.
+        """
+        cell_ids = [bluecellulab.circuit.node_id.create_cell_id(cell_id)
+                    for cell_id in cell_ids]
+        tasks = [(cell_id, target_voltage, min_current, max_current, precision,
+                  max_trials, start_time, stop_time) for cell_id in cell_ids]
+        results = self._pool.map(_calibration_search_hyp_current, tasks,
+                                 chunksize=1)
+
+        return pd.DataFrame({
+            "population": [cell_id.population_name for cell_id in cell_ids],
+            "gid": np.array([cell_id.id for cell_id in cell_ids], dtype=int),
+            "current": np.array([result[0] for result in results], dtype=float),
+            "ss_voltage": np.array([result[1] for result in results], dtype=float),
+            "n_trials": np.array([result[2] for result in results], dtype=int),
+        })
+
+
+class _CalibrationWorker:
+    """State of a CalibrationPool worker process."""
+
+    def __init__(self, ssim_kwargs, instantiate_kwargs):
+        self.ssim = bluecellulab.SSim(**ssim_kwargs)
+        self.instantiate_kwargs = instantiate_kwargs
+        self.cell_id = None
+
+    def instantiate(self, cell_id):
+        """Instantiate cell_id, replacing the previously instantiated cell."""
+        if cell_id != self.cell_id:
+            self.ssim.delete()
+            self.cell_id = None
+            self.ssim.instantiate_gids([cell_id], **self.instantiate_kwargs)
+            self.cell_id = cell_id
+        return self.ssim.cells[cell_id]
+
+    def ss_voltage(self, cell_id, step_level, start_time, stop_time):
+        """Calculate the steady state voltage of cell_id at a current step."""
+        cell = self.instantiate(cell_id)
+        tstim = cell.add_ramp(0, stop_time, step_level, step_level)
+        try:
+            self.ssim.run(t_stop=stop_time)
+        finally:
+            cell.persistent.remove(tstim)
+        time = self.ssim.get_time_trace()
+        voltage = self.ssim.get_voltage_trace(cell_id)
+        SS_voltage = float(np.mean(voltage[np.where(
+            (time < stop_time) & (time > start_time))]))
+        lazy_printv("Calculated SS voltage for gid %d with step level %f nA: "
+                    "%s mV" % (cell_id.id, step_level, SS_voltage), 1)
+        return SS_voltage
+
+
+_calibration_worker: Optional[_CalibrationWorker] = None
+
+
+def _init_calibration_worker(ssim_kwargs, instantiate_kwargs):
+    """Initializer of the CalibrationPool worker processes."""
+    global _calibration_worker
+    _calibration_worker = _CalibrationWorker(ssim_kwargs, instantiate_kwargs)
+
+
+def _calibration_ss_voltages(args):
+    """Run the trials of a cell on a CalibrationPool worker."""
+    cell_id, currents, start_time, stop_time = args
+    return [_calibration_worker.ss_voltage(  # type: ignore
+        cell_id, current, start_time, stop_time) for current in currents]
+
+
+def _calibration_search_hyp_current(args):
+    """Search the holding current of a cell on a CalibrationPool worker."""
+    (cell_id, target_voltage, min_current, max_current, precision,
+     max_trials, start_time, stop_time) = args
+    voltages = {}
+
+    def voltage_error(current):
+        voltages[current] = _calibration_worker.ss_voltage(  # type: ignore
+            cell_id, current, start_time, stop_time)
+        return voltages[current] - target_voltage
+
+    try:
+        # the 2 bounds are evaluated before the iterations
+        current = _find_bracketed_root(voltage_error, min_current, max_current,
+                                       precision, max_trials - 2)
+    except BluecellulabError as error:
+        lazy_printv("Holding current search of gid %d failed: %s" %
+                    (cell_id.id, error), 1)
+        return float('nan'), float('nan'), len(voltages)
+    return current, voltages[current], len(voltages)
+
+
 class NumpyEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, (np.int_, np.intc, np.intp, np.int8,
@@ -43,6 +43,20 @@ def test_load_template():
     assert template_name == "test_cell_bluecellulab"
 
 
+def test_load_template_reuse(monkeypatch):
+    """Test that a template file is loaded once unless reuse is disabled."""
+    monkeypatch.setattr(NeuronTemplate, "loaded_templates", {})
+    fpath = parent_dir / "examples/cell_example1/test_cell.hoc"
+    template_name = NeuronTemplate.load(fpath)
+    assert NeuronTemplate.load(fpath) == template_name
+    assert NeuronTemplate.load(str(fpath)) == template_name
+
+    monkeypatch.setattr(NeuronTemplate, "reuse_loaded_templates", False)
+    new_template_name = NeuronTemplate.load(fpath)
+    assert new_template_name == f"{template_name}_x"
+    assert NeuronTemplate.load(fpath) == f"{template_name}_x_x"
+
+
 @patch("bluecellulab.neuron")
 def test_load_template_with_old_neuron(mock_bluecellulab_neuron):
     """Test the template loading with an old neuron version."""
@@ -103,6 +117,61 @@ class TestCellBaseClass1:
         assert isinstance(
             self.cell.get_hsection(0), bluecellulab.neuron.nrn.Section)
 
+    def test_synlocations_to_segx(self):
+        """Cell: Test the vectorized synlocations_to_segx"""
+        def reference_segx(isec, ipt, syn_offset):
+            """One synapse at a time through NEURON."""
+            syn_offset = max(syn_offset, 0.0)
+            sec = self.cell.get_hsection(isec)
+            n3d = bluecellulab.neuron.h.n3d(sec=sec)
+            reversed_section = bluecellulab.neuron.h.section_orientation(sec=sec) == 1
+            if reversed_section:
+                ipt = n3d - 1 - ipt
+                syn_offset = -syn_offset
+            distance = 0.5
+            if ipt < n3d:
+                distance = (bluecellulab.neuron.h.arc3d(ipt, sec=sec) + syn_offset) / sec.L
+                if distance == 0.0:
+                    distance = 0.0000001
+                if distance >= 1.0:
+                    distance = 0.9999999
+            if reversed_section:
+                distance = 1 - distance
+            return max(distance, 0)
+
+        rng = np.random.default_rng(42)
+        isecs = rng.choice(list(self.cell.serialized_sections.isec2sec), size=200)
+        ipts = np.array([rng.integers(0, bluecellulab.neuron.h.n3d(
+            sec=self.cell.get_hsection(isec)) + 1) for isec in isecs])
+        offsets = rng.uniform(-1.0, 5.0, size=200)
+        locations = self.cell.synlocations_to_segx(isecs, ipts, offsets)
+        expected = [reference_segx(*args) for args in zip(isecs, ipts, offsets)]
+        assert np.allclose(locations, expected)
+        assert self.cell.synlocation_to_segx(isecs[0], ipts[0], offsets[0]) == locations[0]
+        assert len(self.cell.synlocations_to_segx([], [], [])) == 0
+
+    def test_clear_geometry_cache(self):
+        """Cell: Test that the geometry caches are rebuilt after a change"""
+        isec, ipt = 100, 2
+        hsection = self.cell.get_hsection(isec)
+        segx = self.cell.synlocation_to_segx(isec, ipt, 0.0)
+        topology = self.cell.topology
+        index = topology.index(hsection.name())
+        area = self.cell.area()
+        self.cell.section_distance.node_coordinates(hsection)
+
+        diam = hsection.diam
+        hsection.diam = 2 * diam
+        assert self.cell.topology.diameters[index] == diam
+        assert self.cell.area() == area
+        self.cell.clear_geometry_cache()
+        assert self.cell._section_arc3d_cache == {}
+        assert self.cell.section_distance._node_coordinates == {}
+        assert self.cell.topology is not topology
+        assert self.cell.topology.diameters[index] == hsection.diam
+        assert self.cell.area() > area
+        assert self.cell.synlocation_to_segx(isec, ipt, 0.0) == segx
+
     def test_add_recording(self):
         """Cell: Test cell.add_recording"""
         varname = 'self.apical[1](0.5)._ref_v'
@@ -186,6 +255,79 @@ class TestCellBaseClass1:
                                     + (y1 - y2) ** 2 + (z1 - z2) ** 2)
             assert distance_euclid == distance_hand
 
+    def test_pairwise_distances(self):
+        """Cell: Test the batched section distances"""
+        random.seed(1)
+        sections = self.cell.apical + self.cell.somatic + self.cell.basal
+        locations_a = [(random.choice(sections), random.random()) for _ in range(20)]
+        locations_b = [(random.choice(sections), random.random()) for _ in range(30)]
+
+        section_distance = self.cell.section_distance
+        assert section_distance is self.cell.section_distance
+        distances = section_distance.pairwise_distances(locations_a, locations_b)
+        assert distances.shape == (20, 30)
+
+        def node_position(hsection, location):
+            """Node position read from NEURON."""
+            xs, ys, zs = section_distance.grindaway(hsection)
+            node = int(np.floor((len(xs) - 1) * location))
+            return np.array([xs[node], ys[node], zs[node]])
+
+        for i, (hsection1, location1) in enumerate(locations_a):
+            for j, (hsection2, location2) in enumerate(locations_b):
+                expected = np.linalg.norm(node_position(hsection1, location1) -
+                                          node_position(hsection2, location2))
+                assert np.isclose(distances[i, j], expected)
+
+        distances_xy = section_distance.pairwise_distances(
+            locations_a, locations_b, projection="xy")
+        assert np.all(distances_xy <= distances + 1e-12)
+
+        hsection = locations_a[0][0]
+        assert np.array_equal(
+            section_distance.node_coordinates(hsection),
+            np.column_stack(section_distance.grindaway(hsection)))
+        section_distance.clear_cache()
+        assert section_distance._node_coordinates == {}
+
+    def test_segment_table(self):
+        """Cell: Test the segment table and the area reductions"""
+        expected_area = 0
+        for section in self.cell.all:
+            for segment in section:
+                expected_area += bluecellulab.neuron.h.area(segment.x, sec=section)
+        assert np.isclose(self.cell.area(), expected_area)
+        # the area does not need the distances and resistances of the table
+        assert self.cell._segment_table is None
+
+        table = self.cell.segment_table
+        assert table is self.cell.segment_table
+        assert len(table) == sum(section.nseg for section in self.cell.all)
+        assert list(table.columns) == [
+            "section_index", "isec", "x", "area", "diam", "distance_to_soma", "ri"]
+        np.testing.assert_array_equal(table["area"], self.cell.segment_areas())
+
+        for section_index, isec in table[["section_index", "isec"]].drop_duplicates().values:
+            if isec >= 0:
+                assert (self.cell.get_hsection(isec).name() ==
+                        self.cell.topology.names[section_index])
+        assert set(table["isec"][table["isec"] >= 0]) == set(
+            self.cell.serialized_sections.isec2sec)
+
+        soma_index = self.cell.topology.index(bluecellulab.neuron.h.secname(sec=self.cell.soma))
+        soma_rows = table[table["section_index"] == soma_index]
+        assert np.allclose(soma_rows["x"], [seg.x for seg in self.cell.soma])
+        assert np.allclose(soma_rows["diam"], [seg.diam for seg in self.cell.soma])
+        assert np.all(table["distance_to_soma"] >= 0)
+
+        section_areas = self.cell.section_areas()
+        assert np.isclose(section_areas[soma_index],
+                          sum(seg.area() for seg in self.cell.soma))
+        area_by_type = self.cell.area_by_type()
+        assert np.isclose(sum(area_by_type.values()), self.cell.area())
+        assert np.isclose(area_by_type["somatic"],
+                          sum(seg.area() for sec in self.cell.somatic for seg in sec))
+
 
 @pytest.mark.debugtest
 class TestCellBaseClassVClamp:
@@ -254,6 +396,24 @@ class TestCellBaseClassVClamp:
 
         assert current_after_vc_end == 0.0
 
+    def test_get_recording_copy(self):
+        """Cell: Test get_recording with and without copying"""
+        sim = bluecellulab.Simulation()
+        sim.add_cell(self.cell)
+        sim.run(10, dt=.1, cvode=False)
+
+        voltage = self.cell.get_soma_voltage()
+        voltage_view = self.cell.get_soma_voltage(copy=False)
+        np.testing.assert_array_equal(voltage, voltage_view)
+        np.testing.assert_array_equal(
+            voltage, self.cell.recordings['self.soma(0.5)._ref_v'].to_python())
+        assert not voltage_view.flags.writeable
+        assert np.shares_memory(voltage_view, self.cell.get_soma_voltage(copy=False))
+        assert not np.shares_memory(voltage, self.cell.get_soma_voltage())
+        # the copies are writeable and independent of the recording
+        voltage[:] = 0.0
+        assert self.cell.get_soma_voltage()[-1] != 0.0
+
 
 @pytest.mark.v5
 def test_get_recorded_spikes():
@@ -25,7 +25,7 @@ from bluecellulab.stimuli import (
     Pattern,
 )
 from bluecellulab.exceptions import BluecellulabError
-from bluecellulab.cell.stimuli_generator import gen_shotnoise_signal
+from bluecellulab.cell.stimuli_generator import gen_shotnoise_signal, waveform_cache
 from bluecellulab.cell import SonataProxy
 
 script_dir = Path(__file__).resolve().parent.parent
@@ -261,6 +261,40 @@ class TestInjector:
             )
             self.cell.add_replay_shotnoise(soma, segx, invalid_stim, shotnoise_stim_count=3)
 
+    def test_add_replay_shotnoise_cached(self):
+        """Test that repeated shot noise stimuli reuse the cached waveform."""
+        rng_obj = bluecellulab.RNGSettings(mode="Random123", base_seed=549821)
+        rng_obj.stimulus_seed = 549821
+        self.cell.rng_settings = rng_obj
+        stimulus = ShotNoise(
+            pattern="shot_noise", target="single-cell", delay=0, duration=2,
+            rise_time=0.4, decay_time=4, rate=2E3, amp_mean=40E-3, amp_var=16E-4,
+            seed=3899663
+        )
+        waveform_cache.clear()
+        self.cell.add_replay_shotnoise(self.cell.soma, 0.5, stimulus,
+                                       shotnoise_stim_count=3)
+        assert len(waveform_cache) == 0  # disabled by default
+
+        waveform_cache.resize(2**20)
+        _, stim_vec = self.cell.add_replay_shotnoise(self.cell.soma, 0.5, stimulus,
+                                                     shotnoise_stim_count=3)
+        assert len(waveform_cache) == 1
+        n_persistent = len(self.cell.persistent)
+        _, cached_vec = self.cell.add_replay_shotnoise(self.cell.soma, 0.5, stimulus,
+                                                       shotnoise_stim_count=3)
+        assert len(waveform_cache) == 1
+        # no rng is created for the cached waveform
+        assert len(self.cell.persistent) == n_persistent + 3
+        assert cached_vec.to_python() == stim_vec.to_python()
+        assert cached_vec is not stim_vec
+
+        self.cell.add_replay_shotnoise(self.cell.soma, 0.5, stimulus,
+                                       shotnoise_stim_count=4)
+        assert len(waveform_cache) == 2
+        waveform_cache.resize(0)
+        assert len(waveform_cache) == 0
+
     def test_add_ornstein_uhlenbeck(self):
         """Unit test for add_ornstein_uhlenbeck."""
         rng_obj = bluecellulab.RNGSettings(mode="Random123", base_seed=549821)
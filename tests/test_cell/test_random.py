@@ -1,4 +1,8 @@
 """Unit tests for cell/random module."""
+from math import log, sqrt
+
+import numpy as np
+import pytest
 from pytest import approx
 
 from bluecellulab import neuron
@@ -17,3 +21,50 @@ def test_gamma():
     assert res[0] == approx(0.2862183)
     assert max(res) == approx(1.3015527)
     assert min(res) == approx(0.2802995)
+
+
+def _gamma_sequential(rng, a, b, N):
+    """Reference implementation drawing the random numbers one at a time."""
+    if a < 1:
+        rng.uniform(0, 1)
+        w = neuron.h.Vector(N)
+        w.setrand(rng)
+        w.pow(1 / a)
+        return _gamma_sequential(rng, 1 + a, b, N).mul(w)
+    d = a - 1 / 3
+    c = 1 / 3 / sqrt(d)
+    vec = neuron.h.Vector(N)
+    for i in range(0, N):
+        while True:
+            x = rng.normal(0, 1)
+            v = 1 + c * x
+            if v > 0:
+                v = v * v * v
+                u = rng.uniform(0, 1)
+                if u < 1 - 0.0331 * x * x * x * x:
+                    vec.x[i] = b * d * v
+                    break
+                if log(u) < 0.5 * x * x + d * (1 - v + log(v)):
+                    vec.x[i] = b * d * v
+                    break
+    return vec
+
+
+@pytest.mark.parametrize("generator", ["Random123", "MCellRan4", "ACG"])
+@pytest.mark.parametrize("shape,N", [(0.3, 200), (1.0, 1), (1.7, 2000), (25.0, 500), (2.0, 0)])
+def test_gamma_sequential(generator, shape, N):
+    """Test that the batched sampler reproduces the sequential algorithm."""
+    rngs = []
+    for _ in range(2):
+        if generator == "ACG":
+            rng = neuron.h.Random(7)
+        else:
+            rng = neuron.h.Random()
+            getattr(rng, generator)(1, 2)
+        rngs.append(rng)
+
+    res = gamma(rngs[0], shape, 0.5, N)
+    expected = _gamma_sequential(rngs[1], shape, 0.5, N)
+    np.testing.assert_array_equal(res.as_numpy(), expected.as_numpy())
+    # the same random numbers were taken from the stream
+    assert rngs[0].uniform(0, 1) == rngs[1].uniform(0, 1)
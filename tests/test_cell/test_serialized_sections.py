@@ -24,6 +24,17 @@ def test_serialized_sections():
     assert serialized_sections.isec2sec[0].has_trueparent() is False
     for sec in serialized_sections.isec2sec.values():
         assert sec.exists()
+    for isec, sec_ref in serialized_sections.isec2sec.items():
+        assert serialized_sections.get(isec) == sec_ref.sec
+    with pytest.raises(IndexError):
+        serialized_sections.get(len(serialized_sections.sections))
+    with pytest.raises(IndexError):
+        serialized_sections.get(-1)
+    assert cell.serialized_sections is cell.serialized_sections
+    assert cell.get_hsection(86) == serialized_sections.isec2sec[86].sec
+    # the ids of the replaced axon sections are not serialized
+    assert 3 not in serialized_sections.isec2sec
+    assert cell.get_hsection(3) is None
 
     # check edge cases
     modified_cell = cell.cell.getCell()
@@ -1,5 +1,10 @@
 """Unit tests for the stimuli_generator module."""
 
+import math
+import time
+
+import numpy as np
+import pytest
 from pytest import approx
 
 import bluecellulab
@@ -7,6 +12,7 @@ from bluecellulab.cell.stimuli_generator import (
     gen_shotnoise_signal,
     get_relative_shotnoise_params,
     gen_ornstein_uhlenbeck,
+    WaveformCache,
 )
 
 
@@ -25,6 +31,97 @@ def test_gen_shotnoise_signal():
                                               rng=None)
 
 
+def _gamma_loop(rng, a, b, N):
+    """Reference Marsaglia and Tsang sampler drawing the random numbers one
+    at a time."""
+    if a < 1:
+        rng.uniform(0, 1)
+        w = bluecellulab.neuron.h.Vector(N)
+        w.setrand(rng)
+        w.pow(1 / a)
+        return _gamma_loop(rng, 1 + a, b, N).mul(w)
+    d = a - 1 / 3
+    c = 1 / 3 / math.sqrt(d)
+    vec = bluecellulab.neuron.h.Vector(N)
+    for i in range(0, N):
+        while True:
+            x = rng.normal(0, 1)
+            v = 1 + c * x
+            if v > 0:
+                v = v * v * v
+                u = rng.uniform(0, 1)
+                if u < 1 - 0.0331 * x * x * x * x:
+                    vec.x[i] = b * d * v
+                    break
+                if math.log(u) < 0.5 * x * x + d * (1 - v + math.log(v)):
+                    vec.x[i] = b * d * v
+                    break
+    return vec
+
+
+def _shotnoise_signal_loop(tau_D, tau_R, rate, amp_mean, amp_var, duration, dt, rng):
+    """Reference timestep by timestep implementation of gen_shotnoise_signal."""
+    h = bluecellulab.neuron.h
+    ntstep = len(h.Vector().indgen(0, duration, dt))
+    napprox = 1 + int(duration * rate / 1000)
+    napprox = int(napprox + 3 * math.sqrt(napprox))
+    rng.negexp(1 / rate)
+    iei = h.Vector(napprox)
+    iei.setrand(rng)
+    ev = h.Vector()
+    ev.integral(iei, 1).mul(1000)
+    while ev[-1] < duration:
+        iei_new = h.Vector(100)
+        iei_new.setrand(rng)
+        ev_new = h.Vector()
+        ev_new.integral(iei_new, 1).mul(1000).add(ev[-1])
+        ev.append(ev_new)
+    ev.where("<", duration)
+    ev.div(dt)
+    nev = h.Vector([round(x) for x in ev])
+    nev.where("<", ntstep)
+    sign = -1 if amp_mean < 0 else 1
+    amp_mean = abs(amp_mean)
+    gamma_scale = amp_var / amp_mean
+    amp = _gamma_loop(rng, amp_mean / gamma_scale, gamma_scale, len(nev))
+    E = h.Vector(ntstep, 0)
+    for n, A in zip(nev, amp):
+        E.x[int(n)] += sign * A
+    a = math.exp(-dt / tau_D)
+    b = math.exp(-dt / tau_R)
+    D = -math.log(a)
+    R = -math.log(b)
+    t_peak = math.log(R / D) / (R - D)
+    P = h.Vector(ntstep, 0)
+    B = h.Vector(ntstep, 0)
+    for n in range(1, ntstep):
+        P.x[n] = a * P[n - 1] + b * B[n - 1]
+        B.x[n] = b * B[n - 1] + E[n - 1]
+    P.mul((a / b - 1) / (a ** t_peak - b ** t_peak))
+    P.append(.0)
+    return P
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("params,dt", [
+    ((4.0, 0.4, 2E3, 40E-3, 16E-4, 500), 0.25),
+    ((4.0, 0.4, 200, -40E-3, 16E-4, 300), 0.025),
+    ((1.0, 0.2, 5E3, 0.5, 0.9, 200), 0.3),
+])
+def test_gen_shotnoise_signal_regression(params, dt, seed):
+    """Test that the shotnoise signal is identical to the loop version."""
+    rng = bluecellulab.neuron.h.Random()
+    rng.Random123(seed, 5, 6)
+    _, stim_vec = gen_shotnoise_signal(*params, dt=dt, rng=rng)
+    next_value = rng.uniform(0, 1)
+
+    rng.Random123(seed, 5, 6)
+    expected = _shotnoise_signal_loop(*params, dt=dt, rng=rng)
+    np.testing.assert_array_equal(stim_vec.as_numpy(), expected.as_numpy())
+    # the same random numbers were drawn
+    assert rng.uniform(0, 1) == next_value
+
+
 def test_get_relative_shotnoise_params():
     """Unit test for _get_relative_shotnoise_params."""
     rate, amp_mean, amp_var = get_relative_shotnoise_params(
@@ -48,3 +145,93 @@ def test_gen_ornstein_uhlenbeck():
 
     # test with None rng
     time_vec, stim_vec = gen_ornstein_uhlenbeck(1e-10, 0.0042, 0.029, 2, rng=None)
+
+
+def _ornstein_uhlenbeck_loop(tau, sigma, mean, duration, dt, rng):
+    """Reference timestep by timestep implementation of gen_ornstein_uhlenbeck."""
+    h = bluecellulab.neuron.h
+    ntstep = len(h.Vector().indgen(0, duration, dt))
+    svec = h.Vector(ntstep, 0)
+    noise = h.Vector(ntstep)
+    rng.normal(0.0, 1.0)
+    noise.setrand(rng)
+    mu = math.exp(-dt / tau)
+    noise.mul(sigma * math.sqrt(1 - mu * mu))
+    for n in range(1, ntstep):
+        svec.x[n] = svec[n - 1] * mu + noise[n]
+    svec.add(mean)
+    svec.append(.0)
+    return svec
+
+
+def test_gen_ornstein_uhlenbeck_regression():
+    """Test that the OU signal is identical to the loop version."""
+    params = (2.8, 0.0042, 0.029, 5000.0)
+    rng = bluecellulab.neuron.h.Random()
+
+    rng.Random123(4, 5, 6)
+    _, stim_vec = gen_ornstein_uhlenbeck(*params, dt=0.025, rng=rng)
+    rng.Random123(4, 5, 6)
+    expected = _ornstein_uhlenbeck_loop(*params, dt=0.025, rng=rng)
+    np.testing.assert_array_equal(stim_vec.as_numpy(), expected.as_numpy())
+
+
+def test_gen_ornstein_uhlenbeck_benchmark():
+    """Micro-benchmark of the OU signal against the loop version.
+
+    The timings are only reported, they depend on the load of the
+    machine.
+    """
+    params = (2.8, 0.0042, 0.029, 5000.0)
+    rng = bluecellulab.neuron.h.Random()
+
+    vectorized_time = loop_time = math.inf
+    for _ in range(3):
+        rng.Random123(4, 5, 6)
+        start = time.perf_counter()
+        gen_ornstein_uhlenbeck(*params, dt=0.025, rng=rng)
+        vectorized_time = min(vectorized_time, time.perf_counter() - start)
+
+        rng.Random123(4, 5, 6)
+        start = time.perf_counter()
+        _ornstein_uhlenbeck_loop(*params, dt=0.025, rng=rng)
+        loop_time = min(loop_time, time.perf_counter() - start)
+
+    print(f"gen_ornstein_uhlenbeck: {vectorized_time * 1e3:.1f} ms, "
+          f"loop version: {loop_time * 1e3:.1f} ms")
+
+
+def test_waveform_cache():
+    """Test the LRU eviction and the copies of the waveform cache."""
+    arrays = np.arange(4.0), np.arange(4.0) * 2  # 64 bytes per waveform
+    cache = WaveformCache(max_size=128)
+    cache.put("a", *arrays)
+    cache.put("b", *arrays)
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    cache.put("c", *arrays)
+    assert len(cache) == 2
+    assert cache.size == 128
+    assert cache.get("b") is None
+    tvec, svec = cache.get("a")
+    assert not tvec.flags.writeable
+    np.testing.assert_array_equal(svec, arrays[1])
+
+    def generate():
+        raise AssertionError("cached waveform must not be generated")
+
+    tvec, svec = cache.get_or_generate("c", generate)
+    tvec.add(1.0)
+    np.testing.assert_array_equal(cache.get("c")[0], arrays[0])
+
+    cache.put("large", np.arange(100.0), np.arange(100.0))
+    assert cache.get("large") is None
+    cache.resize(64)
+    assert len(cache) == 1
+    assert cache.get("c") is not None
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+    disabled_cache = WaveformCache()
+    disabled_cache.put("a", *arrays)
+    assert len(disabled_cache) == 0
@@ -0,0 +1,84 @@
+"""Unit tests for the topology module."""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from bluecellulab import Cell, neuron, psection
+from bluecellulab.cell.topology import CellTopology, section_type_from_name
+
+
+script_dir = Path(__file__).parent.parent
+
+
+def test_section_type_from_name():
+    """Test the section type derived from the section name."""
+    assert section_type_from_name("Cell[0].apic[3]") == "apical"
+    assert section_type_from_name("Cell[0].dend[0]") == "basal"
+    assert section_type_from_name("Cell[0].soma[0]") == "somatic"
+    assert section_type_from_name("Cell[0].axon[1]") == "axonal"
+    assert section_type_from_name("Cell[0].myelin[0]") == "myelin"
+    with pytest.raises(ValueError):
+        section_type_from_name("Cell[0].spine[0]")
+
+
+def test_topology_children():
+    """Test the children lookup of the topology arrays."""
+    parents = np.array([-1, 0, 0, 1, 1, 2])
+    topology = CellTopology(
+        [None] * 6, [f"dend[{i}]" for i in range(6)], parents,
+        np.full(6, 2, dtype=np.int8), np.ones(6), np.ones(6), np.ones(6, dtype=int))
+    assert topology.children(0).tolist() == [1, 2]
+    assert topology.children(1).tolist() == [3, 4]
+    assert topology.children(2).tolist() == [5]
+    assert topology.children(5).tolist() == []
+    assert topology.roots.tolist() == [0]
+    assert topology.n_segments == 6
+    assert topology.index("dend[4]") == 4
+    assert topology.sections_of_type("basal").tolist() == list(range(6))
+
+
+@pytest.mark.v5
+def test_cell_topology():
+    """Test the topology of a cell against the hoc sections."""
+    cell = Cell(
+        "%s/examples/cell_example1/test_cell.hoc" % script_dir,
+        "%s/examples/cell_example1" % script_dir)
+    topology = cell.topology
+    assert topology is cell.topology
+    assert len(topology) == len(cell.all)
+    assert topology.roots.tolist() == [topology.index(neuron.h.secname(sec=cell.soma))]
+    assert len(topology.sections_of_type("apical")) == len(cell.apical)
+    assert len(topology.sections_of_type("basal")) == len(cell.basal)
+    assert topology.n_segments == sum(section.nseg for section in cell.all)
+
+    for index, section in enumerate(cell.all):
+        sec_ref = neuron.h.SectionRef(sec=section)
+        assert topology.lengths[index] == section.L
+        assert topology.diameters[index] == section.diam
+        assert topology.nseg[index] == section.nseg
+        assert len(topology.children(index)) == sec_ref.nchild()
+        if sec_ref.has_parent():
+            parent = topology.sections[topology.parents[index]]
+            assert neuron.h.secname(sec=parent) == neuron.h.secname(sec=sec_ref.parent)
+
+    cell.init_psections()
+    psoma = cell.get_psection(secname=neuron.h.secname(sec=cell.soma))
+    assert psoma.pparent is None
+    assert psoma.section_type == "somatic"
+    assert len(psoma.pchildren) == len(topology.children(topology.roots[0]))
+    assert psoma._psegments is None
+    assert len(psoma.psegments) == cell.soma.nseg
+
+    # psections are only created once
+    cell.init_psections()
+    assert cell.get_psection(secname=psoma.name) is psoma
+    assert len(psoma.pchildren) == len(topology.children(topology.roots[0]))
+    assert not psoma.isLeaf
+    assert all(psec.isLeaf == (psec.href.nchild() == 0)
+               for psec in cell.secname_to_psection.values())
+
+    # the hoc children are used when the children are not populated
+    standalone_psoma = psection.PSection(cell.soma)
+    assert not standalone_psoma.pchildren
+    assert not standalone_psoma.isLeaf
@@ -1,13 +1,20 @@
 """Unit tests for the circuit_access module."""
 
 from pathlib import Path
+import time
 from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
 from bluecellulab.circuit import CellId, SonataCircuitAccess
-from bluecellulab.circuit.circuit_access import EmodelProperties, get_synapse_connection_parameters
+from bluecellulab.circuit.circuit_access import (
+    ConnectionParametersResolver,
+    EmodelProperties,
+    _merge_connection_entries,
+    get_synapse_connection_parameters,
+)
+from bluecellulab.circuit.config.sections import ConnectionOverrides
 from bluecellulab.circuit import SynapseProperty
 
 
@@ -223,3 +230,135 @@ def test_morph_filepath_asc():
     circuit_access = SonataCircuitAccess(circuit_sonata_quick_scx_config)
     asc_morph = circuit_access.morph_filepath(CellId("NodeA", 1))
     assert asc_morph.endswith(".asc")
+
+
+def test_extract_synapses_for_cells():
+    """Test that the batched extraction matches the per cell extraction."""
+    multicircuit_sim_config = (
+        parent_dir
+        / "examples"
+        / "sim_quick_scx_sonata_multicircuit"
+        / "simulation_config_noinput.json"
+    )
+    circuit_access = SonataCircuitAccess(multicircuit_sim_config)
+    properties = [
+        SynapseProperty.PRE_GID,
+        SynapseProperty.AXONAL_DELAY,
+        SynapseProperty.POST_SECTION_ID,
+        SynapseProperty.POST_SEGMENT_ID,
+        SynapseProperty.POST_SEGMENT_OFFSET,
+        SynapseProperty.G_SYNX,
+        SynapseProperty.NRRP,
+        SynapseProperty.U_HILL_COEFFICIENT,
+        SynapseProperty.CONDUCTANCE_RATIO]
+    cell_ids = [CellId("NodeA", 0), CellId("NodeA", 1), CellId("NodeB", 1)]
+    res = circuit_access.extract_synapses_for_cells(cell_ids, properties, None)
+    assert res.index.names == ["post_population_name", "post_gid", "edge_name", "synapse_id"]
+    assert res.shape == (12, 12)
+
+    for cell_id in cell_ids:
+        expected = circuit_access.extract_synapses(cell_id, properties, None)
+        cell_synapses = res.loc[(cell_id.population_name, cell_id.id)]
+        pd.testing.assert_frame_equal(cell_synapses, expected, check_dtype=False)
+
+    # projection parameter
+    res = circuit_access.extract_synapses_for_cells(cell_ids, properties, "NodeB")
+    assert set(res["source_population_name"]) == {"NodeB"}
+    assert res.shape == (6, 12)
+
+    assert circuit_access.extract_synapses_for_cells([], properties, None).empty
+
+    # the presynaptic cells are selected while reading
+    pre_cell_ids = [CellId("NodeB", 0), CellId("NodeA", 2)]
+    res = circuit_access.extract_synapses_for_cells(cell_ids, properties, None, pre_cell_ids)
+    all_res = circuit_access.extract_synapses_for_cells(cell_ids, properties, None)
+    selected = [
+        (pop, gid) in {(x.population_name, x.id) for x in pre_cell_ids}
+        for pop, gid in zip(all_res["source_population_name"], all_res[SynapseProperty.PRE_GID])]
+    pd.testing.assert_frame_equal(res, all_res[selected])
+    single = circuit_access.extract_synapses(CellId("NodeA", 0), properties, None, pre_cell_ids)
+    pd.testing.assert_frame_equal(single, res.loc[("NodeA", 0)])
+
+
+def test_connection_parameters_resolver():
+    """The resolver gives the same overrides with fewer target lookups."""
+    multicircuit_sim_config = (
+        parent_dir
+        / "examples"
+        / "sim_quick_scx_sonata_multicircuit"
+        / "simulation_config_noinput.json"
+    )
+    circuit_access = SonataCircuitAccess(multicircuit_sim_config)
+    entries = [
+        ConnectionOverrides(source="Mosaic_A", target="Mosaic_A", weight=2.0, spont_minis=0.01),
+        ConnectionOverrides(source="Mosaic_B", target="Mosaic_A", synapse_configure="%s.mg = 1.0"),
+        ConnectionOverrides(source="Mosaic_A", target="Mosaic_B", delay=10.0, weight=0.5),
+        ConnectionOverrides(source="Mosaic_A", target="Mosaic_A", synapse_configure="%s.e = 0"),
+    ]
+    circuit_access.config.connection_entries = lambda: entries  # type: ignore
+    cell_ids = [CellId("NodeA", 0), CellId("NodeA", 1), CellId("NodeA", 2),
+                CellId("NodeB", 0), CellId("NodeB", 1)]
+    # every post cell receives 100 synapses from each of the pre cells
+    pairs = [(pre, post) for post in cell_ids for pre in cell_ids for _ in range(100)]
+
+    with patch.object(circuit_access, "target_contains_cell",
+                      wraps=circuit_access.target_contains_cell) as per_synapse_lookup:
+        expected = [get_synapse_connection_parameters(circuit_access, pre, post)
+                    for pre, post in pairs]
+    with patch.object(circuit_access, "target_contains_cell",
+                      wraps=circuit_access.target_contains_cell) as resolver_lookup:
+        resolver = ConnectionParametersResolver(circuit_access)
+        resolved = [resolver.resolve(pre, post) for pre, post in pairs]
+
+    assert resolved == expected
+    assert resolver.resolve(CellId("NodeB", 0), CellId("NodeA", 1))["SynapseConfigure"] == ["%s.mg = 1.0"]
+    assert resolver.resolve(CellId("NodeA", 0), CellId("NodeB", 1))["DelayWeights"] == [(10.0, 0.5)]
+    # targets are checked once per cell, not once per synapse
+    assert resolver_lookup.call_count <= 2 * len(entries) * len(cell_ids)
+    assert per_synapse_lookup.call_count > 50 * resolver_lookup.call_count
+
+
+def test_connection_parameters_resolver_benchmark():
+    """Micro-benchmark of the resolver against merging the connection blocks
+    of every synapse, on a config with many connection blocks.
+
+    The timings are only reported, they depend on the load of the
+    machine.
+    """
+    multicircuit_sim_config = (
+        parent_dir
+        / "examples"
+        / "sim_quick_scx_sonata_multicircuit"
+        / "simulation_config_noinput.json"
+    )
+    circuit_access = SonataCircuitAccess(multicircuit_sim_config)
+    entries = []
+    for idx in range(25):
+        entries.append(ConnectionOverrides(
+            source="Mosaic_A", target="Mosaic_A", weight=1.0 + idx, spont_minis=0.01))
+        entries.append(ConnectionOverrides(
+            source="Mosaic_B", target="Mosaic_A", synapse_configure=f"%s.mg = {idx}"))
+        entries.append(ConnectionOverrides(
+            source="Mosaic_A", target="Mosaic_B", delay=10.0 + idx, weight=0.5))
+    circuit_access.config.connection_entries = lambda: entries  # type: ignore
+    cell_ids = [CellId("NodeA", 0), CellId("NodeA", 1), CellId("NodeA", 2),
+                CellId("NodeB", 0), CellId("NodeB", 1)]
+    pairs = [(pre, post) for post in cell_ids for pre in cell_ids for _ in range(20)]
+
+    start = time.perf_counter()
+    expected = [_merge_connection_entries([
+        entry for entry in entries
+        if circuit_access.target_contains_cell(entry.source, pre)
+        and circuit_access.target_contains_cell(entry.target, post)])
+        for pre, post in pairs]
+    merge_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    resolver = ConnectionParametersResolver(circuit_access)
+    resolved = [resolver.resolve(pre, post) for pre, post in pairs]
+    resolver_time = time.perf_counter() - start
+
+    assert resolved == expected
+    print(f"{len(pairs)} synapses, {len(entries)} connection blocks: "
+          f"ConnectionParametersResolver: {resolver_time * 1e3:.1f} ms, "
+          f"_merge_connection_entries per synapse: {merge_time * 1e3:.1f} ms")
@@ -0,0 +1,60 @@
+"""Unit tests for the iotools module."""
+
+import os
+from pathlib import Path
+import shutil
+
+import numpy as np
+import pytest
+
+from bluecellulab.circuit.node_id import CellId
+
+parent_dir = Path(__file__).resolve().parent.parent
+
+outdat_path = parent_dir / "examples" / "sim_quick_scx_bluepy" / "output" / "out.dat"
+
+
+@pytest.mark.v5
+def test_read_outdat_index(tmp_path):
+    """Test the spike index of out.dat."""
+    from bluecellulab.circuit.iotools import outdat_index_path, parse_outdat, read_outdat
+
+    path = tmp_path / "out.dat"
+    shutil.copy(outdat_path, path)
+    path.chmod(0o644)
+    index_dir = tmp_path / "spike_index"
+    gids, times = read_outdat(path)
+    assert not index_dir.exists()
+    assert len(gids) == 35
+    assert np.all(np.diff(gids) >= 0)
+
+    read_outdat(path, index_dir)
+    index_path = outdat_index_path(path, index_dir)
+    assert index_path.parent == index_dir
+    assert index_path.stat().st_mtime_ns == path.stat().st_mtime_ns
+    assert index_path.stat().st_mode == path.stat().st_mode
+    cached_gids, cached_times = read_outdat(path, index_dir)
+    assert isinstance(cached_times, np.memmap)
+    np.testing.assert_array_equal(cached_gids, gids)
+    np.testing.assert_array_equal(cached_times, times)
+
+    # a modified out.dat invalidates the index
+    with open(path, "a") as outdat:
+        outdat.write("0.500\t1\n")
+    os.utime(path, ns=(path.stat().st_atime_ns, index_path.stat().st_mtime_ns + 10**9))
+    gids, _ = read_outdat(path, index_dir)
+    assert len(gids) == 36
+    assert parse_outdat(path, index_dir)[CellId("", 1)][0] == 0.1
+
+
+@pytest.mark.v5
+def test_read_outdat_unwritable_index_dir(tmp_path):
+    """The spikes are parsed when the spike index cannot be written."""
+    from bluecellulab.circuit.iotools import read_outdat
+
+    index_dir = tmp_path / "spike_index"
+    index_dir.write_text("not a directory")
+    gids, times = read_outdat(outdat_path, index_dir)
+    expected_gids, expected_times = read_outdat(outdat_path)
+    np.testing.assert_array_equal(gids, expected_gids)
+    np.testing.assert_array_equal(times, expected_times)
@@ -64,6 +64,18 @@ class TestSonataSimulationAccess:
         assert np.max(soma_voltage) == pytest.approx(41.53086)
         assert np.min(soma_voltage) == pytest.approx(-77.127716)
 
+    def test_get_soma_voltages(self):
+        """Test SonataCircuitAccess.get_soma_voltages."""
+        cell_ids = [CellId("hippocampus_neurons", 2), CellId("hippocampus_neurons", 1)]
+        t_start, t_end, t_step = 0, 100, 0.1
+        soma_voltages = self.simulation_access.get_soma_voltages(
+            cell_ids, t_start, t_end, t_step)
+        assert soma_voltages.shape[0] == 2
+        for cell_id, soma_voltage in zip(cell_ids, soma_voltages):
+            np.testing.assert_array_equal(
+                soma_voltage,
+                self.simulation_access.get_soma_voltage(cell_id, t_start, t_end, t_step))
+
     def test_get_soma_time_trace(self):
         """Test SonataCircuitAccess.get_soma_time_trace."""
         t_step = 0.1
@@ -81,3 +93,26 @@ class TestSonataSimulationAccess:
         assert len(spikes[cell_id]) == 4
         np.testing.assert_almost_equal(
             spikes[cell_id], np.array([10.1, 22.65, 35.15, 47.675]))
+
+    def test_get_spike_index(self):
+        """Test SonataCircuitAccess.get_spike_index."""
+        spike_index = self.simulation_access.get_spike_index()
+        assert spike_index is self.simulation_access.get_spike_index()
+        spikes = self.simulation_access.get_spikes()
+        assert sorted(spike_index.cell_ids()) == sorted(spikes)
+        for cell_id, train in spikes.items():
+            np.testing.assert_array_equal(spike_index.get(cell_id), np.sort(train))
+
+    def test_get_spike_index_cell_ids(self):
+        """Test SonataCircuitAccess.get_spike_index restricted to cell ids."""
+        cell_ids = [CellId("hippocampus_neurons", 2), CellId("hippocampus_neurons", 5),
+                    CellId("other_population", 2)]
+        spike_index = self.simulation_access.get_spike_index(cell_ids)
+        # the whole report is not read
+        assert self.simulation_access._spike_index is None
+        spikes = self.simulation_access.get_spikes()
+        expected = [cell_id for cell_id in cell_ids if cell_id in spikes]
+        assert sorted(spike_index.cell_ids()) == sorted(expected)
+        for cell_id in expected:
+            np.testing.assert_array_equal(
+                spike_index.get(cell_id), np.sort(spikes[cell_id]))
@@ -0,0 +1,47 @@
+"""Unit tests for the spike_index module."""
+
+import numpy as np
+
+from bluecellulab.circuit import CellId, SpikeIndex
+
+
+def test_spike_index():
+    """Test the lookup of the spike trains in the index."""
+    populations = np.array(["A", "B", "A", "A", "B", "A"])
+    ids = np.array([2, 0, 1, 2, 0, 2])
+    times = np.array([3.0, 1.5, 2.0, 1.0, 0.5, 2.5])
+    index = SpikeIndex.from_arrays(populations, ids, times)
+
+    assert len(index) == 3
+    assert CellId("A", 2) in index
+    assert CellId("A", 0) not in index
+    assert CellId("C", 2) not in index
+    np.testing.assert_array_equal(index.get(CellId("A", 2)), [1.0, 2.5, 3.0])
+    np.testing.assert_array_equal(index.get(CellId("B", 0)), [0.5, 1.5])
+    assert index.get(CellId("A", 3)) is None
+
+    trains = index.get_trains([CellId("A", 1), CellId("A", 5), CellId("B", 0)])
+    assert list(trains) == [CellId("A", 1), CellId("B", 0)]
+    assert sorted(index.to_dict()) == [CellId("A", 1), CellId("A", 2), CellId("B", 0)]
+
+
+def test_spike_index_from_dict():
+    """Test the index built from a dictionary of spike trains."""
+    trains = {CellId("", 4): [8.0, 2.0], CellId("", 1): [5.0]}
+    index = SpikeIndex.from_dict(trains)
+    np.testing.assert_array_equal(index.get(CellId("", 4)), [2.0, 8.0])
+    np.testing.assert_array_equal(index.get(CellId("", 1)), [5.0])
+    assert len(SpikeIndex.from_dict({})) == 0
+
+
+def test_spike_index_window():
+    """Test the spike trains clipped to a time window."""
+    index = SpikeIndex.from_arrays(
+        np.array(["A"] * 5), np.array([1, 1, 1, 1, 2]),
+        np.array([1.0, 2.0, 3.0, 4.0, 10.0]))
+    cell_id = CellId("A", 1)
+    np.testing.assert_array_equal(index.get(cell_id, 2.0, 3.0), [2.0, 3.0])
+    np.testing.assert_array_equal(index.get(cell_id, t_stop=2.5), [1.0, 2.0])
+    np.testing.assert_array_equal(index.get(cell_id, t_start=3.5), [4.0])
+    trains = index.get_trains([cell_id, CellId("A", 2)], t_stop=5.0)
+    assert len(trains[CellId("A", 2)]) == 0
@@ -0,0 +1,119 @@
+"""Unit tests for the synapse_cache module."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from bluecellulab.circuit import CellId, SonataCircuitAccess, SynapseCache, SynapseProperty
+from bluecellulab.synapse import SynDescription
+
+
+parent_dir = Path(__file__).resolve().parent.parent
+
+multicircuit_sim_config = (
+    parent_dir
+    / "examples"
+    / "sim_quick_scx_sonata_multicircuit"
+    / "simulation_config_noinput.json"
+)
+
+
+def _synapses(n_rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            SynapseProperty.PRE_GID: np.arange(n_rows, dtype=np.int64),
+            SynapseProperty.G_SYNX: np.linspace(0, 1, n_rows, dtype=np.float32),
+            "source_population_name": ["NodeA"] * n_rows,
+        },
+        index=pd.MultiIndex.from_arrays(
+            [["NodeA__NodeA__chemical"] * n_rows, np.arange(n_rows)],
+            names=["edge_name", "synapse_id"]),
+    )
+
+
+def test_synapse_cache_roundtrip(tmp_path):
+    """Test that the stored synapses are loaded back identically."""
+    cache = SynapseCache(tmp_path / "cache")
+    synapses = _synapses(5)
+    cache.save("key", synapses)
+    pd.testing.assert_frame_equal(cache.load("key"), synapses)
+
+    cache.save("empty", pd.DataFrame())
+    assert cache.load("empty").empty
+    assert cache.load("missing") is None
+
+    cache.clear()
+    assert cache.load("key") is None
+
+
+def test_synapse_cache_key(tmp_path):
+    """Test that the key changes with the edge file and the parameters."""
+    edge_file = tmp_path / "edges.h5"
+    edge_file.write_bytes(b"edges")
+    cell_id = CellId("NodeA", 1)
+    properties = [SynapseProperty.PRE_GID]
+
+    key = SynapseCache.key(edge_file, "edges", cell_id, properties, 0.025)
+    assert key == SynapseCache.key(edge_file, "edges", cell_id, properties, 0.025)
+    assert key != SynapseCache.key(edge_file, "edges", cell_id, properties, 0.1)
+    assert key != SynapseCache.key(edge_file, "edges", CellId("NodeA", 2), properties, 0.025)
+    assert key != SynapseCache.key(
+        edge_file, "edges", cell_id, properties + [SynapseProperty.G_SYNX], 0.025)
+
+    edge_key = SynapseCache.edge_key(edge_file, "edges", properties, 0.025)
+    assert key == SynapseCache.cell_key(edge_key, cell_id)
+    assert key != SynapseCache.cell_key(edge_key, CellId("NodeB", 1))
+
+    stat = edge_file.stat()
+    os.utime(edge_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert key != SynapseCache.key(edge_file, "edges", cell_id, properties, 0.025)
+
+
+def test_synapse_cache_eviction(tmp_path):
+    """Test that the least recently used entries are evicted first."""
+    cache = SynapseCache(tmp_path, max_size=10**9)
+    for idx in range(3):
+        cache.save(f"key{idx}", _synapses(100))
+        os.utime(tmp_path / f"key{idx}.npz", ns=(idx, idx))
+    cache.load("key0")  # key0 becomes the most recently used
+    entry_size = (tmp_path / "key1.npz").stat().st_size
+
+    cache.max_size = 3 * entry_size
+    # saving doesn't evict
+    cache.save("key3", _synapses(100))
+    os.utime(tmp_path / "key3.npz", ns=(3, 3))
+    assert len(list(tmp_path.glob("*.npz"))) == 4
+    cache.evict()
+    assert cache.load("key1") is None
+    assert cache.load("key0") is not None
+    assert cache.load("key2") is not None
+
+
+def test_sonata_circuit_access_synapse_cache(tmp_path):
+    """Test that the cached synapses are identical and skip the edges."""
+    properties = SynDescription().common_properties
+    cell_ids = [CellId("NodeA", 0), CellId("NodeA", 1), CellId("NodeB", 0)]
+    expected = SonataCircuitAccess(multicircuit_sim_config).extract_synapses_for_cells(
+        cell_ids, properties, None)
+
+    circuit_access = SonataCircuitAccess(
+        multicircuit_sim_config, synapse_cache=SynapseCache(tmp_path))
+    first = circuit_access.extract_synapses_for_cells(cell_ids, properties, None)
+    pd.testing.assert_frame_equal(first, expected)
+
+    with patch.object(SonataCircuitAccess, "_read_edge_synapses") as extract:
+        second = circuit_access.extract_synapses_for_cells(cell_ids, properties, None)
+        single = circuit_access.extract_synapses(CellId("NodeA", 0), properties, None)
+    extract.assert_not_called()
+    pd.testing.assert_frame_equal(second, expected)
+    pd.testing.assert_frame_equal(single, expected.loc[("NodeA", 0)])
+
+    # the presynaptic cells are selected in the cached synapses
+    pre_cell_ids = [CellId("NodeB", 0)]
+    pd.testing.assert_frame_equal(
+        circuit_access.extract_synapses_for_cells(cell_ids, properties, None, pre_cell_ids),
+        SonataCircuitAccess(multicircuit_sim_config).extract_synapses_for_cells(
+            cell_ids, properties, None, pre_cell_ids))
@@ -107,3 +107,39 @@ class TestCellcSTUTBaseClass:
         # in nrn repo
         assert np.mean(voltage_ss) == approx(-75.61918061202924, abs=1e-6)
         assert np.std(voltage_ss) == approx(0.19192736450671288, abs=1e-6)
+
+
+@pytest.mark.v5
+@pytest.mark.parametrize("output_name", ["recordings", "recordings.h5"])
+def test_streaming_recorder(tmp_path, output_name):
+    """Simulation: the streamed recordings are identical to the in-memory ones"""
+    cell = bluecellulab.Cell(
+        parent_dir / "examples/cell_example1/test_cell.hoc",
+        str(parent_dir / "examples/cell_example1"))
+    cell.add_step(start_time=2.0, stop_time=22.0, level=1.0)
+    cell.add_allsections_voltagerecordings()
+    sim = bluecellulab.Simulation()
+    sim.add_cell(cell)
+    sim.run(30, cvode=False)
+    expected = {f"{cell.hocname}/{name}": cell.get_recording(name)
+                for name in cell.recordings}
+
+    recorder = bluecellulab.simulation.StreamingRecorder(
+        tmp_path / output_name, flush_interval=7.0)
+    recorder.add_cell(cell)
+    sim.add_recorder(recorder)
+    sim.run(30, cvode=False)
+
+    # only the values after the last flush are kept in memory
+    with pytest.warns(UserWarning, match="StreamingRecorder.load"):
+        assert len(cell.get_time()) == 0
+    recordings = bluecellulab.simulation.StreamingRecorder.load(tmp_path / output_name)
+    assert recordings.keys() == expected.keys()
+    for key, values in expected.items():
+        np.testing.assert_array_equal(recordings[key], values)
+
+    # the values of the next runs are appended to the output
+    sim.run(30, cvode=False)
+    recordings = bluecellulab.simulation.StreamingRecorder.load(tmp_path / output_name)
+    for key, values in expected.items():
+        np.testing.assert_array_equal(recordings[key], np.concatenate([values, values]))
@@ -4,9 +4,12 @@ from pathlib import Path
 from bluecellulab.circuit.simulation_access import _sample_array
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from bluecellulab import SSim
+from bluecellulab.circuit import CellId, SynapseProperty
+from bluecellulab.exceptions import BluecellulabError
 
 parent_dir = Path(__file__).resolve().parent
 
@@ -101,6 +104,21 @@ def test_ssim_intersect_pre_gids_multipopulation():
     sim2.instantiate_gids(cell_ids, add_synapses=True, intersect_pre_gids=[("NodeB", 0)])
     assert len([x.synapses for x in sim2.cells.values()][0]) == 2
     assert len([x.synapses for x in sim2.cells.values()][1]) == 0
+    # the synapse ids are the same as without the intersection
+    assert set(sim2.cells[("NodeA", 0)].synapses) <= set(sim.cells[("NodeA", 0)].synapses)
+
+
+def test_intersect_pre_gids_cell_ids_multipopulation():
+    """Test the intersection on the population name and the pre gid."""
+    syn_descriptions = pd.DataFrame({
+        SynapseProperty.PRE_GID: [0, 1, 0, 1, 2],
+        "source_population_name": ["NodeA", "NodeA", "NodeB", "NodeB", "NodeB"],
+    })
+    pre_cell_ids = [CellId("NodeA", 1), CellId("NodeB", 0), CellId("NodeB", 3)]
+    res = SSim._intersect_pre_gids_cell_ids_multipopulation(syn_descriptions, pre_cell_ids)
+    assert res.index.tolist() == [1, 2]
+    assert SSim._intersect_pre_gids_cell_ids_multipopulation(syn_descriptions, []).empty
+    assert SSim._intersect_pre_gids_cell_ids_multipopulation(pd.DataFrame(), pre_cell_ids).empty
 
 
 @pytest.mark.v6
@@ -120,3 +138,130 @@ def test_merge_pre_spike_trains_edge_case():
                           intersect_pre_gids=None)
     cell_info_dict = ssim.cells[cell_id].info_dict
     assert cell_info_dict["connections"] != {}
+
+
+def test_run_cells_parallel():
+    """Parallel simulation of disconnected cells gives the serial results."""
+    sonata_sim_path = (
+        parent_dir
+        / "examples"
+        / "sim_quick_scx_sonata_multicircuit"
+        / "simulation_config_ornstein.json"
+    )
+    cell_ids = [CellId("NodeA", 0), CellId("NodeA", 1), CellId("NodeB", 0)]
+    instantiate_kwargs = dict(
+        add_synapses=True, add_minis=True, add_stimuli=True, add_replay=True)
+
+    sim = SSim(sonata_sim_path)
+    results = sim.run_cells_parallel(
+        cell_ids, n_workers=2, instantiate_kwargs=instantiate_kwargs,
+        run_kwargs=dict(t_stop=50))
+    assert list(results) == cell_ids
+    assert sim.cells == {}
+
+    sim.instantiate_gids(cell_ids, interconnect_cells=False, **instantiate_kwargs)
+    sim.run(t_stop=50)
+    for cell_id in cell_ids:
+        np.testing.assert_array_equal(results[cell_id]["time"], sim.get_time_trace())
+        np.testing.assert_array_equal(
+            results[cell_id]["voltage"], sim.get_voltage_trace(cell_id))
+        assert isinstance(results[cell_id]["spikes"], np.ndarray)
+
+    with pytest.raises(BluecellulabError):
+        sim.run_cells_parallel(cell_ids, instantiate_kwargs=dict(interconnect_cells=True))
+
+    assert sim._init_kwargs["print_cellstate"] is False
+    sim._init_kwargs["simulation_config"] = lambda: sonata_sim_path  # not picklable
+    with pytest.raises(BluecellulabError, match="picklable"):
+        sim.run_cells_parallel(cell_ids)
+
+
+@pytest.mark.v6
+def test_share_replay_vecstims():
+    """Sharing the replay VecStims of presynaptic cells gives the same results."""
+    sonata_sim_path = (
+        parent_dir
+        / "examples"
+        / "sim_quick_scx_sonata_multicircuit"
+        / "simulation_config_noinput.json"
+    )
+    cell_id = CellId("NodeA", 0)
+    voltages = []
+    for share_replay_vecstims in [False, True]:
+        ssim = SSim(sonata_sim_path)
+        ssim.instantiate_gids(cell_id, add_minis=True, add_replay=True,
+                              add_synapses=True, interconnect_cells=False,
+                              share_replay_vecstims=share_replay_vecstims)
+        # the connections without replayed spikes have no VecStim
+        replay_connections = [connection for connection
+                              in ssim.cells[cell_id].connections.values()
+                              if connection.persistent]
+        vecstims = {connection.persistent[1].hname() for connection in replay_connections}
+        pre_gids = {connection.post_synapse.pre_gid for connection in replay_connections}
+        if share_replay_vecstims:
+            assert len(vecstims) == len(pre_gids)
+        else:
+            assert len(vecstims) == len(replay_connections)
+        ssim.run(t_stop=50)
+        voltages.append(ssim.get_voltage_trace(cell_id))
+        ssim.delete()
+
+    np.testing.assert_array_equal(voltages[0], voltages[1])
+
+
+@pytest.mark.v6
+def test_replay_window():
+    """The spikes after t_stop don't change the replay results."""
+    sonata_sim_path = (
+        parent_dir
+        / "examples"
+        / "sim_quick_scx_sonata_multicircuit"
+        / "simulation_config_noinput.json"
+    )
+    cell_id = CellId("NodeA", 0)
+    voltages = []
+    n_spikes = []
+    for replay_window in [None, (None, 20.0)]:
+        ssim = SSim(sonata_sim_path)
+        ssim.instantiate_gids(cell_id, add_minis=True, add_replay=True,
+                              add_synapses=True, interconnect_cells=False,
+                              replay_window=replay_window)
+        n_spikes.append(sum(
+            len(connection.pre_spiketrain)
+            for connection in ssim.cells[cell_id].connections.values()
+            if connection.pre_spiketrain is not None))
+        ssim.run(t_stop=20)
+        voltages.append(ssim.get_voltage_trace(cell_id))
+        ssim.delete()
+
+    np.testing.assert_array_equal(voltages[0], voltages[1])
+    assert n_spikes[1] <= n_spikes[0]
+
+
+@pytest.mark.v6
+def test_delete_print_cellstate(tmp_path, monkeypatch):
+    """Only the gids of the deleted SSim are released in the ParallelContext."""
+    monkeypatch.chdir(tmp_path)  # the cell states are written to the cwd
+    sonata_sim_path = (
+        parent_dir
+        / "examples"
+        / "sim_quick_scx_sonata_multicircuit"
+        / "simulation_config_noinput.json"
+    )
+    cell_id = CellId("NodeA", 0)
+    ssim = SSim(sonata_sim_path, print_cellstate=True)
+    ssim.instantiate_gids(cell_id)
+    assert ssim.pc.gid_exists(cell_id.id)
+    other_cell_id = CellId("NodeA", 1)
+    other_ssim = SSim(sonata_sim_path, print_cellstate=True)
+    other_ssim.instantiate_gids(other_cell_id)
+    ssim.delete()
+    assert not ssim.pc.gid_exists(cell_id.id)
+    # the gids of the other SSim in the same process are kept
+    assert other_ssim.pc.gid_exists(other_cell_id.id)
+    other_ssim.delete()
+
+    ssim.instantiate_gids(cell_id)
+    assert ssim.pc.gid_exists(cell_id.id)
+    ssim.run(t_stop=10)
+    ssim.delete()
@@ -1,9 +1,12 @@
 """Unit tests for the synapse module."""
 
 import numpy as np
+import pandas as pd
 from pytest import approx
 
+from bluecellulab.circuit import SynapseProperty
 from bluecellulab.synapse import Synapse
+from bluecellulab.synapse.synapse_types import PreparedSynDescription
 
 
 def test_calc_u_scale_factor():
@@ -27,3 +30,35 @@ def test_calc_u_scale_factor():
     assert scale_factor(a, 2) == approx(Synapse.calc_u_scale_factor(a, 2))
     assert scale_factor(a, 2.2) == approx(Synapse.calc_u_scale_factor(a, 2.2))
     assert scale_factor(a, b) == approx(Synapse.calc_u_scale_factor(a, b))
+    assert Synapse.calc_u_scale_factors(np.array([a, b]), 2.2) == approx(
+        [Synapse.calc_u_scale_factor(a, 2.2), Synapse.calc_u_scale_factor(b, 2.2)])
+
+
+def test_prepare_syn_descriptions():
+    """Test the columnar preparation against update_syn_description."""
+    syn_descriptions = pd.DataFrame({
+        SynapseProperty.PRE_GID: [1, 2, 3],
+        SynapseProperty.U_SYN: [0.5, 0.4, 0.3],
+        SynapseProperty.U_HILL_COEFFICIENT: [4.62799366, np.nan, 3.27495564],
+        SynapseProperty.NRRP: [2.0, 3.0, np.nan],
+    })
+    extracellular_calcium = 1.2
+    records = Synapse.prepare_syn_descriptions(syn_descriptions, extracellular_calcium)
+    assert len(records) == 3
+
+    synapse = Synapse.__new__(Synapse)
+    synapse.extracellular_calcium = extracellular_calcium
+    for record, (_, row) in zip(records, syn_descriptions.iterrows()):
+        assert record == synapse.update_syn_description(row)
+        # prepared records are not updated twice
+        assert isinstance(record, PreparedSynDescription)
+        assert synapse.update_syn_description(record) is record
+        # plain dicts are always updated
+        assert synapse.update_syn_description(dict(row)) is not record
+
+    assert SynapseProperty.U_HILL_COEFFICIENT not in records[1]
+    assert records[1]["u_scale_factor"] == 1.0
+    assert SynapseProperty.NRRP not in records[2]
+
+    records = Synapse.prepare_syn_descriptions(syn_descriptions, None)
+    assert [r["u_scale_factor"] for r in records] == [1.0, 1.0, 1.0]
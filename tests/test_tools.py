@@ -7,12 +7,25 @@
 
 import json
 import os
+from pathlib import Path
 
 import numpy as np
 import pytest
 
 import bluecellulab
-from bluecellulab.tools import NumpyEncoder, Singleton
+from bluecellulab.circuit import CellId
+from bluecellulab.exceptions import BluecellulabError
+from bluecellulab.tools import (
+    CalibrationPool,
+    CurrentStepSearch,
+    NumpyEncoder,
+    Singleton,
+    _find_bracketed_root,
+    _trial_worker,
+    calculate_SS_voltage,
+    stochastic_mechanism_names,
+    template_accepts_cvode,
+)
 
 script_dir = os.path.dirname(__file__)
 
@@ -33,6 +46,114 @@ def test_calculate_SS_voltage_subprocess():
     assert abs(SS_voltage_stoch - -73.9235504304) < 0.001
 
 
+@pytest.mark.v5
+def test_current_step_search():
+    """Tools: Test the trials on a single cell are independent"""
+    with CurrentStepSearch(
+            "%s/examples/cell_example1/test_cell.hoc" % script_dir,
+            "%s/examples/cell_example1" % script_dir) as search:
+        assert not search.stochastic
+        step_voltage = search.ss_voltage(0.1)
+        SS_voltage = search.ss_voltage(0)
+        assert abs(SS_voltage - -73.9235504304) < 0.001
+        assert search.ss_voltage(0.1) == step_voltage
+        assert len(search.cell.persistent) == 0
+
+        hyp_current = search.search_hyp_current(-80, -1.0, 0.0)
+        assert abs(search.ss_voltage(hyp_current) - -80) < 0.5
+        assert step_voltage > SS_voltage
+
+    # the stochastic cells are rebuilt for each trial
+    with CurrentStepSearch(
+            "%s/examples/cell_example2/test_cell.hoc" % script_dir,
+            "%s/examples/cell_example2" % script_dir) as search:
+        SS_voltage = search.ss_voltage(0)
+        assert abs(SS_voltage - -73.9235504304) < 0.001
+        assert search.stochastic
+        assert search.ss_voltage(0) == SS_voltage
+
+
+def test_stochastic_mechanism_names():
+    """Tools: Test the detection of the stochastic mechanisms"""
+    names = stochastic_mechanism_names()
+    assert {"StochKv", "StochKv3"} <= names
+    assert "hh" not in names
+    assert template_accepts_cvode(
+        "%s/examples/cell_example1/test_cell.hoc" % script_dir)
+    assert not template_accepts_cvode(
+        "%s/examples/cell_example2/test_cell.hoc" % script_dir)
+
+
+@pytest.mark.v5
+def test_trial_worker():
+    """Tools: Test the worker process is reused by the trial functions"""
+    worker_pid = _trial_worker().apply(os.getpid)
+    assert worker_pid != os.getpid()
+    SS_voltage = calculate_SS_voltage(
+        "%s/examples/cell_example1/test_cell.hoc" % script_dir,
+        "%s/examples/cell_example1" % script_dir, 0)
+    assert abs(SS_voltage - -73.9235504304) < 0.001
+    assert calculate_SS_voltage(
+        "%s/examples/cell_example1/test_cell.hoc" % script_dir,
+        "%s/examples/cell_example1" % script_dir, 0) == SS_voltage
+    assert _trial_worker().apply(os.getpid) == worker_pid
+
+
+def test_find_bracketed_root():
+    """Tools: Test the bracketed root finder"""
+    calls = []
+
+    def func(x):
+        calls.append(x)
+        return x ** 3 + 2 * x - 1
+
+    root = _find_bracketed_root(func, 0.0, 1.0, 1e-6, 50)
+    assert abs(func(root)) < 1e-6
+    assert len(calls) < 20
+
+    assert _find_bracketed_root(lambda x: x - 1, 0.0, 1.0, 1e-6, 50) == 1.0
+
+    with pytest.raises(BluecellulabError, match="not bracketed"):
+        _find_bracketed_root(lambda x: x + 1, 0.0, 1.0, 1e-6, 50)
+    with pytest.raises(BluecellulabError, match="No root found"):
+        _find_bracketed_root(lambda x: x ** 3 - 0.3, 0.0, 1.0, 1e-6, 1)
+
+
+def test_calibration_pool():
+    """Tools: Test the trials of the calibration workers"""
+    sonata_sim_path = (
+        Path(script_dir)
+        / "examples"
+        / "sim_quick_scx_sonata_multicircuit"
+        / "simulation_config_ornstein.json"
+    )
+    trials = [(("NodeA", 0), 0.0), (("NodeA", 1), 0.0), (("NodeA", 0), -0.1)]
+    with CalibrationPool(sonata_sim_path, n_workers=2) as pool:
+        voltages = pool.ss_voltages(trials, start_time=20, stop_time=50)
+        hyp_currents = pool.search_hyp_currents(
+            [("NodeA", 0)], target_voltage=voltages["ss_voltage"][2],
+            start_time=20, stop_time=50)
+
+    assert voltages["gid"].tolist() == [0, 1, 0]
+    assert voltages["current"].tolist() == [0.0, 0.0, -0.1]
+    assert voltages["ss_voltage"][2] < voltages["ss_voltage"][0]
+    assert hyp_currents["n_trials"][0] > 0
+    assert abs(hyp_currents["ss_voltage"][0] - voltages["ss_voltage"][2]) < 0.5
+
+    # the same cell instantiated again in a serial SSim
+    ssim = bluecellulab.SSim(sonata_sim_path)
+    for _ in range(2):
+        ssim.instantiate_gids([CellId("NodeA", 0)], add_synapses=True,
+                              add_minis=True, add_stimuli=True, add_replay=True)
+        ssim.cells[CellId("NodeA", 0)].add_ramp(0, 50, -0.1, -0.1)
+        ssim.run(t_stop=50)
+        time = ssim.get_time_trace()
+        voltage = ssim.get_voltage_trace(CellId("NodeA", 0))
+        ss_voltage = np.mean(voltage[(time < 50) & (time > 20)])
+        assert ss_voltage == pytest.approx(voltages["ss_voltage"][2])
+        ssim.delete()
+
+
 def test_singleton():
     """Make sure only 1 object gets created in a singleton."""
 
@@ -0,0 +1,103 @@
+#include <stdio.h>
+#include "hocdec.h"
+extern int nrnmpi_myid;
+extern int nrn_nobanner_;
+#if defined(__cplusplus)
+extern "C" {
+#endif
+
+extern void _Ca_reg(void);
+extern void _CaDynamics_DC0_reg(void);
+extern void _CaDynamics_E2_reg(void);
+extern void _Ca_HVA_reg(void);
+extern void _Ca_HVA2_reg(void);
+extern void _Ca_LVAst_reg(void);
+extern void _DetAMPANMDA_reg(void);
+extern void _DetGABAAB_reg(void);
+extern void _GluSynapse_reg(void);
+extern void _Ih_reg(void);
+extern void _Im_reg(void);
+extern void _K_Pst_reg(void);
+extern void _K_Tst_reg(void);
+extern void _KdShu2007_reg(void);
+extern void _NaTa_t_reg(void);
+extern void _NaTg_reg(void);
+extern void _NaTs2_t_reg(void);
+extern void _Nap_Et2_reg(void);
+extern void _ProbAMPANMDA_EMS_reg(void);
+extern void _ProbGABAAB_EMS_reg(void);
+extern void _SK_E2_reg(void);
+extern void _SKv3_1_reg(void);
+extern void _StochKv_reg(void);
+extern void _StochKv3_reg(void);
+extern void _TTXDynamicsSwitch_reg(void);
+extern void _VecStim_reg(void);
+extern void _gap_reg(void);
+extern void _netstim_inhpoisson_reg(void);
+
+void modl_reg() {
+  if (!nrn_nobanner_) if (nrnmpi_myid < 1) {
+    fprintf(stderr, "Additional mechanisms from files\n");
+    fprintf(stderr, " \"tests/mechanisms/Ca.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/CaDynamics_DC0.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/CaDynamics_E2.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/Ca_HVA.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/Ca_HVA2.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/Ca_LVAst.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/DetAMPANMDA.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/DetGABAAB.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/GluSynapse.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/Ih.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/Im.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/K_Pst.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/K_Tst.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/KdShu2007.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/NaTa_t.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/NaTg.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/NaTs2_t.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/Nap_Et2.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/ProbAMPANMDA_EMS.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/ProbGABAAB_EMS.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/SK_E2.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/SKv3_1.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/StochKv.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/StochKv3.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/TTXDynamicsSwitch.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/VecStim.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/gap.mod\"");
+    fprintf(stderr, " \"tests/mechanisms/netstim_inhpoisson.mod\"");
+    fprintf(stderr, "\n");
+  }
+  _Ca_reg();
+  _CaDynamics_DC0_reg();
+  _CaDynamics_E2_reg();
+  _Ca_HVA_reg();
+  _Ca_HVA2_reg();
+  _Ca_LVAst_reg();
+  _DetAMPANMDA_reg();
+  _DetGABAAB_reg();
+  _GluSynapse_reg();
+  _Ih_reg();
+  _Im_reg();
+  _K_Pst_reg();
+  _K_Tst_reg();
+  _KdShu2007_reg();
+  _NaTa_t_reg();
+  _NaTg_reg();
+  _NaTs2_t_reg();
+  _Nap_Et2_reg();
+  _ProbAMPANMDA_EMS_reg();
+  _ProbGABAAB_EMS_reg();
+  _SK_E2_reg();
+  _SKv3_1_reg();
+  _StochKv_reg();
+  _StochKv3_reg();
+  _TTXDynamicsSwitch_reg();
+  _VecStim_reg();
+  _gap_reg();
+  _netstim_inhpoisson_reg();
+}
+
+#if defined(__cplusplus)
+}
+#endif